@@ -236,25 +236,10 @@ class AIScheduler:
                    estimated_time: float = None, memory_req: float = 100.0):
         """Add process to scheduling queue with AI-based prioritization"""
         with self.scheduler_lock:
-            # Predict runtime and calculate intelligent priority
-            predicted_runtime = self.predictor.predict_runtime(process_type, estimated_time)
             system_load = sum(self.core_loads) / len(self.core_loads)
-            priority = self.predictor.calculate_priority_score(process_type, system_load)
-            
-            # Determine optimal power state
-            power_state = self.power_manager.get_optimal_power_state(process_type, system_load)
-            
-            process_info = {
-                "id": process_id,
-                "type": process_type,
-                "predicted_runtime": predicted_runtime,
-                "priority": priority,
-                "power_state": power_state,
-                "memory_req": memory_req,
-                "arrival_time": time.time(),
-                "start_time": None,
-                "actual_runtime": 0.0
-            }
+            process_info = self._build_process_info(process_id, process_type, estimated_time,
+                                                    memory_req, system_load)
+            priority = process_info["priority"]
             
             # Insert in priority order (higher priority first)
             inserted = False
@@ -269,6 +254,45 @@ class AIScheduler:
                 
             self.total_scheduled += 1
             
+    def add_processes(self, specs: List[Tuple]):
+        """Add a batch of (process_id, process_type[, estimated_time[, memory_req]]) specs at once"""
+        with self.scheduler_lock:
+            system_load = sum(self.core_loads) / len(self.core_loads)
+            batch = [self._build_process_info(*spec, system_load=system_load) for spec in specs]
+            if not batch:
+                return
+                
+            # A stable sort keeps ties in arrival order, matching add_process insertion
+            merged = list(self.ready_queue)
+            merged.extend(batch)
+            merged.sort(key=lambda p: p["priority"], reverse=True)
+            self.ready_queue.clear()
+            self.ready_queue.extend(merged)
+            self.total_scheduled += len(batch)
+            
+    def _build_process_info(self, process_id: str, process_type: ProcessType,
+                            estimated_time: float = None, memory_req: float = 100.0,
+                            system_load: float = 0.0) -> Dict:
+        """Build a ready-queue entry with predicted runtime, priority and power state"""
+        # Predict runtime and calculate intelligent priority
+        predicted_runtime = self.predictor.predict_runtime(process_type, estimated_time)
+        priority = self.predictor.calculate_priority_score(process_type, system_load)
+        
+        # Determine optimal power state
+        power_state = self.power_manager.get_optimal_power_state(process_type, system_load)
+        
+        return {
+            "id": process_id,
+            "type": process_type,
+            "predicted_runtime": predicted_runtime,
+            "priority": priority,
+            "power_state": power_state,
+            "memory_req": memory_req,
+            "arrival_time": time.time(),
+            "start_time": None,
+            "actual_runtime": 0.0
+        }
+        
     def schedule_next(self) -> Optional[Dict]:
         """Schedule next process using AI-optimized algorithm"""
         with self.scheduler_lock:
@@ -515,8 +539,10 @@ class AIScheduler:
             "performance_history": list(self.performance_scores)
         }
         
-        with open(filename, 'w') as f:
-            json.dump(learning_data, f, indent=2)
+        # Compact one-shot encoding stays on the C encoder (indent forces the pure-Python path)
+        payload = json.dumps(learning_data, separators=(",", ":")).encode()
+        with open(filename, 'wb') as f:
+            f.write(payload)
             
     def simulate_workload(self, duration: float = 30.0):
         """Simulate AI/blockchain workload for demonstration"""
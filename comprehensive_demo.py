@@ -4,8 +4,12 @@ Comprehensive Demo: Steps 1 & 2 Integration
 Demonstrates Process Management + Memory Management working together
 """
 
+import io
 import time
 import random
+import contextlib
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
 from integrated_process_manager import IntegratedProcessManager
 from process_control_block import ProcessType
 from schedulers import RoundRobinScheduler, PriorityScheduler, MLFQScheduler
@@ -55,20 +59,19 @@ def network_node_workload(connection_count: int):
     
     return f"Network node operational: {connection_count} connections active"
 
-def main():
-    """Main comprehensive demonstration"""
-    print("🚀 DECENTRALIZED AI NODE OPERATING SYSTEM")
-    print("📋 Comprehensive Demo: Process + Memory Management Integration")
-    print("=" * 80)
-    
-    # Initialize integrated system with different schedulers
-    schedulers = [
-        ("Round Robin", RoundRobinScheduler(time_quantum=500)),
-        ("Priority", PriorityScheduler(preemptive=True)),
-        ("MLFQ", MLFQScheduler(num_levels=3, time_quanta=[100, 200, 400]))
-    ]
+# Scheduler factories; each case builds its scheduler inside the worker process
+SCHEDULER_CASES = [
+    ("Round Robin", partial(RoundRobinScheduler, time_quantum=500)),
+    ("Priority", partial(PriorityScheduler, preemptive=True)),
+    ("MLFQ", partial(MLFQScheduler, num_levels=3, time_quanta=[100, 200, 400]))
+]
+
+def _run_scheduler_case(case) -> str:
+    """Run the workload suite under one scheduler and return its printed report"""
+    scheduler_name, make_scheduler = case
+    scheduler = make_scheduler()
     
-    for scheduler_name, scheduler in schedulers:
+    with contextlib.redirect_stdout(io.StringIO()) as report:
         print(f"\n🎯 Testing with {scheduler_name} Scheduler")
         print("-" * 50)
         
@@ -126,7 +129,7 @@ def main():
         created_processes = []
         for workload in workloads:
             print(f"\n📝 Creating process: {workload['name']}")
-            
+        
             pid = manager.create_process(
                 name=workload['name'],
                 process_type=workload['type'],
@@ -135,7 +138,7 @@ def main():
                 priority=workload['priority'],
                 memory_required=workload['memory']
             )
-            
+        
             if pid:
                 created_processes.append(pid)
                 process_info = manager.get_process_info(pid)
@@ -152,17 +155,17 @@ def main():
         start_time = time.time()
         while time.time() - start_time < 3.0:
             time.sleep(0.5)
-            
+        
             # Show system status
             system_info = manager.get_system_info()
             memory_stats = system_info['memory_statistics']
-            
+        
             print(f"   📊 Active Processes: {system_info['running_processes']}")
             print(f"   🔄 Context Switches: {system_info['context_switches']}")
             print(f"   💾 Memory Usage: {memory_stats['memory_usage_percent']:.1f}%")
             print(f"   📄 Page Faults: {memory_stats['page_faults']}")
             print(f"   💿 Swap Operations: {memory_stats['swap_outs']}↑ {memory_stats['swap_ins']}↓")
-            
+        
             # Test memory operations
             if created_processes:
                 test_pid = random.choice(created_processes)
@@ -182,9 +185,19 @@ def main():
         # Cleanup
         print(f"\n🧹 Cleaning up {scheduler_name} demo...")
         manager.shutdown()
-        
-        # Brief pause between scheduler demos
-        time.sleep(1)
+    
+    return report.getvalue()
+
+def main():
+    """Main comprehensive demonstration"""
+    print("🚀 DECENTRALIZED AI NODE OPERATING SYSTEM")
+    print("📋 Comprehensive Demo: Process + Memory Management Integration")
+    print("=" * 80)
+    
+    # Each case runs in its own process; reports are printed in case order
+    with ProcessPoolExecutor(max_workers=len(SCHEDULER_CASES)) as executor:
+        for report in executor.map(_run_scheduler_case, SCHEDULER_CASES):
+            print(report, end="")
     
     print("\n" + "=" * 80)
     print("🎊 COMPREHENSIVE DEMO COMPLETE!")
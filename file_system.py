@@ -574,6 +574,30 @@ class VirtualFileSystem:
                 
             return list(self.directories[normalized_path].values())
             
+    def walk(self, path: str = "/") -> Dict[str, List[DirectoryEntry]]:
+        """List a directory tree recursively in a single locked pass"""
+        
+        with self.fs_lock:
+            root = self._normalize_path(path)
+            
+            if root not in self.directories:
+                raise FileNotFoundError(f"Directory not found: {root}")
+                
+            listing = {}
+            pending = [root]
+            while pending:
+                current = pending.pop()
+                entries = list(self.directories[current].values())
+                listing[current] = entries
+                
+                for entry in entries:
+                    if entry.is_directory:
+                        child = self._normalize_path(f"{current}/{entry.name}")
+                        if child in self.directories:
+                            pending.append(child)
+                            
+            return listing
+            
     def get_file_info(self, path: str) -> FileMetadata:
         """Get file metadata"""
         
@@ -4,6 +4,8 @@ Real-time visualization and monitoring for the file system.
 """
 
 import os
+import mmap
+import struct
 import time
 import threading
 from typing import Dict, List, Optional, Tuple, Any
@@ -35,6 +37,75 @@ class FileSystemEvent:
     success: bool = True
     details: str = ""
 
+def _utf8_prefix(text: str, limit: int) -> bytes:
+    """UTF-8 bytes of text cut to at most limit bytes without splitting a character"""
+    return text.encode()[:limit].decode("utf-8", "ignore").encode()
+
+class EventTraceRing:
+    """
+    Memory-mapped flight recorder for file system events
+    Fixed-size ring of packed records that external tools can read while the demo runs;
+    the oldest records are overwritten once the ring is full.
+    """
+    
+    HEADER = struct.Struct("!QI")  # records written, capacity
+    RECORD = struct.Struct("!dI64s32sq?")  # timestamp, event type, path, user, size, success
+    EVENT_TYPES = ("create", "read", "write", "delete", "encrypt", "decrypt",
+                   "dir_cache_hit", "dir_cache_miss")
+    
+    def __init__(self, path: str, capacity: int = 4096):
+        self.path = path
+        self.capacity = capacity
+        self._type_ids = {event_type: i for i, event_type in enumerate(self.EVENT_TYPES)}
+        self._head = 0
+        self._lock = threading.Lock()
+        
+        size = self.HEADER.size + capacity * self.RECORD.size
+        self._file = open(path, "w+b")
+        self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+        self.HEADER.pack_into(self._map, 0, 0, capacity)
+        
+    def write(self, timestamp: float, event_type: str, file_path: str, user_id: str,
+              file_size: int = 0, success: bool = True):
+        """Pack one event into the slot at the ring head"""
+        type_id = self._type_ids.get(event_type, len(self.EVENT_TYPES))
+        with self._lock:
+            if self._map is None:
+                return
+            offset = self.HEADER.size + (self._head % self.capacity) * self.RECORD.size
+            self.RECORD.pack_into(self._map, offset, timestamp, type_id,
+                                  _utf8_prefix(file_path, 64), _utf8_prefix(user_id, 32),
+                                  file_size, success)
+            self._head += 1
+            self.HEADER.pack_into(self._map, 0, self._head, self.capacity)
+            
+    def close(self):
+        """Flush and release the mapping"""
+        with self._lock:
+            if self._map is None:
+                return
+            self._map.flush()
+            self._map.close()
+            self._map = None
+            self._file.close()
+        
+    @classmethod
+    def read(cls, path: str) -> List[Tuple[float, str, str, str, int, bool]]:
+        """Decode the records currently in a ring file, oldest first"""
+        with open(path, "rb") as f:
+            data = f.read()
+            
+        head, capacity = cls.HEADER.unpack_from(data, 0)
+        records = []
+        for index in range(max(0, head - capacity), head):
+            offset = cls.HEADER.size + (index % capacity) * cls.RECORD.size
+            timestamp, type_id, file_path, user_id, file_size, success = cls.RECORD.unpack_from(data, offset)
+            event_type = cls.EVENT_TYPES[type_id] if type_id < len(cls.EVENT_TYPES) else "unknown"
+            records.append((timestamp, event_type, file_path.rstrip(b"\0").decode(errors="replace"),
+                            user_id.rstrip(b"\0").decode(errors="replace"), file_size, success))
+        return records
+
 class FileSystemVisualizer:
     """
     Comprehensive file system visualizer
@@ -52,6 +123,10 @@ class FileSystemVisualizer:
         
         # Event tracking
         self.fs_events: deque = deque(maxlen=1000)
+        # Raw event tuples appended by producers, drained by the monitor thread
+        self.event_ring: deque = deque(maxlen=4096)
+        # Optional out-of-process trace of the same events
+        self.trace_ring: Optional[EventTraceRing] = None
         self.performance_history: deque = deque(maxlen=100)
         
         # Display settings
@@ -90,10 +165,59 @@ class FileSystemVisualizer:
         self.user_activity[event.user_id]["operations"] += 1
         self.user_activity[event.user_id]["data_transferred"] += event.file_size
         
+    def add_events(self, events: List[FileSystemEvent]):
+        """Add a batch of file system events for tracking"""
+        for event in events:
+            self.add_event(event)
+            
+    def record_event(self, timestamp: float, event_type: str, file_path: str,
+                     user_id: str, file_size: int = 0):
+        """Record a raw event tuple for later draining (cheap producer path)"""
+        self.event_ring.append((timestamp, event_type, file_path, user_id, file_size))
+        if self.trace_ring:
+            self.trace_ring.write(timestamp, event_type, file_path, user_id, file_size)
+        
+    def record_events(self, records: List[Tuple[float, str, str, str, int]]):
+        """Record a batch of raw event tuples in a single ring update"""
+        self.event_ring.extend(records)
+        if self.trace_ring:
+            for record in records:
+                self.trace_ring.write(*record)
+                
+    def enable_event_trace(self, path: str, capacity: int = 4096):
+        """Mirror recorded events into a memory-mapped ring file"""
+        self.disable_event_trace()
+        self.trace_ring = EventTraceRing(path, capacity)
+        
+    def disable_event_trace(self):
+        """Stop mirroring events and close the ring file"""
+        if self.trace_ring:
+            self.trace_ring.close()
+            self.trace_ring = None
+        
+    def drain_events(self):
+        """Convert queued raw events into tracked FileSystemEvents"""
+        ring = self.event_ring
+        events = []
+        while ring:
+            try:
+                timestamp, event_type, file_path, user_id, file_size = ring.popleft()
+            except IndexError:
+                break
+            events.append(FileSystemEvent(
+                timestamp=timestamp,
+                event_type=event_type,
+                file_path=file_path,
+                user_id=user_id,
+                file_size=file_size
+            ))
+        self.add_events(events)
+            
     def _monitoring_loop(self):
         """Main monitoring loop"""
         while self.running:
             try:
+                self.drain_events()
                 self._clear_screen()
                 self._update_performance_metrics()
                 
@@ -486,6 +610,7 @@ class FileSystemVisualizer:
         
     def export_analytics(self, filename: str):
         """Export file system analytics to JSON"""
+        self.drain_events()
         analytics_data = {
             "timestamp": time.time(),
             "file_system_stats": self.file_system.get_file_system_stats(),
@@ -31,6 +31,7 @@ class IntegratedProcessManager:
         # Process management
         self.scheduler = scheduler or RoundRobinScheduler()
         self.processes: Dict[int, ProcessControlBlock] = {}
+        self._termination_events: Dict[int, threading.Event] = {}
         self.next_pid = 1
         self.running_process: Optional[ProcessControlBlock] = None
         self.max_workers = max_workers
@@ -63,7 +64,8 @@ class IntegratedProcessManager:
     def create_process(self, name: str, process_type: ProcessType, 
                       target_function: Callable, args: tuple = (), 
                       priority: int = 0, memory_required: int = 1024*1024,
-                      memory_type: MemoryType = None, **kwargs) -> Optional[int]:
+                      memory_type: MemoryType = None,
+                      on_complete: Optional[Callable[[int], None]] = None, **kwargs) -> Optional[int]:
         """
         Create a new process with integrated memory management
         
@@ -75,6 +77,7 @@ class IntegratedProcessManager:
             priority: Process priority
             memory_required: Memory requirement in bytes
             memory_type: Type of memory to allocate
+            on_complete: Called with the PID once the process and its memory are cleaned up
             **kwargs: Additional process attributes
         
         Returns:
@@ -115,6 +118,7 @@ class IntegratedProcessManager:
             self.process_memory_allocations[pid] = [virtual_address]
             
             # Set additional attributes
+            pcb.on_complete = on_complete
             for key, value in kwargs.items():
                 setattr(pcb, key, value)
             
@@ -127,6 +131,7 @@ class IntegratedProcessManager:
             
             # Store process
             self.processes[pid] = pcb
+            self._termination_events[pid] = threading.Event()
             
             # Add to scheduler
             self.scheduler.add_process(pcb)
@@ -355,6 +360,18 @@ class IntegratedProcessManager:
             del self.processes[pid]
             
             logger.info(f"Cleaned up process {pid} ({pcb.name})")
+            
+            # Waiters learn the process is gone without polling
+            self._termination_events.pop(pid, threading.Event()).set()
+            if pcb.on_complete:
+                pcb.on_complete(pid)
+    
+    def wait_for_termination(self, pid: int, timeout: float = None) -> bool:
+        """Block until a process has been cleaned up; False on timeout"""
+        event = self._termination_events.get(pid)
+        if event is None:
+            return pid not in self.processes
+        return event.wait(timeout)
     
     def _generate_pid(self) -> int:
         """Generate next process ID"""
@@ -455,8 +472,7 @@ class IntegratedProcessManager:
             self.scheduler = new_scheduler
             
             # Add processes to new scheduler
-            for process in old_processes:
-                self.scheduler.add_process(process)
+            self.scheduler.add_processes(old_processes)
             
             logger.info(f"Changed scheduler to {new_scheduler.name}")
     
@@ -474,6 +490,17 @@ class IntegratedProcessManager:
         """Start real-time memory monitoring"""
         self.memory_visualizer.real_time_memory_monitor(refresh_interval)
     
+    def clear_processes(self):
+        """Terminate every process and return memory to a clean state"""
+        for pid in list(self.processes.keys()):
+            self.terminate_process(pid, force=True)
+        
+        with self.scheduler_lock:
+            self.running_process = None
+            self.process_memory_allocations.clear()
+            # PIDs keep counting so stale references never alias a new process
+            self.memory_manager.reset()
+    
     def shutdown(self):
         """Shutdown the integrated process and memory manager"""
         logger.info("Shutting down Integrated Process Manager...")
@@ -6,11 +6,15 @@ Implements paging, address translation, memory allocation, and AI-specific featu
 
 import time
 import math
+import threading
 import random
+import bisect
 from typing import Dict, List, Optional, Tuple, Set
 from enum import Enum
 from dataclasses import dataclass
 from collections import defaultdict
+from collections.abc import Mapping
+from array import array
 
 class MemoryType(Enum):
     """Types of memory for AI/Blockchain workloads"""
@@ -32,6 +36,30 @@ class PageState(Enum):
     DIRTY = "dirty"    # Modified, needs write-back
     SHARED = "shared"  # Shared between processes
 
+# Memory types as one-byte codes: position in MemoryType declaration order
+_MEMORY_TYPE_CODE = {memory_type: code for code, memory_type in enumerate(MemoryType)}
+
+# Page states as one-byte codes for the per-frame state array (FREE is code 0)
+_PAGE_STATES = tuple(PageState)
+_PAGE_STATE_CODE = {state: code for code, state in enumerate(_PAGE_STATES)}
+# Maps every state code to 0 for free frames and 1 otherwise, for run splitting
+_FREE_MASK = bytes(0 if state is PageState.FREE else 1 for state in _PAGE_STATES).ljust(256, b"\x01")
+
+# Access tick recorded for frames that can never be swap victims (free or pinned)
+_NO_SWAP_TICK = 2**63 - 1
+
+# Simulated access latency per memory type, in milliseconds
+_ACCESS_DELAY_MS = {
+    MemoryType.AI_MODEL: 0.1,      # Fastest access
+    MemoryType.AI_DATA: 0.2,
+    MemoryType.NETWORK_BUFFER: 0.3,
+    MemoryType.SYSTEM: 0.5,
+    MemoryType.USER: 1.0,
+    MemoryType.BLOCKCHAIN_LEDGER: 1.5,
+    MemoryType.BLOCKCHAIN_STATE: 2.0,
+    MemoryType.CACHE: 0.15
+}
+
 @dataclass
 class Page:
     """Physical page representation"""
@@ -48,67 +76,197 @@ class Page:
     def __post_init__(self):
         self.last_access_time = time.time()
 
-@dataclass
+# Page table entry flag bits, one byte per virtual page in PageTable.flags
+_PTE_MAPPED = 0x01
+_PTE_PRESENT = 0x02
+_PTE_READ_ONLY = 0x04
+_PTE_DIRTY = 0x08
+_PTE_ACCESSED = 0x10
+_PTE_USER = 0x20
+_PTE_CACHE_DISABLED = 0x40
+# Maps every flag byte to 1 when its mapped bit is set, for counting and finding mappings
+_PTE_MAPPED_BITS = bytes(flags & _PTE_MAPPED for flags in range(256))
+
+def _pte_flag(bit: int, doc: str) -> property:
+    """Boolean entry attribute backed by one bit of the table's flag byte"""
+    def get(entry: 'PageTableEntry') -> bool:
+        return bool(entry._table.flags[entry.virtual_page] & bit)
+    
+    def set(entry: 'PageTableEntry', value: bool):
+        flags = entry._table.flags
+        if value:
+            flags[entry.virtual_page] |= bit
+        else:
+            flags[entry.virtual_page] &= ~bit & 0xFF
+    
+    return property(get, set, doc=doc)
+
 class PageTableEntry:
-    """Page table entry for address translation"""
-    virtual_page: int
-    physical_page: Optional[int] = None
-    present: bool = False
-    read_only: bool = False
-    dirty: bool = False
-    accessed: bool = False
-    user_accessible: bool = True
-    cache_disabled: bool = False
+    """
+    Page table entry for address translation
+    A view of one virtual page's slot in its table's frame and flag arrays
+    """
+    
+    __slots__ = ('_table', 'virtual_page')
+    
+    def __init__(self, table: 'PageTable', virtual_page: int):
+        self._table = table
+        self.virtual_page = virtual_page
+    
+    present = _pte_flag(_PTE_PRESENT, "Page is resident in a physical frame")
+    read_only = _pte_flag(_PTE_READ_ONLY, "Writes are not allowed")
+    dirty = _pte_flag(_PTE_DIRTY, "Page was written since it was mapped")
+    accessed = _pte_flag(_PTE_ACCESSED, "Page was translated since it was mapped")
+    user_accessible = _pte_flag(_PTE_USER, "Page is reachable from user mode")
+    cache_disabled = _pte_flag(_PTE_CACHE_DISABLED, "Page bypasses the cache")
+    
+    @property
+    def physical_page(self) -> Optional[int]:
+        """Physical frame backing this page, or None"""
+        frame = self._table.frames[self.virtual_page]
+        return None if frame < 0 else frame
+    
+    @physical_page.setter
+    def physical_page(self, frame: Optional[int]):
+        self._table.frames[self.virtual_page] = -1 if frame is None else frame
     
     def get_physical_address(self, page_size: int, offset: int) -> Optional[int]:
         """Convert to physical address"""
         if not self.present or self.physical_page is None:
             return None
         return (self.physical_page * page_size) + offset
+    
+    def __repr__(self):
+        return (f"PageTableEntry(virtual_page={self.virtual_page}, physical_page={self.physical_page}, "
+                f"present={self.present}, read_only={self.read_only}, dirty={self.dirty})")
+
+class PageTableEntries(Mapping):
+    """Dict-like view of a page table's mapped virtual pages, in page order"""
+    
+    __slots__ = ('_table',)
+    
+    def __init__(self, table: 'PageTable'):
+        self._table = table
+    
+    def __len__(self) -> int:
+        return self._table.mapped_count
+    
+    def __contains__(self, virtual_page) -> bool:
+        flags = self._table.flags
+        return (isinstance(virtual_page, int) and 0 <= virtual_page < len(flags)
+                and bool(flags[virtual_page] & _PTE_MAPPED))
+    
+    def __getitem__(self, virtual_page: int) -> PageTableEntry:
+        if virtual_page not in self:
+            raise KeyError(virtual_page)
+        return PageTableEntry(self._table, virtual_page)
+    
+    def __delitem__(self, virtual_page: int):
+        if virtual_page not in self:
+            raise KeyError(virtual_page)
+        self._table.remove_mapping(virtual_page)
+    
+    def __iter__(self):
+        mapped = self._table.flags.translate(_PTE_MAPPED_BITS)
+        virtual_page = mapped.find(1)
+        while virtual_page != -1:
+            yield virtual_page
+            virtual_page = mapped.find(1, virtual_page + 1)
 
 class PageTable:
     """Page table for virtual to physical address translation"""
     
-    def __init__(self, process_id: int, page_size: int = 4096):
+    def __init__(self, process_id: int, page_size: int = 4096, initial_capacity: int = 16):
         self.process_id = process_id
         self.page_size = page_size
-        self.entries: Dict[int, PageTableEntry] = {}
+        # Indexed by virtual page: backing frame (-1 for none) and _PTE_* flag bits
+        self.frames = array('i', [-1]) * initial_capacity
+        self.flags = bytearray(initial_capacity)
+        self.mapped_count = 0
+        self.entries = PageTableEntries(self)
         self.creation_time = time.time()
+        # Power-of-two pages split addresses with a shift and mask instead of divmod
+        self.page_shift = page_size.bit_length() - 1 if page_size & (page_size - 1) == 0 else None
+        self.offset_mask = page_size - 1
+    
+    def _ensure_capacity(self, size: int):
+        """Grow the per-page arrays to hold at least size virtual pages, doubling"""
+        capacity = len(self.frames)
+        if size > capacity:
+            grow = max(size, capacity * 2) - capacity
+            self.frames.extend(array('i', [-1]) * grow)
+            self.flags.extend(bytes(grow))
         
     def add_mapping(self, virtual_page: int, physical_page: int, 
                    read_only: bool = False, user_accessible: bool = True):
         """Add virtual to physical page mapping"""
-        entry = PageTableEntry(
-            virtual_page=virtual_page,
-            physical_page=physical_page,
-            present=True,
-            read_only=read_only,
-            user_accessible=user_accessible
-        )
-        self.entries[virtual_page] = entry
+        self.add_mappings(virtual_page, [physical_page], read_only, user_accessible)
+        
+    def add_mappings(self, first_virtual_page: int, physical_pages: List[int],
+                     read_only: bool = False, user_accessible: bool = True):
+        """Map consecutive virtual pages onto the given physical pages in one update"""
+        end = first_virtual_page + len(physical_pages)
+        self._ensure_capacity(end)
+        flags = (_PTE_MAPPED | _PTE_PRESENT | (_PTE_READ_ONLY if read_only else 0)
+                 | (_PTE_USER if user_accessible else 0))
+        
+        self.mapped_count += len(physical_pages) - self.flags[first_virtual_page:end].translate(_PTE_MAPPED_BITS).count(1)
+        self.frames[first_virtual_page:end] = array('i', physical_pages)
+        self.flags[first_virtual_page:end] = bytes((flags,)) * len(physical_pages)
         
     def remove_mapping(self, virtual_page: int):
         """Remove page mapping"""
         if virtual_page in self.entries:
-            del self.entries[virtual_page]
+            self.frames[virtual_page] = -1
+            self.flags[virtual_page] = 0
+            self.mapped_count -= 1
+    
+    def highest_virtual_page(self) -> Optional[int]:
+        """Highest mapped virtual page, or None for an empty table"""
+        virtual_page = self.flags.translate(_PTE_MAPPED_BITS).rfind(1)
+        return None if virtual_page == -1 else virtual_page
+    
+    def virtual_page_of(self, physical_page: int) -> Optional[int]:
+        """Virtual page currently backed by a physical frame, or None"""
+        try:
+            return self.frames.index(physical_page)
+        except ValueError:
+            return None
+    
+    def _present_frame(self, virtual_page: int) -> int:
+        """Frame of a present page, marking it accessed; -1 on a page fault"""
+        if virtual_page >= len(self.frames):
+            return -1
+        frame = self.frames[virtual_page]
+        if frame < 0 or not self.flags[virtual_page] & _PTE_PRESENT:
+            return -1
+        
+        # Mark as accessed
+        self.flags[virtual_page] |= _PTE_ACCESSED
+        return frame
+    
+    def lookup(self, virtual_address: int) -> Optional[PageTableEntry]:
+        """Return the present entry mapping an address, or None on a page fault"""
+        if self.page_shift is not None:
+            virtual_page = virtual_address >> self.page_shift
+        else:
+            virtual_page = virtual_address // self.page_size
+        if self._present_frame(virtual_page) < 0:
+            return None
+        return PageTableEntry(self, virtual_page)
     
     def translate_address(self, virtual_address: int) -> Tuple[Optional[int], bool]:
         """Translate virtual address to physical address"""
-        virtual_page = virtual_address // self.page_size
-        offset = virtual_address % self.page_size
-        
-        if virtual_page not in self.entries:
-            return None, False  # Page fault
-        
-        entry = self.entries[virtual_page]
-        if not entry.present:
+        if self.page_shift is not None:
+            frame = self._present_frame(virtual_address >> self.page_shift)
+            if frame < 0:
+                return None, False  # Page fault
+            return (frame << self.page_shift) | (virtual_address & self.offset_mask), True
+        
+        frame = self._present_frame(virtual_address // self.page_size)
+        if frame < 0:
             return None, False  # Page fault
-        
-        # Mark as accessed
-        entry.accessed = True
-        
-        physical_address = entry.get_physical_address(self.page_size, offset)
-        return physical_address, True
+        return frame * self.page_size + virtual_address % self.page_size, True
 
 class MemoryPool:
     """Specialized memory pool for different memory types"""
@@ -129,6 +287,170 @@ class MemoryPool:
         speed_map = {1: 0.001, 2: 0.005, 3: 0.01}  # seconds
         return speed_map.get(self.performance_tier, 0.01)
 
+# Page counts that get their own free stack (1/2 pages for USER, 16 and 128 for AI/blockchain buffers)
+SLAB_SIZE_CLASSES = (1, 2, 16, 128)
+
+class FreePagePool:
+    """
+    Free physical pages as coalesced runs plus size-class slabs
+    Requests are carved from the lowest run that fits; allocations released whole are parked by page count
+    """
+    
+    def __init__(self, total_pages: int, size_classes: Tuple[int, ...] = SLAB_SIZE_CLASSES):
+        # Free runs sorted by start page: run_starts[i] begins a run of run_lengths[i] pages
+        self.run_starts: List[int] = [0] if total_pages else []
+        self.run_lengths: List[int] = [total_pages] if total_pages else []
+        self.slabs: Dict[int, List[List[int]]] = {n: [] for n in size_classes}
+        self.count = total_pages
+        # One byte per frame, 1 while free (runs and slabs alike), for O(1) membership
+        self.free_map = bytearray(b"\x01") * total_pages
+        
+    def __len__(self) -> int:
+        return self.count
+        
+    def __contains__(self, page_num: int) -> bool:
+        return 0 <= page_num < len(self.free_map) and self.free_map[page_num] == 1
+        
+    def __iter__(self):
+        """Free pages in ascending order, skipping used stretches with bytearray.find"""
+        free_map = self.free_map
+        page_num = free_map.find(1)
+        while page_num != -1:
+            end = free_map.find(0, page_num)
+            if end == -1:
+                end = len(free_map)
+            yield from range(page_num, end)
+            page_num = free_map.find(1, end)
+            
+    def _mark(self, pages: List[int], free: int):
+        """Flip pages in the free map, a whole slice at a time when they are contiguous"""
+        if not pages:
+            return
+        first = pages[0]
+        if pages[-1] - first == len(pages) - 1 and pages == list(range(first, first + len(pages))):
+            self.free_map[first:first + len(pages)] = bytes([free]) * len(pages)
+        else:
+            for page_num in pages:
+                self.free_map[page_num] = free
+                
+    def take(self, count: int) -> Optional[List[int]]:
+        """Pop count free pages, preferring a parked run, then one contiguous range"""
+        if count == 0:
+            return []
+        runs = self.slabs.get(count)
+        if runs:
+            self.count -= count
+            run = runs.pop()
+            self._mark(run, 0)
+            return run
+        if self.count < count:
+            return None
+        
+        # First fit: the lowest run long enough serves the whole request
+        for i, length in enumerate(self.run_lengths):
+            if length >= count:
+                start = self.run_starts[i]
+                if length == count:
+                    del self.run_starts[i], self.run_lengths[i]
+                else:
+                    self.run_starts[i] = start + count
+                    self.run_lengths[i] = length - count
+                self.count -= count
+                self.free_map[start:start + count] = bytes(count)
+                return list(range(start, start + count))
+                
+        # No single run is long enough: gather from the lowest runs up
+        self.merge_slabs()
+        taken: List[int] = []
+        while len(taken) < count:
+            start, length = self.run_starts[0], self.run_lengths[0]
+            use = min(length, count - len(taken))
+            taken.extend(range(start, start + use))
+            if use == length:
+                del self.run_starts[0], self.run_lengths[0]
+            else:
+                self.run_starts[0] = start + use
+                self.run_lengths[0] = length - use
+        self.count -= count
+        self._mark(taken, 0)
+        return taken
+        
+    def remove(self, page_num: int):
+        """Take one specific free page out of the general runs (slabs must be merged first)"""
+        i = bisect.bisect_right(self.run_starts, page_num) - 1
+        start, length = self.run_starts[i], self.run_lengths[i]
+        if length == 1:
+            del self.run_starts[i], self.run_lengths[i]
+        elif page_num == start:
+            self.run_starts[i] = start + 1
+            self.run_lengths[i] = length - 1
+        else:
+            self.run_lengths[i] = page_num - start
+            if page_num < start + length - 1:
+                self.run_starts.insert(i + 1, page_num + 1)
+                self.run_lengths.insert(i + 1, start + length - page_num - 1)
+        self.count -= 1
+        self.free_map[page_num] = 0
+        
+    def release(self, page_num: int):
+        """Return a single page, coalescing it with neighbouring runs"""
+        self._insert_run(page_num, 1)
+        self.count += 1
+        self.free_map[page_num] = 1
+        
+    def release_run(self, run: List[int]):
+        """Return a whole allocation, parking it in its size class when there is one"""
+        if not run:
+            return
+        runs = self.slabs.get(len(run))
+        if runs is not None:
+            runs.append(run)
+        else:
+            self._insert_pages(run)
+        self.count += len(run)
+        self._mark(run, 1)
+        
+    def merge_slabs(self):
+        """Fold parked runs back into the free runs"""
+        for runs in self.slabs.values():
+            for run in runs:
+                self._insert_pages(run)
+            runs.clear()
+            
+    def sort(self):
+        """Merge every parked run so free space is fully coalesced"""
+        self.merge_slabs()
+        
+    def _insert_pages(self, pages: List[int]):
+        """Insert pages as runs, one insertion per contiguous stretch"""
+        if not pages:
+            return
+        start = prev = pages[0]
+        for page_num in pages[1:]:
+            if page_num != prev + 1:
+                self._insert_run(start, prev - start + 1)
+                start = page_num
+            prev = page_num
+        self._insert_run(start, prev - start + 1)
+        
+    def _insert_run(self, start: int, length: int):
+        """Insert a free run, merging with the runs just before and after it"""
+        i = bisect.bisect_left(self.run_starts, start)
+        merge_prev = i > 0 and self.run_starts[i - 1] + self.run_lengths[i - 1] == start
+        merge_next = i < len(self.run_starts) and start + length == self.run_starts[i]
+        
+        if merge_prev and merge_next:
+            self.run_lengths[i - 1] += length + self.run_lengths[i]
+            del self.run_starts[i], self.run_lengths[i]
+        elif merge_prev:
+            self.run_lengths[i - 1] += length
+        elif merge_next:
+            self.run_starts[i] = start
+            self.run_lengths[i] += length
+        else:
+            self.run_starts.insert(i, start)
+            self.run_lengths.insert(i, length)
+
 class MemoryManager:
     """Comprehensive Memory Management System"""
     
@@ -137,40 +459,66 @@ class MemoryManager:
         self.page_size = page_size
         self.total_pages = total_memory // page_size
         
-        # Physical memory management
-        self.physical_pages: Dict[int, Page] = {}
-        self.free_pages: List[int] = list(range(self.total_pages))
-        self.allocated_pages: Set[int] = set()
-        
-        # Page tables for each process
-        self.page_tables: Dict[int, PageTable] = {}
-        
-        # Memory pools for different types
-        self.memory_pools = self._initialize_memory_pools()
-        
         # Swapping and virtual memory
         self.swap_space_size = total_memory // 2  # 50% of physical memory
-        self.swap_space: Dict[int, bytes] = {}  # Simulated swap space
-        self.swapped_pages: Dict[int, int] = {}  # page_num -> swap_slot
-        
-        # Memory allocation tracking
-        self.allocation_history: List[Dict] = []
-        self.fragmentation_level = 0.0
-        
-        # Performance metrics
-        self.page_faults = 0
-        self.swap_ins = 0
-        self.swap_outs = 0
-        self.memory_accesses = 0
-        self.cache_hits = 0
-        self.cache_misses = 0
         
         # AI-specific constraints
         self.ai_memory_limit = total_memory * 0.6  # 60% for AI workloads
         self.blockchain_memory_limit = total_memory * 0.3  # 30% for blockchain
         self.system_memory_limit = total_memory * 0.1  # 10% for system
         
-        self.start_time = time.time()
+        # Guards all bookkeeping; reentrant since public calls nest (allocate -> create_page_table)
+        self.memory_lock = threading.RLock()
+        
+        self.reset()
+    
+    def reset(self):
+        """Return to the freshly constructed state: all frames free, no page tables, zeroed metrics"""
+        with self.memory_lock:
+            # Physical memory management
+            self.physical_pages: Dict[int, Page] = {}
+            self.free_pages = FreePagePool(self.total_pages)
+            self.allocated_pages: Set[int] = set()
+            # Per-frame state code and owning process (-1 when free), indexed by frame number
+            self.page_state = bytearray(self.total_pages)
+            self.page_owner = array('i', [-1]) * self.total_pages
+            # MemoryType code of each allocated frame (meaningless while the frame is free)
+            self.page_type = bytearray(self.total_pages)
+            # Last access tick of each swappable frame (_NO_SWAP_TICK otherwise), for LRU victims
+            self.page_last_access = array('q', [_NO_SWAP_TICK]) * self.total_pages
+            self.access_tick = 0
+            # Allocated frames per MemoryType code, kept in step with claims and frees
+            self.type_page_counts = [0] * len(_MEMORY_TYPE_CODE)
+            self._fragmentation_dirty = True
+            # Layout part of get_memory_statistics, rebuilt only after frames change hands
+            self._layout_stats: Dict = {}
+            self._stats_dirty = True
+            # Physical runs handed out by allocate_memory, per process, for whole-run release
+            self.process_runs: Dict[int, List[List[int]]] = defaultdict(list)
+            
+            # Page tables for each process
+            self.page_tables: Dict[int, PageTable] = {}
+            
+            # Memory pools for different types
+            self.memory_pools = self._initialize_memory_pools()
+            
+            # Swapping and virtual memory
+            self.swap_space: Dict[int, bytes] = {}  # Simulated swap space
+            self.swapped_pages: Dict[int, int] = {}  # page_num -> swap_slot
+            
+            # Memory allocation tracking
+            self.allocation_history: List[Dict] = []
+            self.fragmentation_level = 0.0
+            
+            # Performance metrics
+            self.page_faults = 0
+            self.swap_ins = 0
+            self.swap_outs = 0
+            self.memory_accesses = 0
+            self.cache_hits = 0
+            self.cache_misses = 0
+            
+            self.start_time = time.time()
     
     def _initialize_memory_pools(self) -> Dict[str, MemoryPool]:
         """Initialize specialized memory pools"""
@@ -216,111 +564,115 @@ class MemoryManager:
     
     def create_page_table(self, process_id: int) -> PageTable:
         """Create page table for a process"""
-        page_table = PageTable(process_id, self.page_size)
-        self.page_tables[process_id] = page_table
-        return page_table
+        with self.memory_lock:
+            page_table = PageTable(process_id, self.page_size)
+            self.page_tables[process_id] = page_table
+            return page_table
     
     def allocate_memory(self, process_id: int, size: int, 
                        memory_type: MemoryType = MemoryType.USER,
                        read_only: bool = False) -> Optional[int]:
         """Allocate memory for a process"""
-        pages_needed = math.ceil(size / self.page_size)
-        
-        # Check memory type constraints
-        if not self._check_memory_constraints(memory_type, size):
-            return None
-        
-        # Get page table
-        if process_id not in self.page_tables:
-            self.create_page_table(process_id)
-        
-        page_table = self.page_tables[process_id]
-        
-        # Allocate physical pages
-        allocated_pages = []
-        virtual_base = self._get_next_virtual_address(page_table)
-        
-        for i in range(pages_needed):
-            physical_page = self._allocate_physical_page(process_id, memory_type)
-            if physical_page is None:
-                # Try swapping to make room
-                if self._try_swap_out():
-                    physical_page = self._allocate_physical_page(process_id, memory_type)
-                
-                if physical_page is None:
-                    # Cleanup allocated pages and fail
-                    for page_num in allocated_pages:
-                        self._free_physical_page(page_num)
+        with self.memory_lock:
+            pages_needed = math.ceil(size / self.page_size)
+            
+            # Check memory type constraints
+            if not self._check_memory_constraints(memory_type, size):
+                return None
+            
+            # Get page table
+            if process_id not in self.page_tables:
+                self.create_page_table(process_id)
+            
+            page_table = self.page_tables[process_id]
+            
+            # Swap out until the whole request fits, then take its pages in one go
+            while len(self.free_pages) < pages_needed:
+                if not self._try_swap_out():
                     return None
+            allocated_pages = self.free_pages.take(pages_needed)
             
-            allocated_pages.append(physical_page)
-            virtual_page = (virtual_base // self.page_size) + i
-            page_table.add_mapping(virtual_page, physical_page, read_only)
-        
-        # Record allocation
-        self._record_allocation(process_id, virtual_base, size, memory_type, allocated_pages)
-        
-        return virtual_base
+            virtual_base = self._get_next_virtual_address(page_table)
+            base_page = virtual_base // self.page_size
+            for physical_page in allocated_pages:
+                self._claim_physical_page(physical_page, process_id, memory_type)
+            page_table.add_mappings(base_page, allocated_pages, read_only)
+            if allocated_pages:
+                self.process_runs[process_id].append(allocated_pages)
+            
+            # Record allocation
+            self._record_allocation(process_id, virtual_base, size, memory_type, allocated_pages)
+            
+            return virtual_base
     
     def deallocate_memory(self, process_id: int, virtual_address: int):
         """Deallocate memory for a process"""
-        if process_id not in self.page_tables:
-            return False
-        
-        page_table = self.page_tables[process_id]
-        virtual_page = virtual_address // self.page_size
-        
-        if virtual_page not in page_table.entries:
-            return False
-        
-        entry = page_table.entries[virtual_page]
-        if entry.physical_page is not None:
-            self._free_physical_page(entry.physical_page)
-        
-        page_table.remove_mapping(virtual_page)
-        return True
+        with self.memory_lock:
+            if process_id not in self.page_tables:
+                return False
+            
+            page_table = self.page_tables[process_id]
+            virtual_page = virtual_address // self.page_size
+            
+            if virtual_page not in page_table.entries:
+                return False
+            
+            entry = page_table.entries[virtual_page]
+            if entry.physical_page is not None:
+                self._free_physical_page(entry.physical_page)
+            
+            page_table.remove_mapping(virtual_page)
+            return True
     
     def access_memory(self, process_id: int, virtual_address: int, 
                      write: bool = False) -> Tuple[bool, Optional[bytes]]:
         """Access memory at virtual address"""
-        self.memory_accesses += 1
-        
-        if process_id not in self.page_tables:
-            return False, None
-        
-        page_table = self.page_tables[process_id]
-        physical_address, success = page_table.translate_address(virtual_address)
-        
-        if not success:
-            # Page fault - try to handle it
-            return self._handle_page_fault(process_id, virtual_address, write)
-        
-        # Simulate memory access time based on memory type
-        virtual_page = virtual_address // self.page_size
-        if virtual_page in page_table.entries:
-            entry = page_table.entries[virtual_page]
-            if entry.physical_page in self.physical_pages:
-                page = self.physical_pages[entry.physical_page]
-                access_delay = self._get_memory_access_delay(page.memory_type)
-                time.sleep(access_delay / 1000)  # Convert to seconds
-                
-                # Update access information
-                page.last_access_time = time.time()
-                entry.accessed = True
-                
-                if write and not entry.read_only:
-                    entry.dirty = True
-                    page.dirty = True
-        
+        with self.memory_lock:
+            self.memory_accesses += 1
+            
+            page_table = self.page_tables.get(process_id)
+            if page_table is None:
+                return False, None
+            
+            # One lookup resolves the entry for both translation and bookkeeping
+            entry = page_table.lookup(virtual_address)
+            if entry is None:
+                # Page fault - try to handle it
+                return self._handle_page_fault(process_id, virtual_address, write)
+            
+            page = self.physical_pages.get(entry.physical_page)
+            if page is None:
+                return True, b"simulated_data"
+            
+            # Update access information
+            page.last_access_time = time.time()
+            if not page.pinned:
+                self.access_tick += 1
+                self.page_last_access[entry.physical_page] = self.access_tick
+            
+            if write and not entry.read_only:
+                entry.dirty = True
+                page.dirty = True
+            delay = _ACCESS_DELAY_MS.get(page.memory_type, 1.0)
+        
+        # Simulate memory access time based on memory type, outside the lock
+        # so concurrent accesses overlap
+        time.sleep(delay / 1000)  # Convert to seconds
         return True, b"simulated_data"
     
     def _allocate_physical_page(self, process_id: int, 
                                memory_type: MemoryType) -> Optional[int]:
         """Allocate a physical page"""
-        if not self.free_pages:
+        taken = self.free_pages.take(1)
+        if taken is None:
             return None
         
-        page_num = self.free_pages.pop(0)
+        page_num = taken[0]
+        self._claim_physical_page(page_num, process_id, memory_type)
+        return page_num
+    
+    def _claim_physical_page(self, page_num: int, process_id: int, memory_type: MemoryType):
+        """Create the page record for a frame just taken from the free pool"""
         page = Page(
             page_number=page_num,
             physical_address=page_num * self.page_size,
@@ -336,17 +688,34 @@ class MemoryManager:
         
         self.physical_pages[page_num] = page
         self.allocated_pages.add(page_num)
-        
-        return page_num
+        self.page_state[page_num] = _PAGE_STATE_CODE[page.state]
+        self.page_owner[page_num] = process_id
+        type_code = _MEMORY_TYPE_CODE[memory_type]
+        self.page_type[page_num] = type_code
+        self.type_page_counts[type_code] += 1
+        if not page.pinned:
+            self.access_tick += 1
+            self.page_last_access[page_num] = self.access_tick
+        self._fragmentation_dirty = True
+        self._stats_dirty = True
+    
+    def _mark_page_free(self, page_num: int):
+        """Record a frame as free in the per-frame arrays"""
+        self.type_page_counts[self.page_type[page_num]] -= 1
+        self.page_state[page_num] = 0
+        self.page_owner[page_num] = -1
+        self.page_last_access[page_num] = _NO_SWAP_TICK
+        self._fragmentation_dirty = True
+        self._stats_dirty = True
     
     def _free_physical_page(self, page_num: int):
         """Free a physical page"""
-        if page_num in self.physical_pages:
-            del self.physical_pages[page_num]
+        # Only allocated frames go back to the pool, so repeated frees are harmless
         if page_num in self.allocated_pages:
             self.allocated_pages.remove(page_num)
-        if page_num not in self.free_pages:
-            self.free_pages.append(page_num)
+            self.physical_pages.pop(page_num, None)
+            self._mark_page_free(page_num)
+            self.free_pages.release(page_num)
     
     def _handle_page_fault(self, process_id: int, virtual_address: int, 
                           write: bool) -> Tuple[bool, Optional[bytes]]:
@@ -412,20 +781,12 @@ class MemoryManager:
     
     def _find_swap_candidate(self) -> Optional[int]:
         """Find best page to swap out using LRU"""
-        candidates = []
-        
-        for page_num, page in self.physical_pages.items():
-            if page.pinned or page.state == PageState.PINNED:
-                continue  # Cannot swap pinned pages
-            
-            candidates.append((page.last_access_time, page_num))
-        
-        if not candidates:
+        # Free and pinned frames hold _NO_SWAP_TICK, so the oldest tick is the
+        # least recently used swappable frame; both scans run in C
+        oldest = min(self.page_last_access)
+        if oldest == _NO_SWAP_TICK:
             return None
-        
-        # Sort by last access time (LRU)
-        candidates.sort()
-        return candidates[0][1]
+        return self.page_last_access.index(oldest)
     
     def _swap_out_page(self, page_num: int) -> bool:
         """Swap out a specific page"""
@@ -441,11 +802,7 @@ class MemoryManager:
         # Find virtual page number
         virtual_page = None
         if page.process_id in self.page_tables:
-            page_table = self.page_tables[page.process_id]
-            for vp, entry in page_table.entries.items():
-                if entry.physical_page == page_num:
-                    virtual_page = vp
-                    break
+            virtual_page = self.page_tables[page.process_id].virtual_page_of(page_num)
         
         if virtual_page is None:
             return False
@@ -487,32 +844,18 @@ class MemoryManager:
     
     def _get_memory_usage_by_type(self, memory_type: MemoryType) -> int:
         """Get current memory usage for a specific type"""
-        usage = 0
-        for page in self.physical_pages.values():
-            if page.memory_type == memory_type:
-                usage += self.page_size
-        return usage
+        return self.type_page_counts[_MEMORY_TYPE_CODE[memory_type]] * self.page_size
     
     def _get_memory_access_delay(self, memory_type: MemoryType) -> float:
         """Get memory access delay in milliseconds"""
-        delays = {
-            MemoryType.AI_MODEL: 0.1,      # Fastest access
-            MemoryType.AI_DATA: 0.2,
-            MemoryType.NETWORK_BUFFER: 0.3,
-            MemoryType.SYSTEM: 0.5,
-            MemoryType.USER: 1.0,
-            MemoryType.BLOCKCHAIN_LEDGER: 1.5,
-            MemoryType.BLOCKCHAIN_STATE: 2.0,
-            MemoryType.CACHE: 0.15
-        }
-        return delays.get(memory_type, 1.0)
+        return _ACCESS_DELAY_MS.get(memory_type, 1.0)
     
     def _get_next_virtual_address(self, page_table: PageTable) -> int:
         """Get next available virtual address"""
-        if not page_table.entries:
+        max_page = page_table.highest_virtual_page()
+        if max_page is None:
             return 0x1000  # Start at 4KB
         
-        max_page = max(page_table.entries.keys())
         return (max_page + 1) * self.page_size
     
     def _record_allocation(self, process_id: int, virtual_address: int, size: int,
@@ -535,114 +878,186 @@ class MemoryManager:
     
     def calculate_fragmentation(self) -> float:
         """Calculate memory fragmentation level"""
-        if not self.free_pages:
-            return 0.0
-        
-        # External fragmentation - measure largest contiguous block
-        free_pages_sorted = sorted(self.free_pages)
-        largest_block = 1
-        current_block = 1
-        
-        for i in range(1, len(free_pages_sorted)):
-            if free_pages_sorted[i] == free_pages_sorted[i-1] + 1:
-                current_block += 1
-                largest_block = max(largest_block, current_block)
+        with self.memory_lock:
+            if not self._fragmentation_dirty:
+                return self.fragmentation_level
+            
+            total_free = len(self.free_pages)
+            if total_free == 0:
+                fragmentation = 0.0
             else:
-                current_block = 1
-        
-        total_free = len(self.free_pages)
-        if total_free == 0:
-            return 0.0
-        
-        fragmentation = 1.0 - (largest_block / total_free)
-        self.fragmentation_level = fragmentation
-        return fragmentation
+                # External fragmentation - largest run of free frames, found by splitting
+                # the free/used mask on used frames (all at C level)
+                mask = self.page_state.translate(_FREE_MASK)
+                largest_block = max(map(len, mask.split(b"\x01")))
+                fragmentation = 1.0 - (largest_block / total_free)
+            
+            self.fragmentation_level = fragmentation
+            self._fragmentation_dirty = False
+            return fragmentation
     
     def defragment_memory(self) -> int:
         """Defragment memory by compacting allocated pages"""
-        # This is a simplified defragmentation simulation
-        old_fragmentation = self.calculate_fragmentation()
-        
-        # Simulate defragmentation by sorting free pages
-        self.free_pages.sort()
-        
-        new_fragmentation = self.calculate_fragmentation()
-        pages_moved = int((old_fragmentation - new_fragmentation) * 100)
-        
-        return max(0, pages_moved)
+        with self.memory_lock:
+            self.free_pages.merge_slabs()
+            
+            # Mapped frames and where each sits in its allocation run, so moves can be patched in place
+            entry_of = {
+                entry.physical_page: entry
+                for page_table in self.page_tables.values()
+                for entry in page_table.entries.values()
+                if entry.present and entry.physical_page is not None
+            }
+            # Runs that lost a page are freed page by page anyway; dropping them keeps a
+            # moved frame from landing in a stale slot of a run that still names it
+            for process_id, runs in self.process_runs.items():
+                runs[:] = [run for run in runs
+                           if all(self.page_owner[page_num] == process_id for page_num in run)]
+            run_slot = {
+                page_num: (run, index)
+                for runs in self.process_runs.values()
+                for run in runs
+                for index, page_num in enumerate(run)
+            }
+            
+            # Two pointers: the lowest free frame receives the highest movable used frame.
+            # Both scans run in C over the state bytes; used frames are never revisited
+            # because the high pointer only moves down and stops at the low one.
+            used_mask = self.page_state.translate(_FREE_MASK)
+            pinned_code = _PAGE_STATE_CODE[PageState.PINNED]
+            low = self.page_state.find(0)
+            high = used_mask.rfind(1)
+            pages_moved = 0
+            
+            while low != -1 and high > low:
+                entry = entry_of.get(high)
+                if entry is not None and self.page_state[high] != pinned_code:
+                    self._move_page(high, low, entry, run_slot.get(high))
+                    pages_moved += 1
+                    low = self.page_state.find(0, low + 1)
+                high = used_mask.rfind(1, 0, high)
+            
+            return pages_moved
+    
+    def _move_page(self, src: int, dst: int, entry: PageTableEntry,
+                   slot: Optional[Tuple[List[int], int]]):
+        """Relocate one allocated frame to a free frame and repoint everything that names it"""
+        page = self.physical_pages.pop(src)
+        page.page_number = dst
+        page.physical_address = dst * self.page_size
+        self.physical_pages[dst] = page
+        
+        self.allocated_pages.remove(src)
+        self.allocated_pages.add(dst)
+        self.free_pages.remove(dst)
+        self.page_state[dst] = self.page_state[src]
+        self.page_owner[dst] = self.page_owner[src]
+        self.page_type[dst] = self.page_type[src]
+        self.page_last_access[dst] = self.page_last_access[src]
+        self.page_state[src] = 0
+        self.page_owner[src] = -1
+        self.page_last_access[src] = _NO_SWAP_TICK
+        self.free_pages.release(src)
+        self._fragmentation_dirty = True
+        self._stats_dirty = True
+        
+        entry.physical_page = dst
+        if slot is not None:
+            run, index = slot
+            run[index] = dst
     
     def get_memory_statistics(self) -> Dict:
         """Get comprehensive memory statistics"""
-        total_allocated = len(self.allocated_pages) * self.page_size
-        total_free = len(self.free_pages) * self.page_size
-        fragmentation = self.calculate_fragmentation()
-        
-        # Calculate usage by type
-        usage_by_type = {}
-        for memory_type in MemoryType:
-            usage_by_type[memory_type.value] = self._get_memory_usage_by_type(memory_type)
-        
-        # Performance metrics
-        uptime = time.time() - self.start_time
-        page_fault_rate = self.page_faults / max(self.memory_accesses, 1)
-        
-        return {
-            'total_memory': self.total_memory,
-            'total_allocated': total_allocated,
-            'total_free': total_free,
-            'memory_usage_percent': (total_allocated / self.total_memory) * 100,
-            'fragmentation_percent': fragmentation * 100,
-            'page_faults': self.page_faults,
-            'page_fault_rate': page_fault_rate,
-            'swap_ins': self.swap_ins,
-            'swap_outs': self.swap_outs,
-            'memory_accesses': self.memory_accesses,
-            'active_page_tables': len(self.page_tables),
-            'swap_space_used': len(self.swap_space),
-            'usage_by_type': usage_by_type,
-            'memory_pools': {
-                name: {
-                    'size': pool.size,
-                    'allocated_pages': len(pool.allocated_pages),
-                    'access_count': pool.access_count,
-                    'performance_tier': pool.performance_tier
+        with self.memory_lock:
+            # Layout figures only move when frames change hands; counters below are always live
+            if self._stats_dirty:
+                total_allocated = len(self.allocated_pages) * self.page_size
+                self._layout_stats = {
+                    'total_allocated': total_allocated,
+                    'total_free': len(self.free_pages) * self.page_size,
+                    'memory_usage_percent': (total_allocated / self.total_memory) * 100,
+                    'fragmentation_percent': self.calculate_fragmentation() * 100,
+                    'usage_by_type': {
+                        memory_type.value: self._get_memory_usage_by_type(memory_type)
+                        for memory_type in MemoryType
+                    }
                 }
-                for name, pool in self.memory_pools.items()
-            },
-            'uptime': uptime
-        }
+                self._stats_dirty = False
+            layout = self._layout_stats
+            
+            # Performance metrics
+            uptime = time.time() - self.start_time
+            page_fault_rate = self.page_faults / max(self.memory_accesses, 1)
+            
+            return {
+                'total_memory': self.total_memory,
+                'total_allocated': layout['total_allocated'],
+                'total_free': layout['total_free'],
+                'memory_usage_percent': layout['memory_usage_percent'],
+                'fragmentation_percent': layout['fragmentation_percent'],
+                'page_faults': self.page_faults,
+                'page_fault_rate': page_fault_rate,
+                'swap_ins': self.swap_ins,
+                'swap_outs': self.swap_outs,
+                'memory_accesses': self.memory_accesses,
+                'active_page_tables': len(self.page_tables),
+                'swap_space_used': len(self.swap_space),
+                'usage_by_type': dict(layout['usage_by_type']),
+                'memory_pools': {
+                    name: {
+                        'size': pool.size,
+                        'allocated_pages': len(pool.allocated_pages),
+                        'access_count': pool.access_count,
+                        'performance_tier': pool.performance_tier
+                    }
+                    for name, pool in self.memory_pools.items()
+                },
+                'uptime': uptime
+            }
     
     def cleanup_process_memory(self, process_id: int):
         """Clean up all memory for a process"""
-        if process_id not in self.page_tables:
-            return
-        
-        page_table = self.page_tables[process_id]
-        
-        # Free all allocated pages
-        for virtual_page, entry in page_table.entries.items():
-            if entry.physical_page is not None:
-                self._free_physical_page(entry.physical_page)
-        
-        # Remove page table
-        del self.page_tables[process_id]
+        with self.memory_lock:
+            if process_id not in self.page_tables:
+                return
+            
+            page_table = self.page_tables[process_id]
+            
+            # Allocations still wholly owned go back to their size-class slab in one push
+            for run in self.process_runs.pop(process_id, ()):
+                if all(page_num in self.allocated_pages and
+                       self.physical_pages[page_num].process_id == process_id for page_num in run):
+                    for page_num in run:
+                        self.allocated_pages.remove(page_num)
+                        del self.physical_pages[page_num]
+                        self._mark_page_free(page_num)
+                    self.free_pages.release_run(run)
+            
+            # Pages faulted in, swapped back in or left from a partial run are freed one by one
+            for virtual_page, entry in page_table.entries.items():
+                if entry.physical_page is not None:
+                    self._free_physical_page(entry.physical_page)
+            
+            # Remove page table
+            del self.page_tables[process_id]
     
     def get_process_memory_info(self, process_id: int) -> Dict:
         """Get memory information for a specific process"""
-        if process_id not in self.page_tables:
-            return {}
-        
-        page_table = self.page_tables[process_id]
-        total_pages = len(page_table.entries)
-        present_pages = sum(1 for entry in page_table.entries.values() if entry.present)
-        swapped_pages = total_pages - present_pages
-        
-        return {
-            'process_id': process_id,
-            'total_virtual_pages': total_pages,
-            'present_pages': present_pages,
-            'swapped_pages': swapped_pages,
-            'virtual_memory_size': total_pages * self.page_size,
-            'physical_memory_size': present_pages * self.page_size,
-            'page_table_created': page_table.creation_time
-        } 
\ No newline at end of file
+        with self.memory_lock:
+            if process_id not in self.page_tables:
+                return {}
+            
+            page_table = self.page_tables[process_id]
+            total_pages = len(page_table.entries)
+            present_pages = sum(1 for entry in page_table.entries.values() if entry.present)
+            swapped_pages = total_pages - present_pages
+            
+            return {
+                'process_id': process_id,
+                'total_virtual_pages': total_pages,
+                'present_pages': present_pages,
+                'swapped_pages': swapped_pages,
+                'virtual_memory_size': total_pages * self.page_size,
+                'physical_memory_size': present_pages * self.page_size,
+                'page_table_created': page_table.creation_time
+            } 
\ No newline at end of file
@@ -6,8 +6,11 @@ Provides comprehensive visualization of memory usage, page tables, and fragmenta
 
 import time
 import os
+import sys
 import json
-from typing import Dict, List, Any, Tuple
+import base64
+import itertools
+from typing import Dict, List, Any, Tuple, Union, TextIO
 from datetime import datetime
 from collections import defaultdict
 from memory_manager import MemoryManager, MemoryType, PageState
@@ -18,27 +21,29 @@ class MemoryVisualizer:
     def __init__(self, memory_manager: MemoryManager):
         self.memory_manager = memory_manager
         
-        # Memory type colors and icons
-        self.memory_type_icons = {
-            MemoryType.SYSTEM: '⚙️',
-            MemoryType.USER: '👤',
-            MemoryType.AI_MODEL: '🧠',
-            MemoryType.AI_DATA: '📊',
-            MemoryType.BLOCKCHAIN_LEDGER: '⛓️',
-            MemoryType.BLOCKCHAIN_STATE: '🔗',
-            MemoryType.NETWORK_BUFFER: '🌐',
-            MemoryType.CACHE: '💾'
-        }
-        
-        # Page state indicators
-        self.page_state_icons = {
-            PageState.FREE: '⬜',
-            PageState.ALLOCATED: '🟩',
-            PageState.SWAPPED: '🟨',
-            PageState.PINNED: '🟥',
-            PageState.DIRTY: '🟧',
-            PageState.SHARED: '🟦'
-        }
+        # Memory type colors and icons, indexed by position in MemoryType
+        # (the same codes the manager keeps per frame in page_type)
+        self.memory_type_icons = (
+            '⚙️',  # SYSTEM
+            '👤',  # USER
+            '🧠',  # AI_MODEL
+            '📊',  # AI_DATA
+            '⛓️',  # BLOCKCHAIN_LEDGER
+            '🔗',  # BLOCKCHAIN_STATE
+            '🌐',  # NETWORK_BUFFER
+            '💾'   # CACHE
+        )
+        self._memory_type_index = {memory_type: i for i, memory_type in enumerate(MemoryType)}
+        
+        # Page state indicators, indexed by position in PageState
+        self.page_state_icons = (
+            '⬜',  # FREE
+            '🟩',  # ALLOCATED
+            '🟨',  # SWAPPED
+            '🟥',  # PINNED
+            '🟧',  # DIRTY
+            '🟦'   # SHARED
+        )
         
         # Performance indicators
         self.performance_icons = {
@@ -82,16 +87,15 @@ class MemoryVisualizer:
         pages_per_line = scale
         lines = (total_pages + pages_per_line - 1) // pages_per_line
         
-        # Create memory map
-        memory_map = []
-        for i in range(total_pages):
-            if i in self.memory_manager.physical_pages:
-                page = self.memory_manager.physical_pages[i]
-                icon = self.memory_type_icons.get(page.memory_type, '❓')
-                state_icon = self.page_state_icons.get(page.state, '❓')
-                memory_map.append(f"{icon}")
-            else:
-                memory_map.append("⬜")  # Free page
+        # Create memory map for the lines shown, straight from the per-frame arrays
+        shown_pages = min(total_pages, 20 * pages_per_line)
+        page_state = self.memory_manager.page_state
+        page_type = self.memory_manager.page_type
+        icons = self.memory_type_icons
+        memory_map = [
+            icons[page_type[i]] if page_state[i] else "⬜"  # State code 0 is a free page
+            for i in range(shown_pages)
+        ]
         
         # Display memory map
         for line in range(min(lines, 20)):  # Limit to 20 lines for readability
@@ -141,7 +145,7 @@ class MemoryVisualizer:
             else:
                 status = self.performance_icons['critical']
             
-            type_icon = self.memory_type_icons.get(pool.memory_type, '❓')
+            type_icon = self.memory_type_icons[self._memory_type_index[pool.memory_type]]
             
             print(f"{pool_name:<20} {type_icon}{pool.memory_type.value:<11} {size_mb:<10} {used_mb:<10} "
                   f"{usage_percent:<8.1f} Tier{pool_data['performance_tier']:<5} {status}")
@@ -203,7 +207,7 @@ class MemoryVisualizer:
         print("-" * 80)
         
         fragmentation = self.memory_manager.calculate_fragmentation()
-        free_pages = sorted(self.memory_manager.free_pages)
+        free_pages = list(self.memory_manager.free_pages)  # Already in address order
         
         # Analyze fragmentation
         if not free_pages:
@@ -411,7 +415,7 @@ class MemoryVisualizer:
         print("-" * 50)
         
         for memory_type, usage in usage_by_type.items():
-            icon = self.memory_type_icons.get(memory_type, '❓')
+            icon = self.memory_type_icons[self._memory_type_index[memory_type]]
             used_mb = usage // (1024 * 1024)
             percentage = (usage / self.memory_manager.total_memory) * 100
             
@@ -434,8 +438,31 @@ class MemoryVisualizer:
         print("Memory Management Commands: allocate | deallocate | defrag | page_table <pid> | export")
         print("═" * 100)
     
-    def export_memory_state(self, filename: str = None):
-        """Export memory state to JSON"""
+    def _encode_physical_pages(self) -> Dict[str, Any]:
+        """Encode the per-frame state, owner and type arrays as base64 bytes"""
+        mm = self.memory_manager
+        owners = mm.page_owner
+        if sys.byteorder != 'little':
+            owners = owners[:]
+            owners.byteswap()
+        
+        def b64(data) -> str:
+            return base64.b64encode(data).decode('ascii')
+        
+        return {
+            'total_pages': mm.total_pages,
+            'page_size': mm.page_size,
+            # Codes index these lists; owners are little-endian int32, -1 = none
+            'state_codes': [state.value for state in PageState],
+            'type_codes': [memory_type.value for memory_type in MemoryType],
+            'page_state_b64': b64(bytes(mm.page_state)),
+            'page_owner_b64': b64(owners.tobytes()),
+            'page_type_b64': b64(bytes(mm.page_type)),
+        }
+    
+    def export_memory_state(self, dest: Union[str, TextIO, None] = None):
+        """Export memory state to JSON, to a path or any writable text stream"""
+        filename = dest
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"memory_state_{timestamp}.json"
@@ -448,18 +475,7 @@ class MemoryVisualizer:
                 pid: self.memory_manager.get_process_memory_info(pid)
                 for pid in self.memory_manager.page_tables.keys()
             },
-            'physical_pages': {
-                page_num: {
-                    'physical_address': page.physical_address,
-                    'state': page.state.value,
-                    'process_id': page.process_id,
-                    'memory_type': page.memory_type.value,
-                    'last_access_time': page.last_access_time,
-                    'dirty': page.dirty,
-                    'pinned': page.pinned
-                }
-                for page_num, page in self.memory_manager.physical_pages.items()
-            },
+            'physical_pages': self._encode_physical_pages(),
             'memory_pools': {
                 name: {
                     'memory_type': pool.memory_type.value,
@@ -473,7 +489,7 @@ class MemoryVisualizer:
             },
             'allocation_history': self.memory_manager.allocation_history[-100:],  # Last 100 allocations
             'fragmentation_level': self.memory_manager.fragmentation_level,
-            'free_pages': self.memory_manager.free_pages[:100],  # First 100 free pages
+            'free_pages': list(itertools.islice(self.memory_manager.free_pages, 100)),  # First 100 free pages
             'swap_space': {
                 'size': self.memory_manager.swap_space_size,
                 'used_slots': len(self.memory_manager.swap_space),
@@ -481,6 +497,11 @@ class MemoryVisualizer:
             }
         }
         
+        # Streams are written as-is; reporting the file only applies to paths
+        if hasattr(dest, "write"):
+            json.dump(memory_state, dest, indent=2, default=str)
+            return
+        
         with open(filename, 'w') as f:
             json.dump(memory_state, f, indent=2, default=str)
         
@@ -1,6 +1,6 @@
 import time
 from enum import Enum
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable
 import threading
 
 class ProcessState(Enum):
@@ -21,11 +21,30 @@ class ProcessType(Enum):
     SYSTEM = "system"
     USER = "user"
 
+# Attributes managers and schedulers attach on demand; left unset until then
+# so hasattr() checks keep working
+_EXTENSION_SLOTS = (
+    'virtual_base_address', 'memory_type', 'allocated_memory', 'context_switches',  # IntegratedProcessManager
+    'queue_level', 'time_in_level',  # MLFQScheduler
+)
+
 class ProcessControlBlock:
     """
     Process Control Block (PCB) - Contains all information about a process
     """
     
+    __slots__ = (
+        'pid', 'name', 'process_type', 'state', 'priority',
+        'creation_time', 'start_time', 'end_time', 'cpu_time_used', 'last_cpu_time',
+        'memory_required', 'memory_allocated', 'memory_base_address',
+        'time_quantum', 'remaining_time_quantum', 'wait_time', 'turnaround_time',
+        'program_counter', 'cpu_registers',
+        'thread', 'is_active', 'completion_callback', 'on_complete',
+        'node_id', 'resource_requirements', 'parent_pid', 'child_pids',
+        'io_operations', 'blocked_on_io',
+        '__dict__',  # extra attributes passed to create_process(**kwargs)
+    ) + _EXTENSION_SLOTS
+    
     def __init__(self, pid: int, name: str, process_type: ProcessType, 
                  priority: int = 0, memory_required: int = 1024):
         self.pid = pid  # Process ID
@@ -60,6 +79,7 @@ class ProcessControlBlock:
         self.thread: Optional[threading.Thread] = None
         self.is_active = False
         self.completion_callback = None
+        self.on_complete: Optional[Callable[[int], None]] = None  # Fired once after cleanup
         
         # AI Node specific attributes
         self.node_id: Optional[str] = None
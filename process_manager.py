@@ -21,6 +21,7 @@ class ProcessManager:
     def __init__(self, scheduler: Scheduler = None, max_workers: int = 4):
         self.scheduler = scheduler or RoundRobinScheduler()
         self.processes: Dict[int, ProcessControlBlock] = {}
+        self._termination_events: Dict[int, threading.Event] = {}
         self.next_pid = 1
         self.running_process: Optional[ProcessControlBlock] = None
         self.max_workers = max_workers
@@ -50,6 +51,7 @@ class ProcessManager:
     def create_process(self, name: str, process_type: ProcessType, 
                       target_function: Callable, args: tuple = (), 
                       priority: int = 0, memory_required: int = 1024,
+                      on_complete: Optional[Callable[[int], None]] = None,
                       **kwargs) -> Optional[int]:
         """
         Create a new process
@@ -61,6 +63,7 @@ class ProcessManager:
             args: Arguments for the function
             priority: Process priority
             memory_required: Memory requirement in KB
+            on_complete: Called with the PID once the process has been cleaned up
             **kwargs: Additional process attributes
         
         Returns:
@@ -85,6 +88,7 @@ class ProcessManager:
             )
             
             # Set additional attributes
+            pcb.on_complete = on_complete
             for key, value in kwargs.items():
                 setattr(pcb, key, value)
             
@@ -100,6 +104,7 @@ class ProcessManager:
             
             # Store process
             self.processes[pid] = pcb
+            self._termination_events[pid] = threading.Event()
             
             # Add to scheduler
             self.scheduler.add_process(pcb)
@@ -272,6 +277,18 @@ class ProcessManager:
             del self.processes[pid]
             
             logger.info(f"Cleaned up process {pid}")
+            
+            # Waiters learn the process is gone without polling
+            self._termination_events.pop(pid, threading.Event()).set()
+            if pcb.on_complete:
+                pcb.on_complete(pid)
+    
+    def wait_for_termination(self, pid: int, timeout: float = None) -> bool:
+        """Block until a process has been cleaned up; False on timeout"""
+        event = self._termination_events.get(pid)
+        if event is None:
+            return pid not in self.processes
+        return event.wait(timeout)
     
     def _generate_pid(self) -> int:
         """Generate unique process ID"""
@@ -335,8 +352,7 @@ class ProcessManager:
             self.scheduler = new_scheduler
             
             # Add processes to new scheduler
-            for process in old_processes:
-                self.scheduler.add_process(process)
+            self.scheduler.add_processes(old_processes)
             
             logger.info(f"Changed scheduler to {new_scheduler.name}")
     
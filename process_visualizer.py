@@ -1,5 +1,6 @@
 import time
 import os
+import sys
 import json
 from typing import Dict, List, Any
 from datetime import datetime
@@ -13,8 +14,9 @@ class ProcessVisualizer:
     Displays process queues, system information, and performance metrics
     """
     
-    def __init__(self, process_manager: ProcessManager):
+    def __init__(self, process_manager: ProcessManager, force_render: bool = False):
         self.process_manager = process_manager
+        self.force_render = force_render
         self.theme_colors = {
             'AI_INFERENCE': '🧠',
             'DATA_PROCESSING': '📊', 
@@ -33,12 +35,24 @@ class ProcessVisualizer:
             'suspended': '😴'
         }
     
+    @property
+    def render_enabled(self) -> bool:
+        """Whether full dashboards are drawn; output piped to a file gets a summary line"""
+        if self.force_render:
+            return True
+        isatty = getattr(sys.stdout, 'isatty', None)
+        return bool(isatty and isatty())
+    
     def clear_screen(self):
         """Clear the terminal screen"""
+        if not self.render_enabled:
+            return
         os.system('cls' if os.name == 'nt' else 'clear')
     
     def display_header(self):
         """Display system header"""
+        if not self.render_enabled:
+            return
         system_info = self.process_manager.get_system_info()
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
@@ -54,6 +68,8 @@ class ProcessVisualizer:
     
     def display_memory_info(self):
         """Display memory information"""
+        if not self.render_enabled:
+            return
         system_info = self.process_manager.get_system_info()
         total_mb = system_info['total_memory'] / 1024
         available_mb = system_info['available_memory'] / 1024
@@ -75,6 +91,8 @@ class ProcessVisualizer:
     
     def display_process_list(self):
         """Display list of all processes"""
+        if not self.render_enabled:
+            return
         processes = self.process_manager.list_processes()
         
         if not processes:
@@ -96,6 +114,8 @@ class ProcessVisualizer:
     
     def display_scheduler_queues(self):
         """Display scheduler queue information"""
+        if not self.render_enabled:
+            return
         scheduler = self.process_manager.scheduler
         
         print(f"🎯 SCHEDULER QUEUES ({scheduler.name})")
@@ -127,6 +147,8 @@ class ProcessVisualizer:
     
     def display_statistics(self):
         """Display performance statistics"""
+        if not self.render_enabled:
+            return
         stats = self.process_manager.scheduler.get_statistics()
         system_info = self.process_manager.get_system_info()
         
@@ -142,6 +164,8 @@ class ProcessVisualizer:
     
     def display_ai_node_info(self):
         """Display AI Node specific information"""
+        if not self.render_enabled:
+            return
         print("🤖 AI NODE STATUS")
         print("-" * 30)
         
@@ -162,6 +186,10 @@ class ProcessVisualizer:
     
     def display_full_dashboard(self):
         """Display complete system dashboard"""
+        if not self.render_enabled:
+            self.display_summary_line()
+            return
+        
         self.clear_screen()
         self.display_header()
         self.display_memory_info()
@@ -173,6 +201,15 @@ class ProcessVisualizer:
         print("Press Ctrl+C to exit dashboard")
         print("═" * 80)
     
+    def display_summary_line(self):
+        """Display a one-line system summary for non-interactive output"""
+        system_info = self.process_manager.get_system_info()
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] {system_info['scheduler']} | "
+              f"processes: {system_info['total_processes']} "
+              f"(running {system_info['running_processes']}) | "
+              f"memory: {system_info['memory_usage_percent']:.1f}% | "
+              f"context switches: {system_info['context_switches']}")
+    
     def export_system_state(self, filename: str = None):
         """Export current system state to JSON"""
         if filename is None:
@@ -1,7 +1,7 @@
 import time
 from abc import ABC, abstractmethod
 from collections import deque
-from typing import List, Optional, Dict
+from typing import Iterable, List, Optional, Dict
 import heapq
 from process_control_block import ProcessControlBlock, ProcessState
 
@@ -20,6 +20,11 @@ class Scheduler(ABC):
         """Add a process to the scheduler"""
         pass
     
+    def add_processes(self, pcbs: Iterable[ProcessControlBlock]):
+        """Add a batch of processes; subclasses override with a bulk insert"""
+        for pcb in pcbs:
+            self.add_process(pcb)
+    
     @abstractmethod
     def get_next_process(self) -> Optional[ProcessControlBlock]:
         """Get the next process to run"""
@@ -64,6 +69,14 @@ class FIFOScheduler(Scheduler):
         self.ready_queue.append(pcb)
         self.total_processes += 1
     
+    def add_processes(self, pcbs: Iterable[ProcessControlBlock]):
+        """Append a batch of processes in order"""
+        batch = list(pcbs)
+        for pcb in batch:
+            pcb.set_state(ProcessState.READY)
+        self.ready_queue.extend(batch)
+        self.total_processes += len(batch)
+    
     def get_next_process(self) -> Optional[ProcessControlBlock]:
         """Get the first process in the queue"""
         if self.ready_queue:
@@ -105,6 +118,15 @@ class RoundRobinScheduler(Scheduler):
         self.ready_queue.append(pcb)
         self.total_processes += 1
     
+    def add_processes(self, pcbs: Iterable[ProcessControlBlock]):
+        """Append a batch of processes in order"""
+        batch = list(pcbs)
+        for pcb in batch:
+            pcb.set_state(ProcessState.READY)
+            pcb.remaining_time_quantum = self.time_quantum
+        self.ready_queue.extend(batch)
+        self.total_processes += len(batch)
+    
     def get_next_process(self) -> Optional[ProcessControlBlock]:
         """Get next process, implementing round robin logic"""
         if self.ready_queue:
@@ -167,6 +189,24 @@ class PriorityScheduler(Scheduler):
                 # Higher priority process arrived, preempt current
                 self.preempt_current_process()
     
+    def add_processes(self, pcbs: Iterable[ProcessControlBlock]):
+        """Add a batch of processes with one O(n) heapify"""
+        batch = list(pcbs)
+        if not batch:
+            return
+        for pcb in batch:
+            pcb.set_state(ProcessState.READY)
+        # Counters are assigned in batch order, so ties stay FIFO
+        start = self._counter
+        self.ready_queue.extend((-pcb.priority, start + i, pcb) for i, pcb in enumerate(batch))
+        heapq.heapify(self.ready_queue)
+        self._counter += len(batch)
+        self.total_processes += len(batch)
+        
+        if self.preemptive and self.current_process:
+            if max(pcb.priority for pcb in batch) > self.current_process.priority:
+                self.preempt_current_process()
+    
     def get_next_process(self) -> Optional[ProcessControlBlock]:
         """Get highest priority process"""
         if self.ready_queue:
@@ -229,6 +269,17 @@ class MLFQScheduler(Scheduler):
         self.queues[0].append(pcb)
         self.total_processes += 1
     
+    def add_processes(self, pcbs: Iterable[ProcessControlBlock]):
+        """Append a batch of new processes to the top-level queue"""
+        batch = list(pcbs)
+        for pcb in batch:
+            pcb.set_state(ProcessState.READY)
+            pcb.queue_level = 0
+            pcb.time_in_level = 0
+            pcb.remaining_time_quantum = self.time_quanta[0]
+        self.queues[0].extend(batch)
+        self.total_processes += len(batch)
+    
     def get_next_process(self) -> Optional[ProcessControlBlock]:
         """Get next process using MLFQ logic"""
         # Check queues from highest to lowest priority
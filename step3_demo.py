@@ -334,8 +334,9 @@ class Step3Demo:
             # Start interactive monitoring
             self.interactive_monitor.start_interactive_mode()
             
-            # Keep running until user stops
-            input("Press Enter to stop interactive simulation...")
+            # Keep running until the user presses 'q' (the monitor owns keyboard input)
+            while self.interactive_monitor.running:
+                time.sleep(0.1)
             
         except KeyboardInterrupt:
             print("\n⏹️ Stopping interactive simulation...")
@@ -3,16 +3,32 @@ Decentralized AI Node Operating System - Step 4: File System Demo
 Comprehensive demonstration of file system capabilities including encryption and visualization.
 """
 
+import asyncio
+import functools
 import threading
 import time
 import random
 import json
 import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
 
 from file_system import VirtualFileSystem, FileType, AccessLevel
 from file_encryption import FileEncryption, EncryptionLevel
-from file_system_visualizer import FileSystemVisualizer, InteractiveFileSystemMonitor, FileSystemEvent
+from file_system_visualizer import FileSystemVisualizer, InteractiveFileSystemMonitor
+
+# File icons by extension, built once instead of on every lookup
+_ICON_MAP = {
+    '.txt': '📄', '.md': '📝', '.py': '🐍', '.sol': '📜',
+    '.pdf': '📕', '.doc': '📘', '.json': '📋', '.csv': '📊',
+    '.png': '🖼️', '.jpg': '🖼️', '.bin': '⚙️', '.model': '🧠'
+}
+_DEFAULT_ICON = '📄'
+
+# Background activity choices, materialized once for random.choice
+_FILE_TYPES = tuple(FileType)
+_OPERATIONS = ("create", "read", "write", "delete")
 
 class Step4Demo:
     """
@@ -31,6 +47,29 @@ class Step4Demo:
         self.demo_files = []
         self.demo_users = ["alice", "bob", "charlie", "admin"]
         
+        # Background activity runs on a small worker pool so the monitor stays responsive
+        self.activity_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="fs-activity")
+        self.activity_future = None
+        self.background_running = False
+        self._tmp_files = []
+        self._tmp_files_set = set()
+        self._bg_paths = iter(())
+        self._tmp_cache = {}
+        self._dir_cache_hits = 0
+        self._dir_cache_misses = 0
+        self._user_bytes = {user: user.encode('ascii') for user in self.demo_users}
+        self._background_ops = {
+            "create": self._bg_create,
+            "read": self._bg_read,
+            "write": self._bg_write,
+            "delete": self._bg_delete,
+        }
+        
+        # Logged events are handed to the visualizer in small batches
+        self._event_batch = []
+        self._event_batch_lock = threading.Lock()
+        self._last_event_flush = time.time()
+        
     def run_comprehensive_demo(self):
         """Run the complete Step 4 demonstration"""
         print("🚀 " + "STEP 4: FILE SYSTEM IMPLEMENTATION DEMO".center(80, "═"))
@@ -76,6 +115,7 @@ class Step4Demo:
             else:
                 print("❌ Invalid choice, please try again.")
                 
+            self._flush_events()
             print("\n" + "─" * 80 + "\n")
             
     def demo_basic_file_operations(self):
@@ -505,10 +545,17 @@ class Step4Demo:
         print("═" * 60)
         
         print("🔄 Starting background file activity...")
+        self._flush_events()
+        
+        # Mirror events into a ring file that external tools can inspect live
+        self.close_event_trace()
+        trace_fd, trace_path = tempfile.mkstemp(prefix="bcos_fs_events_", suffix=".ring")
+        os.close(trace_fd)
+        self.visualizer.enable_event_trace(trace_path)
+        print(f"🛰️ Event trace ring: {trace_path}")
         
         # Start background activity
-        activity_thread = threading.Thread(target=self._background_file_activity, daemon=True)
-        activity_thread.start()
+        self.activity_future = self.start_background_activity()
         
         print("🖥️ Launching interactive monitor...")
         print("📝 Use number keys (1-6) to switch between different views")
@@ -672,6 +719,9 @@ class Step4Demo:
         print(f"📖 Read Operations: {stats['read_operations']}")
         print(f"✏️ Write Operations: {stats['write_operations']}")
         print(f"💾 Cache Hit Rate: {stats['cache_hit_rate']:.1f}%")
+        dir_lookups = self._dir_cache_hits + self._dir_cache_misses
+        if dir_lookups:
+            print(f"📂 Dir Cache Hit Rate: {self._dir_cache_hits / dir_lookups * 100:.1f}%")
         print(f"⚡ Average I/O Time: {stats['avg_io_time']*1000:.2f}ms")
         
         if self.encryption:
@@ -682,87 +732,194 @@ class Step4Demo:
             
         print("\n✅ Comprehensive test completed!")
         
-    def _background_file_activity(self):
-        """Generate background file activity for monitoring demo"""
-        operations = ["create", "read", "write", "delete"]
-        
-        for i in range(100):
+    def start_background_activity(self):
+        """Submit background file activity to the worker pool and return its future"""
+        self._prefetch_tmp_cache()
+        self.background_running = True
+        return self.activity_pool.submit(asyncio.run, self._background_file_activity())
+        
+    def stop_background_activity(self):
+        """Stop background file activity and release the worker pool"""
+        self.background_running = False
+        if self.activity_future:
+            self.activity_future.cancel()
+        self.activity_pool.shutdown(wait=False)
+        
+    def close_event_trace(self):
+        """Stop the event trace and delete its ring file"""
+        trace_ring = self.visualizer.trace_ring
+        self.visualizer.disable_event_trace()
+        if trace_ring:
             try:
-                operation = random.choice(operations)
-                user = random.choice(self.demo_users)
-                
-                if operation == "create":
-                    filename = f"bg_file_{random.randint(1000, 9999)}.txt"
-                    content = f"Background file created at {time.time()}"
-                    
-                    try:
-                        file_id = self.file_system.create_file(
-                            f"/tmp/{filename}",
-                            content.encode(),
-                            random.choice(list(FileType)),
-                            user
-                        )
-                        self._log_event("create", f"/tmp/{filename}", user, len(content))
-                    except:
-                        pass
-                        
-                elif operation == "read":
-                    try:
-                        entries = self.file_system.list_directory("/tmp")
-                        if entries:
-                            entry = random.choice([e for e in entries if not e.is_directory])
-                            content = self.file_system.read_file(f"/tmp/{entry.name}", AccessLevel.USER)
-                            self._log_event("read", f"/tmp/{entry.name}", user, len(content))
-                    except:
-                        pass
-                        
-                elif operation == "write":
-                    try:
-                        entries = self.file_system.list_directory("/tmp")
-                        if entries:
-                            entry = random.choice([e for e in entries if not e.is_directory])
-                            new_content = f"\nModified by {user} at {time.time()}"
-                            self.file_system.write_file(f"/tmp/{entry.name}", new_content.encode(), AccessLevel.USER, append=True)
-                            self._log_event("write", f"/tmp/{entry.name}", user, len(new_content))
-                    except:
-                        pass
-                        
-                elif operation == "delete":
-                    try:
-                        entries = self.file_system.list_directory("/tmp")
-                        if entries and len(entries) > 5:  # Keep some files
-                            entry = random.choice([e for e in entries if not e.is_directory])
-                            self.file_system.delete_file(f"/tmp/{entry.name}", AccessLevel.USER)
-                            self._log_event("delete", f"/tmp/{entry.name}", user, 0)
-                    except:
-                        pass
-                        
-                time.sleep(random.uniform(0.1, 1.0))
+                os.remove(trace_ring.path)
+            except FileNotFoundError:
+                pass
+        
+    def _prefetch_tmp_cache(self):
+        """Warm the /tmp listing cache with one recursive walk"""
+        self._tmp_cache = self.file_system.walk("/tmp")
+        
+    async def _background_file_activity(self, concurrency: int = 4):
+        """Generate background file activity for monitoring demo"""
+        # Cache regular file paths under /tmp once; workers keep it in sync
+        entries = self._tmp_cache.get("/tmp")
+        self._count_dir_cache(entries is not None, "system", time.time())
+        if entries is None:
+            entries = self.file_system.list_directory("/tmp")
+        self._tmp_files = [f"/tmp/{e.name}" for e in entries if not e.is_directory]
+        self._tmp_files_set = set(self._tmp_files)
+        
+        # Sample the whole 100-step plan up front; workers share one iterator over it
+        rng = random.Random()
+        self._bg_paths = iter([f"/tmp/bg_file_{n}.txt" for n in rng.sample(range(1000, 10000), 100)])
+        operations = rng.choices(_OPERATIONS, k=100)
+        users = rng.choices(self.demo_users, k=100)
+        delays = [rng.uniform(0.1, 1.0) for _ in range(100)]
+        plan = iter(list(zip(operations, users, delays)))
+        try:
+            await asyncio.gather(*(self._background_worker(plan) for _ in range(concurrency)))
+        finally:
+            self._flush_events()
+        
+    async def _background_worker(self, plan):
+        """Issue planned file operations, awaiting blocking calls in the executor"""
+        loop = asyncio.get_running_loop()
+        ops = self._background_ops
+        rng = random.Random()
+        
+        for operation, user, delay in plan:
+            if not self.background_running:
+                break
                 
-            except Exception:
-                pass  # Continue on errors
+            # Expected file errors are handled per operation; anything else is reported
+            # and the worker keeps its pace rather than stopping the whole plan
+            try:
+                await ops[operation](loop, user, rng, time.time())
+            except Exception as e:
+                print(f"❌ Background {operation} failed: {e}")
+            await asyncio.sleep(delay)
                 
-    def _log_event(self, event_type: str, file_path: str, user_id: str, file_size: int):
-        """Log file system event"""
-        event = FileSystemEvent(
-            timestamp=time.time(),
-            event_type=event_type,
-            file_path=file_path,
-            user_id=user_id,
-            file_size=file_size,
-            success=True
-        )
-        self.visualizer.add_event(event)
+    async def _bg_create(self, loop, user: str, rng: random.Random, now: float):
+        """Create a background file under /tmp"""
+        path = next(self._bg_paths)
+        content = b"Background file created at %f" % now
+        
+        # Reserve the path up front; paths left by earlier runs are skipped rather than raising
+        if path in self._tmp_files_set:
+            return
+        self._tmp_files_set.add(path)
+        try:
+            await loop.run_in_executor(
+                None,
+                self.file_system.create_file,
+                path,
+                content,
+                rng.choice(_FILE_TYPES),
+                user
+            )
+        except (OSError, KeyError):
+            self._tmp_files_set.discard(path)
+        else:
+            self._tmp_files.append(path)
+            self._log_event("create", path, user, len(content), now)
+            
+    async def _bg_read(self, loop, user: str, rng: random.Random, now: float):
+        """Read a random background file"""
+        if not self._tmp_files:
+            return
+        path = rng.choice(self._tmp_files)
+        try:
+            content = await loop.run_in_executor(
+                None, self.file_system.read_file, path, AccessLevel.USER
+            )
+            self._count_dir_cache(True, user, now)
+            self._log_event("read", path, user, len(content), now)
+        except FileNotFoundError:
+            self._count_dir_cache(False, user, now)
+        except (OSError, KeyError):
+            pass
+            
+    async def _bg_write(self, loop, user: str, rng: random.Random, now: float):
+        """Append to a random background file"""
+        if not self._tmp_files:
+            return
+        path = rng.choice(self._tmp_files)
+        new_content = b"\nModified by %s at %f" % (self._user_bytes[user], now)
+        try:
+            await loop.run_in_executor(
+                None,
+                functools.partial(
+                    self.file_system.write_file,
+                    path, new_content, AccessLevel.USER, append=True
+                )
+            )
+            self._count_dir_cache(True, user, now)
+            self._log_event("write", path, user, len(new_content), now)
+        except FileNotFoundError:
+            self._count_dir_cache(False, user, now)
+        except (OSError, KeyError):
+            pass
+            
+    async def _bg_delete(self, loop, user: str, rng: random.Random, now: float):
+        """Delete a random background file, keeping a few around"""
+        tmp_files = self._tmp_files
+        if len(tmp_files) <= 5:  # Keep some files
+            return
+            
+        # Swap-remove before awaiting so other workers cannot pick it
+        index = rng.randrange(len(tmp_files))
+        path = tmp_files[index]
+        tmp_files[index] = tmp_files[-1]
+        tmp_files.pop()
+        self._tmp_files_set.discard(path)
+        try:
+            await loop.run_in_executor(
+                None, self.file_system.delete_file, path, AccessLevel.USER
+            )
+            self._count_dir_cache(True, user, now)
+            self._log_event("delete", path, user, 0, now)
+        except FileNotFoundError:
+            self._count_dir_cache(False, user, now)
+        except (OSError, KeyError):
+            pass
+            
+    def _count_dir_cache(self, hit: bool, user: str, now: float):
+        """Count a /tmp listing cache lookup and trace it when tracing is enabled"""
+        if hit:
+            self._dir_cache_hits += 1
+        else:
+            self._dir_cache_misses += 1
+        if self.visualizer.trace_ring:
+            event_type = "dir_cache_hit" if hit else "dir_cache_miss"
+            self.visualizer.trace_ring.write(now, event_type, "/tmp", user)
+            
+    def _log_event(self, event_type: str, file_path: str, user_id: str, file_size: int,
+                   timestamp: float = None):
+        """Log file system event (flushed every 16 events or 100ms)"""
+        if timestamp is None:
+            timestamp = time.time()
+        with self._event_batch_lock:
+            self._event_batch.append((timestamp, event_type, file_path, user_id, file_size))
+            if len(self._event_batch) < 16 and timestamp - self._last_event_flush < 0.1:
+                return
+            batch, self._event_batch = self._event_batch, []
+            self._last_event_flush = timestamp
+        self.visualizer.record_events(batch)
+        
+    def _flush_events(self):
+        """Hand any pending logged events to the visualizer"""
+        with self._event_batch_lock:
+            batch, self._event_batch = self._event_batch, []
+            self._last_event_flush = time.time()
+        if batch:
+            self.visualizer.record_events(batch)
         
     def _get_file_icon(self, filename: str) -> str:
         """Get file icon based on extension"""
-        ext = os.path.splitext(filename)[1].lower()
-        icon_map = {
-            '.txt': '📄', '.md': '📝', '.py': '🐍', '.sol': '📜',
-            '.pdf': '📕', '.doc': '📘', '.json': '📋', '.csv': '📊',
-            '.png': '🖼️', '.jpg': '🖼️', '.bin': '⚙️', '.model': '🧠'
-        }
-        return icon_map.get(ext, '📄')
+        dot = filename.rfind('.')
+        if dot <= 0:
+            return _DEFAULT_ICON
+        return _ICON_MAP.get(filename[dot:].lower(), _DEFAULT_ICON)
 
 def main():
     """Main demo entry point"""
@@ -781,7 +938,9 @@ def main():
         print(f"\n❌ Demo error: {e}")
     finally:
         # Cleanup
+        demo.stop_background_activity()
         demo.visualizer.stop_monitoring()
+        demo.close_event_trace()
         print("🧹 Demo cleanup completed")
         print("👋 Thank you for trying Step 4 of the Decentralized AI Node OS!")
 
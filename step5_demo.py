@@ -3,6 +3,8 @@ Decentralized AI Node Operating System - Step 5: Bonus Features Demo
 Demonstrates AI-based scheduler and Web GUI dashboard for the operating system.
 """
 
+import asyncio
+import sys
 import time
 import threading
 import random
@@ -14,6 +16,90 @@ from file_encryption import FileEncryption, EncryptionLevel
 from ai_scheduler import AIScheduler, LearningMode, ProcessType
 from web_gui import create_integrated_gui
 
+# Enum members materialized once for random.choice in the simulation loops
+_PROCESS_TYPES = tuple(ProcessType)
+
+# Simulated success probability per process type
+_SUCCESS_RATES = {
+    ProcessType.SYSTEM: 0.95,
+    ProcessType.AI_WORKER: 0.85,
+    ProcessType.BLOCKCHAIN_MINER: 0.90,
+    ProcessType.SMART_CONTRACT: 0.88,
+    ProcessType.NETWORK_HANDLER: 0.92
+}
+
+# Demo file activities and the file names they write under /activity
+_FILE_ACTIVITIES = tuple(
+    (activity, activity.lower().replace(" ", "_") + ".dat")
+    for activity in (
+        "Creating AI model checkpoint files",
+        "Updating blockchain transaction logs",
+        "Processing smart contract bytecode",
+        "Backing up critical system data",
+        "Generating performance reports"
+    )
+)
+
+# Full-width distribution bar, sliced to length per row
+_FULL_BAR = "█" * 20
+
+# Static console blocks, written in one call instead of line-by-line prints
+_MENU_TEXT = (
+    "\n"
+    "📋 BONUS FEATURES MENU:\n"
+    "  [1] 🤖 AI Scheduler Intelligence Demo\n"
+    "  [2] 🖥️ Web GUI Dashboard Demo\n"
+    "  [3] 🎮 Interactive AI Learning Demo\n"
+    "  [4] 📊 Performance Comparison Demo\n"
+    "  [5] 🌐 Integrated Web Dashboard\n"
+    "  [6] 🚀 Full System Simulation\n"
+    "  [7] 📈 AI Learning Analytics\n"
+    "  [0] Exit Demo\n"
+    "\n"
+)
+
+_INTEGRATED_FEATURES_BLOCK = (
+    "\n"
+    "🌟 INTEGRATED DASHBOARD FEATURES:\n"
+    "==================================================\n"
+    "📊 Real-time System Monitoring:\n"
+    "  • Animated CPU, Memory, Disk, and Network usage rings\n"
+    "  • Live system uptime counter\n"
+    "  • Dynamic progress indicators\n"
+    "\n"
+    "🤖 AI Scheduler Intelligence:\n"
+    "  • Live performance chart with real-time updates\n"
+    "  • Learning mode and prediction accuracy display\n"
+    "  • Adaptation count and process statistics\n"
+    "\n"
+    "📁 File System Analytics:\n"
+    "  • Interactive storage utilization donut chart\n"
+    "  • Real-time file operation monitoring\n"
+    "  • Cache performance statistics\n"
+    "\n"
+    "🔒 Security Dashboard:\n"
+    "  • Encryption status and active keys count\n"
+    "  • Security success rate monitoring\n"
+    "  • Blocked users and threat detection\n"
+    "\n"
+    "⚙️ Process Monitor:\n"
+    "  • Live process table with running and queued processes\n"
+    "  • Process type icons and power mode indicators\n"
+    "  • Real-time runtime tracking\n"
+    "\n"
+).encode("utf-8")
+
+def _write_block(block: bytes):
+    """Write a pre-encoded block straight to stdout's byte buffer"""
+    sys.stdout.flush()  # Keep ordering with text already queued by print()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(block.decode("utf-8"))
+        sys.stdout.flush()
+    else:
+        buffer.write(block)
+        buffer.flush()
+
 class Step5Demo:
     """
     Step 5 Bonus Features Demo
@@ -29,9 +115,14 @@ class Step5Demo:
         self.ai_scheduler = AIScheduler(num_cores=8)  # 8-core simulation
         self.web_gui = None
         
+        # Simulated processes and background activity run as coroutines on one event-loop thread
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._loop_thread.start()
+        
         # Demo state
         self.demo_running = False
-        self.workload_thread = None
+        self.workload_task = None
         
         print("✅ System components initialized successfully!")
         
@@ -42,16 +133,8 @@ class Step5Demo:
         print("=" * 80)
         
         while True:
-            print("\n📋 BONUS FEATURES MENU:")
-            print("  [1] 🤖 AI Scheduler Intelligence Demo")
-            print("  [2] 🖥️ Web GUI Dashboard Demo")
-            print("  [3] 🎮 Interactive AI Learning Demo")
-            print("  [4] 📊 Performance Comparison Demo")
-            print("  [5] 🌐 Integrated Web Dashboard")
-            print("  [6] 🚀 Full System Simulation")
-            print("  [7] 📈 AI Learning Analytics")
-            print("  [0] Exit Demo")
-            print()
+            sys.stdout.write(_MENU_TEXT)
+            sys.stdout.flush()
             
             choice = input("🎯 Select demo option: ").strip()
             
@@ -104,13 +187,11 @@ class Step5Demo:
             (ProcessType.SMART_CONTRACT, "DeFi protocol execution", 1.2)
         ]
         
-        for i, (ptype, description, estimated_time) in enumerate(process_types):
-            self.ai_scheduler.add_process(
-                f"proc_{i+1:02d}_{ptype.value}",
-                ptype,
-                estimated_time,
-                random.uniform(100, 500)
-            )
+        self.ai_scheduler.add_processes([
+            (f"proc_{i+1:02d}_{ptype.value}", ptype, estimated_time, random.uniform(100, 500))
+            for i, (ptype, _, estimated_time) in enumerate(process_types)
+        ])
+        for ptype, description, _ in process_types:
             print(f"  ✅ Added: {description} (Type: {ptype.value})")
             
         print(f"\n📈 Queue Status: {len(self.ai_scheduler.ready_queue)} processes ready")
@@ -129,11 +210,7 @@ class Step5Demo:
                 print(f"     Predicted Runtime: {scheduled['predicted_runtime']:.2f}s")
                 
                 # Simulate process execution
-                threading.Thread(
-                    target=self._simulate_ai_process,
-                    args=(scheduled,),
-                    daemon=True
-                ).start()
+                self._submit_simulation(scheduled)
                 
             time.sleep(0.5)  # Small delay for demonstration
             
@@ -218,19 +295,15 @@ class Step5Demo:
             
             # Add mode-specific workload
             if mode == LearningMode.AI_FOCUSED:
-                for i in range(5):
-                    self.ai_scheduler.add_process(
-                        f"ai_focus_{i}",
-                        ProcessType.AI_WORKER,
-                        random.uniform(1.0, 3.0)
-                    )
+                self.ai_scheduler.add_processes([
+                    (f"ai_focus_{i}", ProcessType.AI_WORKER, random.uniform(1.0, 3.0))
+                    for i in range(5)
+                ])
             elif mode == LearningMode.BLOCKCHAIN_FOCUSED:
-                for i in range(4):
-                    self.ai_scheduler.add_process(
-                        f"blockchain_focus_{i}",
-                        ProcessType.BLOCKCHAIN_MINER,
-                        random.uniform(2.0, 4.0)
-                    )
+                self.ai_scheduler.add_processes([
+                    (f"blockchain_focus_{i}", ProcessType.BLOCKCHAIN_MINER, random.uniform(2.0, 4.0))
+                    for i in range(4)
+                ])
                     
             # Schedule and execute processes
             scheduled_in_mode = 0
@@ -242,11 +315,7 @@ class Step5Demo:
                     print(f"  📋 Scheduled: {scheduled['id']} ({ptype_str}) - Priority: {scheduled['priority']}")
                     
                     # Quick execution simulation
-                    threading.Thread(
-                        target=self._simulate_ai_process,
-                        args=(scheduled,),
-                        daemon=True
-                    ).start()
+                    self._submit_simulation(scheduled)
                     
             print(f"  ✅ Processed {scheduled_in_mode} tasks in {mode.value} mode")
             time.sleep(2)  # Wait for completion
@@ -338,32 +407,7 @@ class Step5Demo:
         print("🎮 Starting comprehensive system simulation...")
         self._start_comprehensive_simulation()
         
-        print("\n🌟 INTEGRATED DASHBOARD FEATURES:")
-        print("=" * 50)
-        print("📊 Real-time System Monitoring:")
-        print("  • Animated CPU, Memory, Disk, and Network usage rings")
-        print("  • Live system uptime counter")
-        print("  • Dynamic progress indicators")
-        print()
-        print("🤖 AI Scheduler Intelligence:")
-        print("  • Live performance chart with real-time updates")
-        print("  • Learning mode and prediction accuracy display")
-        print("  • Adaptation count and process statistics")
-        print()
-        print("📁 File System Analytics:")
-        print("  • Interactive storage utilization donut chart")
-        print("  • Real-time file operation monitoring")
-        print("  • Cache performance statistics")
-        print()
-        print("🔒 Security Dashboard:")
-        print("  • Encryption status and active keys count")
-        print("  • Security success rate monitoring")
-        print("  • Blocked users and threat detection")
-        print()
-        print("⚙️ Process Monitor:")
-        print("  • Live process table with running and queued processes")
-        print("  • Process type icons and power mode indicators")
-        print("  • Real-time runtime tracking")
+        _write_block(_INTEGRATED_FEATURES_BLOCK)
         
         print(f"\n🌐 Dashboard URL: http://localhost:8080")
         print("📱 The dashboard is fully responsive and updates every 2 seconds!")
@@ -399,17 +443,13 @@ class Step5Demo:
         
         # Show real-time statistics
         print("\n📊 LIVE SYSTEM STATISTICS:")
-        for i in range(10):
-            print(f"\r🔄 Update {i+1}/10", end="", flush=True)
-            
-            # Get current metrics
-            scheduler_metrics = self.ai_scheduler.get_ai_metrics()
-            fs_metrics = self.file_system.get_file_system_stats()
-            security_metrics = self.encryption.get_security_statistics()
-            
-            time.sleep(1)
-            
-        print("\n")
+        print("🔄 Letting the system run for 10 seconds...\n")
+        time.sleep(10)
+        
+        # Only the final snapshot is reported, so collect it once
+        scheduler_metrics = self.ai_scheduler.get_ai_metrics()
+        fs_metrics = self.file_system.get_file_system_stats()
+        security_metrics = self.encryption.get_security_statistics()
         
         # Final summary
         print("🏁 SIMULATION SUMMARY:")
@@ -461,9 +501,10 @@ class Step5Demo:
         
         print("\n📊 Process Type Distribution:")
         type_dist = metrics.get('type_distribution', {})
+        total = sum(type_dist.values()) or 1
         for ptype, count in type_dist.items():
-            percentage = (count / sum(type_dist.values()) * 100) if type_dist.values() else 0
-            bar = "█" * int(percentage / 5)  # Scale bar
+            percentage = count / total * 100
+            bar = _FULL_BAR[:int(percentage / 5)]  # Scale bar
             print(f"  {ptype:<20} {count:>3} [{bar:<20}] {percentage:.1f}%")
             
         print("\n💡 AI INSIGHTS:")
@@ -476,25 +517,21 @@ class Step5Demo:
             
         print(f"\n📂 Detailed analytics available in: {analytics_file}")
         
-    def _simulate_ai_process(self, process_info):
+    def _submit_simulation(self, process_info):
+        """Schedule a simulated AI process on the background event loop"""
+        return asyncio.run_coroutine_threadsafe(self._simulate_ai_process(process_info), self._loop)
+        
+    async def _simulate_ai_process(self, process_info):
         """Simulate AI process execution"""
         # Simulate variable execution time
         base_time = process_info.get("predicted_runtime", 1.0)
         actual_time = base_time * random.uniform(0.7, 1.3)
         
-        time.sleep(actual_time)
+        await asyncio.sleep(actual_time)
         
         # Simulate success/failure based on process type
-        success_rates = {
-            ProcessType.SYSTEM: 0.95,
-            ProcessType.AI_WORKER: 0.85,
-            ProcessType.BLOCKCHAIN_MINER: 0.90,
-            ProcessType.SMART_CONTRACT: 0.88,
-            ProcessType.NETWORK_HANDLER: 0.92
-        }
-        
         ptype = process_info.get("type", ProcessType.SYSTEM)
-        success = random.random() < success_rates.get(ptype, 0.9)
+        success = random.random() < _SUCCESS_RATES.get(ptype, 0.9)
         
         # Complete the process
         core_id = process_info.get("core_id")
@@ -505,13 +542,16 @@ class Step5Demo:
             
     def _display_scheduler_metrics(self, metrics):
         """Display AI scheduler metrics in formatted way"""
-        print(f"  🎯 Learning Mode: {metrics['learning_mode']}")
-        print(f"  📈 Prediction Accuracy: {metrics['prediction_accuracy']:.1f}%")
-        print(f"  📊 Performance Score: {metrics['avg_performance_score']:.1f}")
-        print(f"  🔄 Total Scheduled: {metrics['total_scheduled']}")
-        print(f"  🧠 Active Cores: {metrics['active_cores']}/{self.ai_scheduler.num_cores}")
-        print(f"  📋 Queue Length: {metrics['queue_length']}")
-        print(f"  🔋 System Load: {metrics['system_load']:.1%}")
+        sys.stdout.write(
+            f"  🎯 Learning Mode: {metrics['learning_mode']}\n"
+            f"  📈 Prediction Accuracy: {metrics['prediction_accuracy']:.1f}%\n"
+            f"  📊 Performance Score: {metrics['avg_performance_score']:.1f}\n"
+            f"  🔄 Total Scheduled: {metrics['total_scheduled']}\n"
+            f"  🧠 Active Cores: {metrics['active_cores']}/{self.ai_scheduler.num_cores}\n"
+            f"  📋 Queue Length: {metrics['queue_length']}\n"
+            f"  🔋 System Load: {metrics['system_load']:.1%}\n"
+        )
+        sys.stdout.flush()
         
     def _create_demo_data(self):
         """Create demonstration data for GUI"""
@@ -547,109 +587,93 @@ class Step5Demo:
             return
             
         self.demo_running = True
-        
-        def background_activity():
-            while self.demo_running:
-                try:
-                    # Add random AI/blockchain processes
-                    if random.random() < 0.3:
-                        process_types = list(ProcessType)
-                        ptype = random.choice(process_types)
-                        
-                        self.ai_scheduler.add_process(
-                            f"bg_proc_{int(time.time() * 1000) % 10000}",
-                            ptype,
-                            random.uniform(0.5, 2.0),
-                            random.uniform(50, 300)
-                        )
-                        
-                    # Schedule processes
-                    scheduled = self.ai_scheduler.schedule_next()
-                    if scheduled:
-                        threading.Thread(
-                            target=self._simulate_ai_process,
-                            args=(scheduled,),
-                            daemon=True
-                        ).start()
-                        
-                    time.sleep(random.uniform(1, 3))
-                    
-                except Exception:
-                    pass  # Continue on any errors
-                    
-        self.workload_thread = threading.Thread(target=background_activity, daemon=True)
-        self.workload_thread.start()
+        self.workload_task = asyncio.run_coroutine_threadsafe(self._bg_process_task(), self._loop)
         
     def _start_comprehensive_simulation(self):
         """Start comprehensive simulation with all components"""
         self._start_background_activity()
         
         # Also add file system activity
-        def file_activity():
-            file_counter = 0
-            while self.demo_running:
-                try:
-                    file_counter += 1
-                    content = f"Dynamic file content {file_counter} created at {time.time()}"
+        asyncio.run_coroutine_threadsafe(self._bg_file_task(), self._loop)
+        
+    async def _bg_process_task(self):
+        """Keep adding and scheduling AI/blockchain processes while the demo runs"""
+        # Task-local generator, independent of the shared module-level one
+        rng = random.Random()
+        while self.demo_running:
+            try:
+                # Add random AI/blockchain processes
+                if rng.random() < 0.3:
+                    ptype = rng.choice(_PROCESS_TYPES)
                     
-                    file_path = f"/dynamic/file_{file_counter:03d}.txt"
-                    self.file_system.create_file(
-                        file_path,
-                        content.encode(),
-                        FileType.REGULAR,
-                        "demo_user"
+                    self.ai_scheduler.add_process(
+                        f"bg_proc_{int(time.time() * 1000) % 10000}",
+                        ptype,
+                        rng.uniform(0.5, 2.0),
+                        rng.uniform(50, 300)
                     )
                     
-                    # Random file operations
-                    if random.random() < 0.5:
-                        # Read a random existing file
-                        try:
-                            entries = self.file_system.list_directory("/dynamic")
-                            if entries:
-                                entry = random.choice([e for e in entries if not e.is_directory])
-                                self.file_system.read_file(f"/dynamic/{entry.name}", AccessLevel.USER)
-                        except:
-                            pass
-                            
-                    time.sleep(random.uniform(2, 5))
-                    
-                except Exception:
-                    pass
+                # Schedule processes
+                scheduled = self.ai_scheduler.schedule_next()
+                if scheduled:
+                    asyncio.create_task(self._simulate_ai_process(scheduled))
                     
-        threading.Thread(target=file_activity, daemon=True).start()
-        
-    def _simulate_traditional_scheduling(self):
-        """Simulate traditional FIFO scheduling for comparison"""
-        processes = []
-        
-        # Create test processes
-        for i in range(10):
-            ptype = random.choice(list(ProcessType))
-            estimated_time = random.uniform(0.5, 3.0)
-            processes.append({
-                "id": f"trad_{i}",
-                "type": ptype,
-                "estimated_time": estimated_time,
-                "start_time": time.time() + i * 0.1  # Sequential start
-            })
+            except Exception:
+                pass  # Continue on any errors
+                
+            await asyncio.sleep(rng.uniform(1, 3))
             
-        # Simulate FIFO execution
-        total_response = 0
-        success_count = 0
-        
-        for proc in processes:
-            # Simple FIFO - no intelligence
-            actual_time = proc["estimated_time"] * random.uniform(0.8, 1.5)
-            response_time = actual_time + random.uniform(0.1, 0.3)  # Queue waiting
+    async def _bg_file_task(self):
+        """Keep creating and reading dynamic files while the demo runs"""
+        rng = random.Random()
+        file_counter = 0
+        dynamic_files = []  # Paths created by this task, so reads skip the directory scan
+        try:
+            self.file_system.create_directory("/dynamic")
+        except FileExistsError:
+            pass
             
-            total_response += response_time
-            if random.random() < 0.85:  # 85% success rate
-                success_count += 1
+        while self.demo_running:
+            try:
+                file_counter += 1
+                content = f"Dynamic file content {file_counter} created at {time.time()}"
+                
+                file_path = f"/dynamic/file_{file_counter:03d}.txt"
+                self.file_system.create_file(
+                    file_path,
+                    content.encode(),
+                    FileType.REGULAR,
+                    "demo_user"
+                )
+                dynamic_files.append(file_path)
+                
+                # Random file operations
+                if dynamic_files and rng.random() < 0.5:
+                    # Read a random existing file
+                    try:
+                        self.file_system.read_file(rng.choice(dynamic_files), AccessLevel.USER)
+                    except OSError:
+                        pass
+                        
+            except Exception:
+                pass
                 
+            await asyncio.sleep(rng.uniform(2, 5))
+            
+    def _simulate_traditional_scheduling(self):
+        """Simulate traditional FIFO scheduling for comparison"""
+        n = 10
+        uniform = random.uniform
+        
+        # Simple FIFO - no intelligence: estimate, runtime jitter and queue wait per process
+        total_response = sum(uniform(0.5, 3.0) * uniform(0.8, 1.5) + uniform(0.1, 0.3)
+                             for _ in range(n))
+        success_count = sum(random.random() < 0.85 for _ in range(n))  # 85% success rate
+        
         return {
-            "total": len(processes),
-            "avg_response": total_response / len(processes),
-            "success_rate": (success_count / len(processes)) * 100,
+            "total": n,
+            "avg_response": total_response / n,
+            "success_rate": (success_count / n) * 100,
             "power_score": random.uniform(40, 60),
             "utilization": random.uniform(60, 75)
         }
@@ -660,10 +684,10 @@ class Step5Demo:
         initial_scheduled = self.ai_scheduler.total_scheduled
         
         # Add test processes
-        for i in range(10):
-            ptype = random.choice(list(ProcessType))
-            estimated_time = random.uniform(0.5, 3.0)
-            self.ai_scheduler.add_process(f"ai_test_{i}", ptype, estimated_time)
+        self.ai_scheduler.add_processes([
+            (f"ai_test_{i}", random.choice(_PROCESS_TYPES), random.uniform(0.5, 3.0))
+            for i in range(10)
+        ])
             
         # Let AI scheduler process them
         start_time = time.time()
@@ -673,11 +697,7 @@ class Step5Demo:
             scheduled = self.ai_scheduler.schedule_next()
             if scheduled:
                 scheduled_processes.append(scheduled)
-                threading.Thread(
-                    target=self._simulate_ai_process,
-                    args=(scheduled,),
-                    daemon=True
-                ).start()
+                self._submit_simulation(scheduled)
                 
         time.sleep(2)  # Wait for completion
         
@@ -694,37 +714,46 @@ class Step5Demo:
         
     def _generate_file_activity(self):
         """Generate file system activity for demonstration"""
-        activities = [
-            "Creating AI model checkpoint files",
-            "Updating blockchain transaction logs",
-            "Processing smart contract bytecode",
-            "Backing up critical system data",
-            "Generating performance reports"
-        ]
-        
-        for activity in activities:
+        stamp = time.ctime()
+        for activity, filename in _FILE_ACTIVITIES:
             print(f"📁 {activity}...")
             
-            # Create corresponding file
-            filename = activity.lower().replace(" ", "_") + ".dat"
-            content = f"{activity} - {time.ctime()}"
-            
             try:
                 self.file_system.create_file(
                     f"/activity/{filename}",
-                    content.encode(),
+                    f"{activity} - {stamp}".encode(),
                     FileType.REGULAR,
                     "system"
                 )
-            except:
+            except Exception:
                 pass  # Directory might not exist
                 
             time.sleep(0.5)
             
+    async def _cancel_pending_tasks(self):
+        """Cancel every other task on the demo event loop and wait for them to unwind"""
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        
     def cleanup(self):
         """Clean up demo resources"""
         self.demo_running = False
         
+        # Cancel background tasks and pending simulations, then stop the loop
+        if self._loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(self._cancel_pending_tasks(), self._loop).result(timeout=1.0)
+            except Exception:
+                pass
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join(timeout=1.0)
+            
+        # Release the loop's selector once run_forever has returned
+        if not self._loop_thread.is_alive() and not self._loop.is_closed():
+            self._loop.close()
+        
         if self.web_gui:
             self.web_gui.stop_server()
             
@@ -5,17 +5,101 @@ Real-time visualization for threading and synchronization primitives.
 
 import threading
 import time
-import os
 import sys
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
 import random
-from collections import deque
+from collections import Counter, deque, defaultdict
+import itertools
 import json
+from array import array
+import atexit
+
+# Single-key input: select/termios on POSIX, msvcrt on Windows
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+try:
+    import select
+    import termios
+    import tty
+except ImportError:
+    termios = None
 
 from thread_api import ThreadAPI, ThreadState, ThreadType, ThreadPriority, AIThread
 
+# Slotted records drop the per-instance __dict__ (dataclass slots need Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Sync event ring capacity (power of two so slots can be picked with a mask)
+EVENT_RING_SIZE = 4096
+EVENT_RING_MASK = EVENT_RING_SIZE - 1
+
+# Producer batches are published once this many events or this many seconds accumulate
+SYNC_BATCH_SIZE = 64
+SYNC_BATCH_AGE = 0.05
+
+def _strongly_connected_components(graph: Dict[str, List[str]]) -> List[List[str]]:
+    """Iterative Tarjan SCC over an adjacency dict, O(V + E)"""
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack = set()
+    components = []
+    
+    for root in graph:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph.get(root, ())))]
+        
+        while work:
+            node, successors = work[-1]
+            for succ in successors:
+                if succ not in index:
+                    index[succ] = lowlink[succ] = len(index)
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    work.append((succ, iter(graph.get(succ, ()))))
+                    break
+                if succ in on_stack:
+                    lowlink[node] = min(lowlink[node], index[succ])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+                    
+    return components
+
+# ASCII graph rows: per-row translation tables from bar height to cell character
+_GRAPH_HEIGHT = 8
+_GRAPH_ROW_TABLES = [
+    str.maketrans({chr(height): ("█" if height >= row else " ") for height in range(_GRAPH_HEIGHT + 1)})
+    for row in range(_GRAPH_HEIGHT + 1)
+]
+
+# Snapshots kept per thread and samples kept per performance metric
+SNAPSHOT_HISTORY = 50
+# Terminated threads keep their timeline this long (seconds) before eviction
+SNAPSHOT_TTL = 30.0
+# Metric samples between sweeps for terminated threads
+SNAPSHOT_SWEEP_INTERVAL = 10
+METRIC_HISTORY = 50
+
 class VisualizationMode(Enum):
     """Visualization display modes"""
     THREAD_DASHBOARD = "Thread Dashboard"
@@ -25,17 +109,50 @@ class VisualizationMode(Enum):
     PERFORMANCE_GRAPH = "Performance Graph"
     TIMELINE_VIEW = "Timeline View"
 
-@dataclass
+# Static rules and column headers, built once at import
+_RULE_50 = "─" * 50
+_RULE_60 = "─" * 60
+_RULE_70 = "─" * 70
+_RULE_80 = "─" * 80
+_RULE_100 = "─" * 100
+_ACTIVE_THREADS_HEADER = f"{'ID':<10} {'Name':<20} {'Type':<18} {'Priority':<10} {'CPU Time':<10} {'Locks':<15}"
+_LOCK_STATUS_HEADER = f"{'Lock ID':<20} {'Status':<15} {'Holder Thread':<20} {'Waiters':<15}"
+_CV_STATUS_HEADER = f"{'CV ID':<20} {'Waiting Threads':<20} {'Recent Notifications':<20}"
+_TIMELINE_HEADER = f"{'Time':<12} {'Thread':<15} {'Event':<18} {'Resource':<15} {'Status':<10} {'Wait':<8}"
+
+# Icon and title for each view's width-dependent banner
+_VIEW_TITLES = {
+    VisualizationMode.THREAD_DASHBOARD: ("🔍", "AI NODE SYNCHRONIZATION DASHBOARD"),
+    VisualizationMode.LOCK_MONITOR: ("🔒", "LOCK CONTENTION MONITOR"),
+    VisualizationMode.CONDITION_TRACKER: ("📡", "CONDITION VARIABLE TRACKER"),
+    VisualizationMode.DEADLOCK_DETECTOR: ("☠️", "DEADLOCK DETECTION SYSTEM"),
+    VisualizationMode.PERFORMANCE_GRAPH: ("📈", "PERFORMANCE METRICS"),
+    VisualizationMode.TIMELINE_VIEW: ("⏰", "SYNCHRONIZATION TIMELINE"),
+}
+
+class SyncEventType(str, Enum):
+    """Known synchronization event types (compare equal to their string values)"""
+    LOCK_ACQUIRE = "lock_acquire"
+    LOCK_RELEASE = "lock_release"
+    WAIT = "wait"
+    NOTIFY = "notify"
+    
+    def __str__(self):
+        return self.value
+
+_SYNC_EVENT_TYPES = {event_type.value: event_type for event_type in SyncEventType}
+
+@dataclass(**_SLOTS)
 class SyncEvent:
     """Synchronization event for timeline tracking"""
     timestamp: float
     thread_id: str
-    event_type: str  # "lock_acquire", "lock_release", "wait", "notify", etc.
+    event_type: str  # A SyncEventType once recorded; other strings are kept as-is
     resource_id: str
     success: bool = True
     wait_time: float = 0.0
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ThreadSnapshot:
     """Thread state snapshot for visualization"""
     thread_id: str
@@ -47,7 +164,131 @@ class ThreadSnapshot:
     memory_usage: int
     locks_held: List[str]
     waiting_for_lock: Optional[str]
-    timestamp: float = field(default_factory=time.time)
+    timestamp: float
+
+_THREAD_STATES = tuple(ThreadState)
+_STATE_INDEX = {state: i for i, state in enumerate(_THREAD_STATES)}
+
+class ThreadHistory:
+    """
+    Columnar ring of recent snapshots for one thread
+    Numeric fields live in typed arrays so trends reduce over one column at a time
+    """
+    
+    __slots__ = ("thread_id", "capacity", "count", "timestamps", "cpu_time", "memory_usage",
+                 "states", "names", "thread_types", "priorities", "locks_held", "waiting_for_lock")
+    
+    def __init__(self, thread_id: str, capacity: int = SNAPSHOT_HISTORY):
+        self.thread_id = thread_id
+        self.capacity = capacity
+        self.count = 0
+        self.timestamps = array('d', bytes(8 * capacity))
+        self.cpu_time = array('d', bytes(8 * capacity))
+        self.memory_usage = array('q', bytes(8 * capacity))
+        self.states = array('B', bytes(capacity))
+        self.names: List[Optional[str]] = [None] * capacity
+        self.thread_types: List[Optional[ThreadType]] = [None] * capacity
+        self.priorities: List[Optional[ThreadPriority]] = [None] * capacity
+        self.locks_held: List[Optional[List[str]]] = [None] * capacity
+        self.waiting_for_lock: List[Optional[str]] = [None] * capacity
+        
+    def append(self, thread: AIThread, timestamp: float):
+        """Record the thread's current state, overwriting the oldest slot when full"""
+        slot = self.count % self.capacity
+        self.timestamps[slot] = timestamp
+        self.cpu_time[slot] = thread.cpu_time
+        self.memory_usage[slot] = thread.memory_usage
+        self.states[slot] = _STATE_INDEX[thread.state]
+        self.names[slot] = thread.name
+        self.thread_types[slot] = thread.thread_type
+        self.priorities[slot] = thread.priority
+        self.locks_held[slot] = thread.locks_held.copy()
+        self.waiting_for_lock[slot] = thread.waiting_for_lock
+        self.count += 1
+        
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+        
+    @property
+    def last_state(self) -> Optional[ThreadState]:
+        """State in the most recent snapshot, or None before the first one"""
+        return _THREAD_STATES[self.states[(self.count - 1) % self.capacity]] if self.count else None
+        
+    def _slot(self, index: int) -> int:
+        """Map a chronological index (oldest = 0, negatives allowed) to a ring slot"""
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("snapshot index out of range")
+        return (self.count - size + index) % self.capacity
+        
+    def __getitem__(self, index: int) -> ThreadSnapshot:
+        slot = self._slot(index)
+        return ThreadSnapshot(
+            thread_id=self.thread_id,
+            name=self.names[slot],
+            state=_THREAD_STATES[self.states[slot]],
+            thread_type=self.thread_types[slot],
+            priority=self.priorities[slot],
+            cpu_time=self.cpu_time[slot],
+            memory_usage=self.memory_usage[slot],
+            locks_held=self.locks_held[slot],
+            waiting_for_lock=self.waiting_for_lock[slot],
+            timestamp=self.timestamps[slot]
+        )
+        
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+        
+    def column(self, name: str) -> List:
+        """Values of one numeric column in chronological order"""
+        values = getattr(self, name)
+        size = len(self)
+        start = (self.count - size) % self.capacity
+        if size < self.capacity:
+            return values[:size].tolist()
+        return (values[start:] + values[:start]).tolist()
+        
+    def mean(self, name: str) -> float:
+        """Average of one numeric column over the recorded window"""
+        size = len(self)
+        return sum(getattr(self, name)[:size]) / size if size else 0.0
+
+class MetricHistory:
+    """
+    Fixed-size ring of float samples
+    Preallocated typed storage; append overwrites the oldest sample in place
+    """
+    
+    __slots__ = ("capacity", "count", "_buf")
+    
+    def __init__(self, capacity: int = METRIC_HISTORY):
+        self.capacity = capacity
+        self.count = 0
+        self._buf = array('d', bytes(8 * capacity))
+        
+    def append(self, value: float):
+        """Record a sample"""
+        self._buf[self.count % self.capacity] = value
+        self.count += 1
+        
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+        
+    def values(self) -> List[float]:
+        """Samples in chronological order"""
+        if self.count <= self.capacity:
+            return self._buf[:self.count].tolist()
+        start = self.count % self.capacity
+        return (self._buf[start:] + self._buf[:start]).tolist()
+        
+    def __iter__(self):
+        return iter(self.values())
+        
+    def clear(self):
+        """Forget all samples, keeping the buffer"""
+        self.count = 0
 
 class SynchronizationVisualizer:
     """
@@ -60,24 +301,97 @@ class SynchronizationVisualizer:
         self.running = False
         self.visualization_thread = None
         
-        # Event tracking
-        self.sync_events: deque = deque(maxlen=1000)
-        self.thread_snapshots: Dict[str, deque] = {}
+        # Event tracking: producers store into a fixed ring of (sequence, event) slots
+        # without locking; the monitor drains it in bulk into the bounded history
+        self._event_ring: List[Optional[Tuple[int, SyncEvent]]] = [None] * EVENT_RING_SIZE
+        self._event_head = itertools.count()
+        self._event_tail = 0
+        self._drain_lock = threading.Lock()
+        self.dropped_events = 0
+        self._sync_history: deque = deque(maxlen=1000)
+        # Per-producer batches published to the ring by size/age, or by flush(); each
+        # batch has its own lock so one publisher at a time pops and numbers its events
+        self._pending = threading.local()
+        self._pending_buffers: List[Tuple[threading.Thread, deque, threading.Lock]] = []
+        self._pending_lock = threading.Lock()
+        self.thread_snapshots: Dict[str, ThreadHistory] = {}
+        self._evicted: set = set()  # Terminated ids whose history aged out; never re-snapshotted
+        self.snapshot_ttl = SNAPSHOT_TTL
+        self._samples_taken = 0
         self.performance_history: deque = deque(maxlen=100)
         
         # Visualization settings
-        self.refresh_rate = 1.0  # seconds
+        self.refresh_rate = 1.0  # seconds between metric samples and forced redraws
+        self.max_refresh_hz = 4.0  # cap on redraws triggered by state changes
         self.current_mode = VisualizationMode.THREAD_DASHBOARD
-        self.display_width = 120
+        self.display_width = 120  # Also builds the cached banners and menu block
+        
+        # Frame back-buffer: rows of the frame being built and of the one on screen
+        self._frame_buf: List[str] = []
+        self._prev_frame: List[str] = []
+        self._last_sig: Optional[tuple] = None
+        self._last_sample = 0.0
         
         # Lock dependency graph for deadlock detection
         self.lock_dependency_graph: Dict[str, set] = {}
         self.potential_deadlocks: List[Tuple[List[str], List[str]]] = []
+        # Bumped on every real edge change; lets the detector reuse its last result
+        self._graph_gen = 0
+        self._last_detect_key = None
         
         # Performance metrics
-        self.throughput_history = deque(maxlen=50)
-        self.lock_contention_history = deque(maxlen=50)
-        self.thread_utilization_history = deque(maxlen=50)
+        self.throughput_history = MetricHistory()
+        self.lock_contention_history = MetricHistory()
+        self.thread_utilization_history = MetricHistory()
+        
+    @property
+    def display_width(self) -> int:
+        """Dashboard width in columns"""
+        return self._display_width
+        
+    @display_width.setter
+    def display_width(self, width: int):
+        """Set the dashboard width and rebuild the strings that depend on it"""
+        self._display_width = width
+        self._view_headers = {
+            mode: f"{icon} " + title.center(width - 4, "═")
+            for mode, (icon, title) in _VIEW_TITLES.items()
+        }
+        self._menu_block = "\n".join([
+            "",
+            "─" * width,
+            "🎛️ CONTROLS:",
+            "  [1] Thread Dashboard  [2] Lock Monitor  [3] Condition Tracker",
+            "  [4] Deadlock Detector [5] Performance  [6] Timeline  [E] Export  [Q] Quit",
+        ])
+        
+    def reset(self):
+        """Forget all events, snapshots and metrics, reusing the buffers; settings are kept.
+        Call while monitoring is stopped."""
+        with self._pending_lock:
+            for _, buf, buf_lock in self._pending_buffers:
+                with buf_lock:
+                    buf.clear()
+        with self._drain_lock:
+            self._event_ring[:] = [None] * EVENT_RING_SIZE
+            self._event_head = itertools.count()
+            self._event_tail = 0
+            self.dropped_events = 0
+            self._sync_history.clear()
+            self.lock_dependency_graph.clear()
+            self.potential_deadlocks.clear()
+            self._graph_gen += 1
+            self._last_detect_key = None
+        self.thread_snapshots.clear()
+        self._evicted.clear()
+        self._samples_taken = 0
+        self.performance_history.clear()
+        self._frame_buf = []
+        self._prev_frame = []
+        self._last_sig = None
+        for history in (self.throughput_history, self.lock_contention_history,
+                        self.thread_utilization_history):
+            history.clear()
         
     def start_monitoring(self):
         """Start real-time monitoring"""
@@ -94,203 +408,354 @@ class SynchronizationVisualizer:
         self.running = False
         if self.visualization_thread:
             self.visualization_thread.join(timeout=2.0)
+        self.drain_sync_events()
         print("🛑 Synchronization monitoring stopped.")
         
+    @property
+    def sync_events(self) -> deque:
+        """Recent synchronization events, including any still queued in the ring"""
+        self.drain_sync_events()
+        return self._sync_history
+        
     def add_sync_event(self, event: SyncEvent):
         """Add a synchronization event for tracking"""
-        self.sync_events.append(event)
-        self._update_lock_dependency_graph(event)
+        buf, buf_lock = self._pending_buffer()
+        buf.append(event)
+        now = time.monotonic()
+        if len(buf) >= SYNC_BATCH_SIZE or now - self._pending.last_flush > SYNC_BATCH_AGE:
+            self._pending.last_flush = now
+            self._publish(buf, buf_lock)
+            
+    def add_sync_events_bulk(self, events):
+        """Add many synchronization events and publish them in one pass"""
+        buf, buf_lock = self._pending_buffer()
+        buf.extend(events)
+        self._pending.last_flush = time.monotonic()
+        self._publish(buf, buf_lock)
         
-    def take_thread_snapshot(self):
+    def flush(self):
+        """Publish every producer's buffered events to the ring"""
+        with self._pending_lock:
+            # Forget finished producers once their batches are out
+            self._pending_buffers = [entry for entry in self._pending_buffers
+                                     if entry[0].is_alive() or entry[1]]
+            buffers = [(buf, buf_lock) for _, buf, buf_lock in self._pending_buffers]
+        for buf, buf_lock in buffers:
+            self._publish(buf, buf_lock)
+            
+    def _pending_buffer(self) -> Tuple[deque, threading.Lock]:
+        """The calling thread's batch and its lock, registered on first use"""
+        buf = getattr(self._pending, "buf", None)
+        if buf is None:
+            buf = self._pending.buf = deque()
+            self._pending.buf_lock = threading.Lock()
+            self._pending.last_flush = time.monotonic()
+            with self._pending_lock:
+                self._pending_buffers.append((threading.current_thread(), buf, self._pending.buf_lock))
+        return buf, self._pending.buf_lock
+        
+    def _publish(self, buf: deque, buf_lock: threading.Lock):
+        """Move a batch into the ring; popping and numbering under the batch lock keeps
+        a producer's events in order when flush() publishes the same batch"""
+        ring = self._event_ring
+        head = self._event_head
+        with buf_lock:
+            while buf:
+                event = buf.popleft()
+                seq = next(head)
+                ring[seq & EVENT_RING_MASK] = (seq, event)
+            
+    def drain_sync_events(self) -> int:
+        """Move queued ring events into the history and dependency graph"""
+        self.flush()
+        with self._drain_lock:
+            ring = self._event_ring
+            tail = self._event_tail
+            drained = 0
+            while True:
+                slot = ring[tail & EVENT_RING_MASK]
+                if slot is None or slot[0] < tail:
+                    break  # Not written yet
+                seq, event = slot
+                if seq > tail:
+                    # Producers lapped the ring; skip to the oldest slot that can still be intact
+                    self.dropped_events += seq - EVENT_RING_SIZE + 1 - tail
+                    tail = seq - EVENT_RING_SIZE + 1
+                    continue
+                # Canonical event types and interned ids make later filters identity checks
+                event.event_type = _SYNC_EVENT_TYPES.get(event.event_type, event.event_type)
+                event.thread_id = sys.intern(event.thread_id)
+                event.resource_id = sys.intern(event.resource_id)
+                self._sync_history.append(event)
+                self._update_lock_dependency_graph(event)
+                tail += 1
+                drained += 1
+            self._event_tail = tail
+        return drained
+        
+    def take_thread_snapshot(self, threads: Optional[List[AIThread]] = None):
         """Take a snapshot of all current threads"""
-        threads = self.thread_api.list_threads()
+        if threads is None:
+            threads = self.thread_api.list_threads()
+        now = time.time()
         
         for thread in threads:
-            snapshot = ThreadSnapshot(
-                thread_id=thread.thread_id,
-                name=thread.name,
-                state=thread.state,
-                thread_type=thread.thread_type,
-                priority=thread.priority,
-                cpu_time=thread.cpu_time,
-                memory_usage=thread.memory_usage,
-                locks_held=thread.locks_held.copy(),
-                waiting_for_lock=thread.waiting_for_lock
-            )
-            
-            if thread.thread_id not in self.thread_snapshots:
-                self.thread_snapshots[thread.thread_id] = deque(maxlen=50)
-            self.thread_snapshots[thread.thread_id].append(snapshot)
+            history = self.thread_snapshots.get(thread.thread_id)
+            if history is None:
+                if thread.thread_id in self._evicted:
+                    continue  # Aged out after terminating; ThreadAPI still lists it
+                history = self.thread_snapshots[thread.thread_id] = ThreadHistory(thread.thread_id)
+            elif history.last_state is ThreadState.TERMINATED:
+                # Nothing changes after termination; keeping the last stamp lets it age out
+                continue
+            history.append(thread, now)
             
+    def _evict_dead_threads(self, threads: List[AIThread]):
+        """Drop history for threads that terminated more than snapshot_ttl ago"""
+        live = {t.thread_id for t in threads if t.state is not ThreadState.TERMINATED}
+        cutoff = time.time() - self.snapshot_ttl
+        
+        for thread_id in self.thread_snapshots.keys() - live:
+            history = self.thread_snapshots[thread_id]
+            if not len(history) or history[-1].timestamp < cutoff:
+                del self.thread_snapshots[thread_id]
+                self._evicted.add(thread_id)
+        # Only ids ThreadAPI still lists can come back, so the rest need not be remembered
+        self._evicted.intersection_update(t.thread_id for t in threads)
+                
+        # Empty wait sets of finished threads carry no edges
+        for thread_id in self.lock_dependency_graph.keys() - live:
+            if not self.lock_dependency_graph[thread_id]:
+                del self.lock_dependency_graph[thread_id]
+                
+
     def _monitoring_loop(self):
         """Main monitoring loop"""
+        # Draw on the alternate screen so the shell scrollback is left untouched
+        sys.stdout.write("\x1b[?1049h\x1b[2J")
+        self._prev_frame = []
+        self._last_sig = None
+        self._last_sample = 0.0
+        
         while self.running:
             try:
-                self._clear_screen()
-                self.take_thread_snapshot()
-                self._update_performance_metrics()
-                self._detect_potential_deadlocks()
-                
-                if self.current_mode == VisualizationMode.THREAD_DASHBOARD:
-                    self._display_thread_dashboard()
-                elif self.current_mode == VisualizationMode.LOCK_MONITOR:
-                    self._display_lock_monitor()
-                elif self.current_mode == VisualizationMode.CONDITION_TRACKER:
-                    self._display_condition_tracker()
-                elif self.current_mode == VisualizationMode.DEADLOCK_DETECTOR:
-                    self._display_deadlock_detector()
-                elif self.current_mode == VisualizationMode.PERFORMANCE_GRAPH:
-                    self._display_performance_graph()
-                elif self.current_mode == VisualizationMode.TIMELINE_VIEW:
-                    self._display_timeline_view()
-                    
-                self._display_menu()
-                
+                dirty = self._build_frame()
             except Exception as e:
-                print(f"❌ Monitoring error: {e}")
+                self._frame_buf = []
+                self._emit(f"❌ Monitoring error: {e}")
+                dirty = True
                 
-            time.sleep(self.refresh_rate)
+            if dirty:
+                self._render_frame()
+            time.sleep(1.0 / self.max_refresh_hz)
             
-    def _clear_screen(self):
-        """Clear the terminal screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        sys.stdout.write("\x1b[?1049l")
+        sys.stdout.flush()
+        
+    def _build_frame(self) -> bool:
+        """Build the next frame; returns False when nothing visible has changed"""
+        self.drain_sync_events()
+        
+        # Thread table and stats are read once and shared by the whole frame
+        threads = self.thread_api.list_threads()
+        stats = self.thread_api.get_system_stats()
+        
+        # Metrics are sampled every refresh_rate; in between, redraw only on state changes
+        now = time.monotonic()
+        sample_due = now - self._last_sample >= self.refresh_rate
+        sig = (self.current_mode, self._graph_gen, self._event_tail,
+               stats['total_threads_created'], stats['total_threads_completed'], stats['active_threads'])
+        if not sample_due and sig == self._last_sig:
+            return False
+        self._last_sig = sig
+        
+        if sample_due:
+            self._last_sample = now
+            self.take_thread_snapshot(threads)
+            self._samples_taken += 1
+            if self._samples_taken % SNAPSHOT_SWEEP_INTERVAL == 0:
+                self._evict_dead_threads(threads)
+            self._update_performance_metrics(stats)
+            
+        # One pass over the threads answers every holder/waiter query this frame
+        holder_of, waiters_of = self._index_locks(threads)
+        self._detect_potential_deadlocks(holder_of, waiters_of)
+        
+        if self.current_mode == VisualizationMode.THREAD_DASHBOARD:
+            self._display_thread_dashboard(stats)
+        elif self.current_mode == VisualizationMode.LOCK_MONITOR:
+            self._display_lock_monitor(holder_of, waiters_of)
+        elif self.current_mode == VisualizationMode.CONDITION_TRACKER:
+            self._display_condition_tracker(self._index_cv_waiters(threads))
+        elif self.current_mode == VisualizationMode.DEADLOCK_DETECTOR:
+            self._display_deadlock_detector()
+        elif self.current_mode == VisualizationMode.PERFORMANCE_GRAPH:
+            self._display_performance_graph(stats)
+        elif self.current_mode == VisualizationMode.TIMELINE_VIEW:
+            self._display_timeline_view()
+            
+        self._display_menu()
+        return True
+        
+    def _emit(self, text: str = ""):
+        """Queue dashboard text for the current frame"""
+        self._frame_buf.extend(text.split("\n"))
+        
+    def _render_frame(self):
+        """Redraw only the rows that changed since the previous frame"""
+        frame = self._frame_buf
+        out = [f"\x1b[{row};1H\x1b[2K{new}"
+               for row, (old, new) in enumerate(itertools.zip_longest(self._prev_frame, frame, fillvalue=""), 1)
+               if old != new]
+        out.append(f"\x1b[{len(frame) + 1};1H")
+        
+        # One write per frame keeps it from interleaving with other output
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+        
+        self._prev_frame = frame
+        self._frame_buf = []
         
-    def _display_thread_dashboard(self):
+    def _display_thread_dashboard(self, stats: dict):
         """Display the main thread dashboard"""
-        print("🔍 " + "AI NODE SYNCHRONIZATION DASHBOARD".center(self.display_width - 4, "═"))
-        print()
+        self._emit(self._view_headers[VisualizationMode.THREAD_DASHBOARD])
+        self._emit()
         
         # System overview
-        stats = self.thread_api.get_system_stats()
-        print(f"⏱️  System Uptime: {stats['uptime']:.2f}s")
-        print(f"🔢 Active Threads: {stats['active_threads']}")
-        print(f"📊 CPU Utilization: {stats['average_cpu_utilization']:.1f}%")
-        print(f"🔒 Active Locks: {stats['locks_count']}")
-        print(f"📡 Condition Variables: {stats['condition_variables_count']}")
-        print()
+        self._emit(f"⏱️  System Uptime: {stats['uptime']:.2f}s")
+        self._emit(f"🔢 Active Threads: {stats['active_threads']}")
+        self._emit(f"📊 CPU Utilization: {stats['average_cpu_utilization']:.1f}%")
+        self._emit(f"🔒 Active Locks: {stats['locks_count']}")
+        self._emit(f"📡 Condition Variables: {stats['condition_variables_count']}")
+        self._emit()
         
         # Thread state summary
-        print("📋 THREAD STATE SUMMARY:")
-        print("─" * 60)
+        self._emit("📋 THREAD STATE SUMMARY:")
+        self._emit(_RULE_60)
         state_icons = {
             "CREATED": "🆕", "READY": "⏳", "RUNNING": "🟢",
             "BLOCKED": "🔴", "WAITING": "🔵", "TERMINATED": "⚫", "SUSPENDED": "⏸️"
         }
         
-        for state, count in stats['threads_by_state'].items():
+        for state, ids in self.thread_api.thread_ids_by_state.items():
+            count = len(ids)
             if count > 0:
-                icon = state_icons.get(state, "❓")
-                print(f"  {icon} {state}: {count}")
-        print()
+                icon = state_icons.get(state.value, "❓")
+                self._emit(f"  {icon} {state.value}: {count}")
+        self._emit()
         
         # Active threads details
         active_threads = self.thread_api.list_running_threads()
         if active_threads:
-            print("🏃 ACTIVE THREADS:")
-            print("─" * 100)
-            print(f"{'ID':<10} {'Name':<20} {'Type':<18} {'Priority':<10} {'CPU Time':<10} {'Locks':<15}")
-            print("─" * 100)
+            self._emit("🏃 ACTIVE THREADS:")
+            self._emit(_RULE_100)
+            self._emit(_ACTIVE_THREADS_HEADER)
+            self._emit(_RULE_100)
             
             for thread in active_threads[:10]:  # Show top 10
                 locks_str = f"{len(thread.locks_held)} held"
                 if thread.waiting_for_lock:
                     locks_str += f", waiting: {thread.waiting_for_lock[:8]}"
                     
-                print(f"{thread.thread_id:<10} {thread.name[:19]:<20} "
+                self._emit(f"{thread.thread_id:<10} {thread.name[:19]:<20} "
                       f"{thread.thread_type.value[:17]:<18} {thread.priority.name:<10} "
                       f"{thread.cpu_time:.3f}s    {locks_str[:14]:<15}")
         else:
-            print("💤 No active threads")
+            self._emit("💤 No active threads")
             
-        print()
+        self._emit()
         
         # Thread type distribution
-        print("🎯 THREAD TYPE DISTRIBUTION:")
-        print("─" * 60)
+        self._emit("🎯 THREAD TYPE DISTRIBUTION:")
+        self._emit(_RULE_60)
         for thread_type, count in stats['threads_by_type'].items():
             if count > 0:
                 bar_length = min(count * 2, 30)
                 bar = "█" * bar_length
-                print(f"  {thread_type[:25]:<25} {bar} {count}")
+                self._emit(f"  {thread_type[:25]:<25} {bar} {count}")
                 
-    def _display_lock_monitor(self):
+    def _display_lock_monitor(self, holder_of: Dict[str, str], waiters_of: Dict[str, List[str]]):
         """Display lock monitoring view"""
-        print("🔒 " + "LOCK CONTENTION MONITOR".center(self.display_width - 4, "═"))
-        print()
+        self._emit(self._view_headers[VisualizationMode.LOCK_MONITOR])
+        self._emit()
         
         # Lock status
         locks = self.thread_api.locks
-        print(f"🔢 Total Locks: {len(locks)}")
-        print()
+        self._emit(f"🔢 Total Locks: {len(locks)}")
+        self._emit()
         
         if locks:
-            print("🔒 LOCK STATUS:")
-            print("─" * 80)
-            print(f"{'Lock ID':<20} {'Status':<15} {'Holder Thread':<20} {'Waiters':<15}")
-            print("─" * 80)
+            self._emit("🔒 LOCK STATUS:")
+            self._emit(_RULE_80)
+            self._emit(_LOCK_STATUS_HEADER)
+            self._emit(_RULE_80)
             
             for lock_id in locks:
                 # Simplified status checking (in real implementation, would need more tracking)
-                status = "🟢 Available" if not self._is_lock_held(lock_id) else "🔴 Held"
-                holder = self._get_lock_holder(lock_id) or "None"
-                waiters = len(self._get_lock_waiters(lock_id))
+                status = "🔴 Held" if lock_id in holder_of else "🟢 Available"
+                holder = holder_of.get(lock_id, "None")
+                waiters = len(waiters_of.get(lock_id, ()))
                 
-                print(f"{lock_id[:19]:<20} {status:<15} {holder[:19]:<20} {waiters:<15}")
+                self._emit(f"{lock_id[:19]:<20} {status:<15} {holder[:19]:<20} {waiters:<15}")
         else:
-            print("💤 No locks created")
+            self._emit("💤 No locks created")
             
-        print()
+        self._emit()
         
         # Lock contention graph
         if self.lock_contention_history:
-            print("📊 LOCK CONTENTION OVER TIME:")
-            self._draw_simple_graph(list(self.lock_contention_history), "Contention")
+            self._emit("📊 LOCK CONTENTION OVER TIME:")
+            self._draw_simple_graph(self.lock_contention_history.values(), "Contention")
             
-    def _display_condition_tracker(self):
+    def _display_condition_tracker(self, cv_waiters_of: Dict[str, List[str]]):
         """Display condition variable tracking"""
-        print("📡 " + "CONDITION VARIABLE TRACKER".center(self.display_width - 4, "═"))
-        print()
+        self._emit(self._view_headers[VisualizationMode.CONDITION_TRACKER])
+        self._emit()
         
         cvs = self.thread_api.condition_variables
-        print(f"🔢 Total Condition Variables: {len(cvs)}")
-        print()
+        self._emit(f"🔢 Total Condition Variables: {len(cvs)}")
+        self._emit()
         
         if cvs:
-            print("📡 CONDITION VARIABLE STATUS:")
-            print("─" * 70)
-            print(f"{'CV ID':<20} {'Waiting Threads':<20} {'Recent Notifications':<20}")
-            print("─" * 70)
+            self._emit("📡 CONDITION VARIABLE STATUS:")
+            self._emit(_RULE_70)
+            self._emit(_CV_STATUS_HEADER)
+            self._emit(_RULE_70)
             
+            events = self.sync_events
+            recent_notifications_of = Counter(
+                e.resource_id for e in itertools.islice(events, max(len(events) - 20, 0), None)
+                if e.event_type is SyncEventType.NOTIFY
+            )
             for cv_id in cvs:
-                waiting_count = len(self._get_cv_waiters(cv_id))
-                recent_notifications = len([e for e in list(self.sync_events)[-20:] 
-                                          if e.resource_id == cv_id and e.event_type == "notify"])
+                waiting_count = len(cv_waiters_of.get(cv_id, ()))
+                recent_notifications = recent_notifications_of[cv_id]
                 
-                print(f"{cv_id[:19]:<20} {waiting_count:<20} {recent_notifications:<20}")
+                self._emit(f"{cv_id[:19]:<20} {waiting_count:<20} {recent_notifications:<20}")
         else:
-            print("💤 No condition variables created")
+            self._emit("💤 No condition variables created")
             
     def _display_deadlock_detector(self):
         """Display deadlock detection results"""
-        print("☠️ " + "DEADLOCK DETECTION SYSTEM".center(self.display_width - 4, "═"))
-        print()
+        self._emit(self._view_headers[VisualizationMode.DEADLOCK_DETECTOR])
+        self._emit()
         
         if self.potential_deadlocks:
-            print("⚠️ POTENTIAL DEADLOCKS DETECTED:")
-            print("─" * 80)
+            self._emit("⚠️ POTENTIAL DEADLOCKS DETECTED:")
+            self._emit(_RULE_80)
             
             for i, (cycle, threads) in enumerate(self.potential_deadlocks):
-                print(f"🚨 Deadlock {i+1}:")
-                print(f"   Lock Cycle: {' → '.join(cycle)} → {cycle[0]}")
-                print(f"   Involved Threads: {', '.join(threads)}")
-                print()
+                self._emit(f"🚨 Deadlock {i+1}:")
+                self._emit(f"   Lock Cycle: {' → '.join(cycle)} → {cycle[0]}")
+                self._emit(f"   Involved Threads: {', '.join(threads)}")
+                self._emit()
         else:
-            print("✅ No deadlocks detected")
-            print()
+            self._emit("✅ No deadlocks detected")
+            self._emit()
             
         # Wait-for graph visualization
-        print("🕸️ LOCK DEPENDENCY GRAPH:")
-        print("─" * 60)
+        self._emit("🕸️ LOCK DEPENDENCY GRAPH:")
+        self._emit(_RULE_60)
         
         if self.lock_dependency_graph:
             for thread_id, waiting_locks in self.lock_dependency_graph.items():
@@ -298,101 +763,92 @@ class SynchronizationVisualizer:
                     locks_str = ", ".join(list(waiting_locks)[:3])
                     if len(waiting_locks) > 3:
                         locks_str += "..."
-                    print(f"  {thread_id[:15]} waiting for: {locks_str}")
+                    self._emit(f"  {thread_id[:15]} waiting for: {locks_str}")
         else:
-            print("  📭 No dependencies")
+            self._emit("  📭 No dependencies")
             
-    def _display_performance_graph(self):
+    def _display_performance_graph(self, stats: dict):
         """Display performance metrics graphs"""
-        print("📈 " + "PERFORMANCE METRICS".center(self.display_width - 4, "═"))
-        print()
+        self._emit(self._view_headers[VisualizationMode.PERFORMANCE_GRAPH])
+        self._emit()
         
         # Throughput graph
         if self.throughput_history:
-            print("🚀 SYSTEM THROUGHPUT (operations/sec):")
-            self._draw_simple_graph(list(self.throughput_history), "Ops/sec")
-            print()
+            self._emit("🚀 SYSTEM THROUGHPUT (operations/sec):")
+            self._draw_simple_graph(self.throughput_history.values(), "Ops/sec")
+            self._emit()
             
         # Thread utilization
         if self.thread_utilization_history:
-            print("⚡ THREAD UTILIZATION (%):")
-            self._draw_simple_graph(list(self.thread_utilization_history), "CPU %")
-            print()
+            self._emit("⚡ THREAD UTILIZATION (%):")
+            self._draw_simple_graph(self.thread_utilization_history.values(), "CPU %")
+            self._emit()
             
         # Recent performance summary
-        stats = self.thread_api.get_system_stats()
-        print("📊 CURRENT METRICS:")
-        print("─" * 50)
-        print(f"  🔄 Threads Created: {stats['total_threads_created']}")
-        print(f"  ✅ Threads Completed: {stats['total_threads_completed']}")
-        print(f"  ⚡ Active Threads: {stats['active_threads']}")
-        print(f"  🕐 Total CPU Time: {stats['total_cpu_time']:.2f}s")
+        self._emit("📊 CURRENT METRICS:")
+        self._emit(_RULE_50)
+        self._emit(f"  🔄 Threads Created: {stats['total_threads_created']}")
+        self._emit(f"  ✅ Threads Completed: {stats['total_threads_completed']}")
+        self._emit(f"  ⚡ Active Threads: {stats['active_threads']}")
+        self._emit(f"  🕐 Total CPU Time: {stats['total_cpu_time']:.2f}s")
         
     def _display_timeline_view(self):
         """Display timeline of recent synchronization events"""
-        print("⏰ " + "SYNCHRONIZATION TIMELINE".center(self.display_width - 4, "═"))
-        print()
+        self._emit(self._view_headers[VisualizationMode.TIMELINE_VIEW])
+        self._emit()
         
         recent_events = list(self.sync_events)[-20:]  # Last 20 events
         
         if recent_events:
-            print("📅 RECENT SYNCHRONIZATION EVENTS:")
-            print("─" * 100)
-            print(f"{'Time':<12} {'Thread':<15} {'Event':<18} {'Resource':<15} {'Status':<10} {'Wait':<8}")
-            print("─" * 100)
+            self._emit("📅 RECENT SYNCHRONIZATION EVENTS:")
+            self._emit(_RULE_100)
+            self._emit(_TIMELINE_HEADER)
+            self._emit(_RULE_100)
             
             for event in recent_events:
                 time_str = f"{event.timestamp:.3f}"[-9:]  # Last 9 chars of timestamp
                 status = "✅ Success" if event.success else "❌ Failed"
                 wait_str = f"{event.wait_time:.3f}s" if event.wait_time > 0 else "-"
                 
-                print(f"{time_str:<12} {event.thread_id[:14]:<15} {event.event_type[:17]:<18} "
+                self._emit(f"{time_str:<12} {event.thread_id[:14]:<15} {event.event_type[:17]:<18} "
                       f"{event.resource_id[:14]:<15} {status:<10} {wait_str:<8}")
         else:
-            print("📭 No synchronization events recorded")
+            self._emit("📭 No synchronization events recorded")
             
     def _display_menu(self):
         """Display interactive menu"""
-        print("\n" + "─" * self.display_width)
-        print("🎛️ CONTROLS:")
-        print("  [1] Thread Dashboard  [2] Lock Monitor  [3] Condition Tracker")
-        print("  [4] Deadlock Detector [5] Performance  [6] Timeline  [Q] Quit")
-        print(f"  Current: {self.current_mode.value} | Refresh: {self.refresh_rate}s")
+        self._emit(self._menu_block)
+        self._emit(f"  Current: {self.current_mode.value} | Refresh: {self.refresh_rate}s")
         
     def _draw_simple_graph(self, data: List[float], label: str):
         """Draw a simple ASCII graph"""
         if not data:
             return
             
-        max_val = max(data) if data else 1
-        min_val = min(data) if data else 0
-        graph_height = 8
+        graph_height = _GRAPH_HEIGHT
         graph_width = min(60, len(data))
+        window = data[-graph_width:]
+        max_val = max(data)
+        min_val = min(data)
         
-        # Normalize data
+        # Normalize data into one code point per column (its bar height)
         if max_val == min_val:
-            normalized = [graph_height // 2] * len(data)
+            heights = chr(graph_height // 2) * graph_width
         else:
-            normalized = [int((val - min_val) / (max_val - min_val) * graph_height) 
-                         for val in data[-graph_width:]]
+            span = max_val - min_val
+            heights = "".join([chr(int((val - min_val) / span * graph_height)) for val in window])
         
-        # Draw graph
+        # Draw graph: each row is one C-level translate of the height string
         for row in range(graph_height, -1, -1):
-            line = f"{(min_val + (max_val - min_val) * row / graph_height):6.1f} │"
-            for val in normalized:
-                if val >= row:
-                    line += "█"
-                else:
-                    line += " "
-            print(line)
+            self._emit(f"{(min_val + (max_val - min_val) * row / graph_height):6.1f} │"
+                       + heights.translate(_GRAPH_ROW_TABLES[row]))
             
         # X-axis
-        print("       └" + "─" * graph_width)
-        print(f"        {label} (last {len(normalized)} samples)")
+        self._emit("       └" + "─" * graph_width)
+        self._emit(f"        {label} (last {graph_width} samples)")
         
-    def _update_performance_metrics(self):
+    def _update_performance_metrics(self, stats: dict):
         """Update performance tracking metrics"""
-        stats = self.thread_api.get_system_stats()
         
         # Calculate throughput (completed threads per second)
         if hasattr(self, '_last_completed'):
@@ -402,8 +858,7 @@ class SynchronizationVisualizer:
         self._last_completed = stats['total_threads_completed']
         
         # Calculate lock contention (simplified)
-        blocked_threads = len([t for t in self.thread_api.list_threads() 
-                              if t.state == ThreadState.BLOCKED])
+        blocked_threads = len(self.thread_api.thread_ids_by_state[ThreadState.BLOCKED])
         contention = blocked_threads / max(stats['active_threads'], 1) * 100
         self.lock_contention_history.append(contention)
         
@@ -412,57 +867,84 @@ class SynchronizationVisualizer:
         
     def _update_lock_dependency_graph(self, event: SyncEvent):
         """Update lock dependency graph for deadlock detection"""
-        if event.event_type == "lock_acquire":
+        if event.event_type is SyncEventType.LOCK_ACQUIRE:
             if event.thread_id not in self.lock_dependency_graph:
                 self.lock_dependency_graph[event.thread_id] = set()
-            if not event.success:
-                self.lock_dependency_graph[event.thread_id].add(event.resource_id)
-        elif event.event_type == "lock_release":
-            if event.thread_id in self.lock_dependency_graph:
-                self.lock_dependency_graph[event.thread_id].discard(event.resource_id)
+            waiting = self.lock_dependency_graph[event.thread_id]
+            if not event.success and event.resource_id not in waiting:
+                waiting.add(event.resource_id)
+                self._graph_gen += 1
+        elif event.event_type is SyncEventType.LOCK_RELEASE:
+            waiting = self.lock_dependency_graph.get(event.thread_id)
+            if waiting and event.resource_id in waiting:
+                waiting.discard(event.resource_id)
+                self._graph_gen += 1
                 
-    def _detect_potential_deadlocks(self):
-        """Simple deadlock detection using cycle detection"""
-        # This is a simplified implementation
-        # In practice, would use more sophisticated algorithms like DFS cycle detection
-        self.potential_deadlocks.clear()
+    def _detect_potential_deadlocks(self, holder_of: Dict[str, str], waiters_of: Dict[str, List[str]]):
+        """Find wait-for cycles as strongly connected components (Tarjan)"""
+        # Skip the search when neither the dependency graph nor live lock state moved;
+        # both carry version counters, so the check costs nothing per edge
+        cache_key = (self._graph_gen, self.thread_api.lock_state_version)
+        if cache_key == self._last_detect_key:
+            return
+        self._last_detect_key = cache_key
         
-        # Check for circular dependencies
+        # Locks each thread waits on: failed acquires from events plus live waits
+        waits: Dict[str, set] = defaultdict(set)
         for thread_id, waiting_locks in self.lock_dependency_graph.items():
+            waits[thread_id].update(waiting_locks)
+        for lock_id, waiters in waiters_of.items():
+            for thread_id in waiters:
+                waits[thread_id].add(lock_id)
+                
+        # Wait-for graph: waiting thread -> thread holding the awaited lock
+        graph: Dict[str, List[str]] = {}
+        edge_lock: Dict[Tuple[str, str], str] = {}
+        for thread_id, waiting_locks in waits.items():
+            targets = []
             for lock_id in waiting_locks:
-                holder = self._get_lock_holder(lock_id)
-                if holder and holder in self.lock_dependency_graph:
-                    holder_waiting = self.lock_dependency_graph[holder]
-                    # Check if holder is waiting for any lock that this thread holds
-                    thread_locks = set(self.thread_api.get_thread_info(thread_id).locks_held) if thread_id in self.thread_api.threads else set()
-                    if holder_waiting.intersection(thread_locks):
-                        cycle = [lock_id, list(holder_waiting)[0] if holder_waiting else "unknown"]
-                        threads = [thread_id, holder]
-                        if (cycle, threads) not in self.potential_deadlocks:
-                            self.potential_deadlocks.append((cycle, threads))
-                            
-    def _is_lock_held(self, lock_id: str) -> bool:
-        """Check if a lock is currently held"""
-        # Simplified check - in practice would need better tracking
-        return any(lock_id in thread.locks_held 
-                  for thread in self.thread_api.list_threads())
-                  
-    def _get_lock_holder(self, lock_id: str) -> Optional[str]:
-        """Get the thread holding a specific lock"""
-        for thread in self.thread_api.list_threads():
-            if lock_id in thread.locks_held:
-                return thread.thread_id
-        return None
-        
-    def _get_lock_waiters(self, lock_id: str) -> List[str]:
-        """Get threads waiting for a specific lock"""
-        return [thread.thread_id for thread in self.thread_api.list_threads()
-                if thread.waiting_for_lock == lock_id]
+                holder = holder_of.get(lock_id)
+                if holder is not None:
+                    targets.append(holder)
+                    edge_lock[(thread_id, holder)] = lock_id
+            if targets:
+                graph[thread_id] = targets
                 
-    def _get_cv_waiters(self, cv_id: str) -> List[str]:
-        """Get threads waiting on a condition variable"""
-        return [thread.thread_id for thread in self.thread_api.list_threads()
-                if thread.state == ThreadState.WAITING]
+        held_by: Dict[str, set] = defaultdict(set)
+        for lock_id, holder in holder_of.items():
+            held_by[holder].add(lock_id)
+            
+        self.potential_deadlocks.clear()
+        for component in _strongly_connected_components(graph):
+            if len(component) == 1 and component[0] not in graph.get(component[0], ()):
+                continue
+            # Threads that all hold a common (gate) lock cannot deadlock on each other
+            if set.intersection(*(held_by[t] for t in component)):
+                continue
+                
+            members = set(component)
+            threads = component[::-1]  # Discovery order along the wait-for edges
+            cycle = [edge_lock[(t, h)] for t in threads for h in graph[t] if h in members][:len(threads)]
+            self.potential_deadlocks.append((cycle, threads))
+            
+    def _index_locks(self, threads: List[AIThread]) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+        """Map each lock to its holder and its waiting threads in one pass"""
+        holder_of: Dict[str, str] = {}
+        waiters_of: Dict[str, List[str]] = defaultdict(list)
+        for thread in threads:
+            for lock_id in thread.locks_held:
+                holder_of[lock_id] = thread.thread_id
+            if thread.waiting_for_lock:
+                waiters_of[thread.waiting_for_lock].append(thread.thread_id)
+        return holder_of, waiters_of
+        
+    def _index_cv_waiters(self, threads: List[AIThread]) -> Dict[str, List[str]]:
+        """Map each condition variable to the threads currently waiting on it"""
+        waiters_of: Dict[str, List[str]] = defaultdict(list)
+        for thread in threads:
+            if thread.state == ThreadState.WAITING and thread.waiting_for_condition:
+                waiters_of[thread.waiting_for_condition].append(thread.thread_id)
+        return waiters_of
                 
     def switch_mode(self, mode: VisualizationMode):
         """Switch visualization mode"""
@@ -474,30 +956,32 @@ class SynchronizationVisualizer:
         
     def export_monitoring_data(self, filename: str):
         """Export monitoring data to JSON file"""
-        data = {
-            "timestamp": time.time(),
-            "sync_events": [
-                {
+        dumps = json.dumps
+        with open(filename, 'w') as f:
+            # Events are streamed one record at a time instead of building the whole list
+            f.write(f'{{"timestamp":{dumps(time.time())},"sync_events":[')
+            for i, event in enumerate(self.sync_events):
+                if i:
+                    f.write(",")
+                f.write(dumps({
                     "timestamp": event.timestamp,
                     "thread_id": event.thread_id,
                     "event_type": event.event_type,
                     "resource_id": event.resource_id,
                     "success": event.success,
                     "wait_time": event.wait_time
-                }
-                for event in self.sync_events
-            ],
-            "performance_metrics": {
-                "throughput_history": list(self.throughput_history),
-                "lock_contention_history": list(self.lock_contention_history),
-                "thread_utilization_history": list(self.thread_utilization_history)
-            },
-            "system_stats": self.thread_api.get_system_stats(),
-            "potential_deadlocks": self.potential_deadlocks
-        }
-        
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+                }))
+            f.write('],"performance_metrics":')
+            f.write(dumps({
+                "throughput_history": self.throughput_history.values(),
+                "lock_contention_history": self.lock_contention_history.values(),
+                "thread_utilization_history": self.thread_utilization_history.values()
+            }))
+            f.write(',"system_stats":')
+            f.write(dumps(self.thread_api.get_system_stats()))
+            f.write(',"potential_deadlocks":')
+            f.write(dumps(self.potential_deadlocks))
+            f.write("}")
         print(f"📊 Monitoring data exported to {filename}")
 
 class InteractiveMonitor:
@@ -507,6 +991,7 @@ class InteractiveMonitor:
         self.visualizer = visualizer
         self.running = False
         self.input_thread = None
+        self._saved_tty = None
         
     def start_interactive_mode(self):
         """Start interactive monitoring mode"""
@@ -514,10 +999,11 @@ class InteractiveMonitor:
             return
             
         self.running = True
+        self._enter_cbreak()
         self.visualizer.start_monitoring()
         
         print("🎮 Interactive monitoring started!")
-        print("📝 Use number keys to switch views, 'q' to quit")
+        print("📝 Use number keys to switch views, 'e' to export, 'q' to quit")
         
         self.input_thread = threading.Thread(target=self._input_handler, daemon=True)
         self.input_thread.start()
@@ -526,31 +1012,63 @@ class InteractiveMonitor:
         """Stop interactive monitoring"""
         self.running = False
         self.visualizer.stop_monitoring()
+        self._restore_terminal()
+        
+    def _enter_cbreak(self):
+        """Deliver keys one at a time without waiting for Enter (POSIX terminals)"""
+        if termios is None or not sys.stdin.isatty():
+            return
+        fd = sys.stdin.fileno()
+        self._saved_tty = termios.tcgetattr(fd)
+        tty.setcbreak(fd)
+        atexit.register(self._restore_terminal)
+        
+    def _restore_terminal(self):
+        """Put the terminal back the way start_interactive_mode found it"""
+        if self._saved_tty is not None:
+            termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, self._saved_tty)
+            self._saved_tty = None
+            
+    def _read_key(self, timeout: float = 0.05) -> Optional[str]:
+        """Return one pending key, or None if nothing arrives within the timeout"""
+        if msvcrt is not None:
+            if msvcrt.kbhit():
+                return msvcrt.getwch()
+            time.sleep(timeout)
+            return None
+            
+        ready, _, _ = select.select([sys.stdin], [], [], timeout)
+        if not ready:
+            return None
+        key = sys.stdin.read(1)
+        if not key:
+            raise EOFError
+        return key
         
     def _input_handler(self):
         """Handle user input for mode switching"""
+        modes = {
+            '1': VisualizationMode.THREAD_DASHBOARD,
+            '2': VisualizationMode.LOCK_MONITOR,
+            '3': VisualizationMode.CONDITION_TRACKER,
+            '4': VisualizationMode.DEADLOCK_DETECTOR,
+            '5': VisualizationMode.PERFORMANCE_GRAPH,
+            '6': VisualizationMode.TIMELINE_VIEW,
+        }
+        
         while self.running:
             try:
-                # Note: In a real terminal application, you'd use proper input handling
-                # This is simplified for demonstration
-                key = input().strip().lower()
+                key = self._read_key()
+                if key is None:
+                    continue
+                key = key.lower()
                 
                 if key == 'q':
                     self.stop_interactive_mode()
                     break
-                elif key == '1':
-                    self.visualizer.switch_mode(VisualizationMode.THREAD_DASHBOARD)
-                elif key == '2':
-                    self.visualizer.switch_mode(VisualizationMode.LOCK_MONITOR)
-                elif key == '3':
-                    self.visualizer.switch_mode(VisualizationMode.CONDITION_TRACKER)
-                elif key == '4':
-                    self.visualizer.switch_mode(VisualizationMode.DEADLOCK_DETECTOR)
-                elif key == '5':
-                    self.visualizer.switch_mode(VisualizationMode.PERFORMANCE_GRAPH)
-                elif key == '6':
-                    self.visualizer.switch_mode(VisualizationMode.TIMELINE_VIEW)
-                elif key.startswith('export'):
+                elif key in modes:
+                    self.visualizer.switch_mode(modes[key])
+                elif key == 'e':
                     filename = f"sync_monitoring_{int(time.time())}.json"
                     self.visualizer.export_monitoring_data(filename)
                     
@@ -560,4 +1078,4 @@ class InteractiveMonitor:
             except Exception as e:
                 print(f"❌ Input error: {e}")
                 
-        print("🛑 Interactive monitoring stopped.") 
\ No newline at end of file
+        print("🛑 Interactive monitoring stopped.")
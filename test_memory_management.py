@@ -6,6 +6,10 @@ Tests paging, address translation, swapping, fragmentation, and AI-specific feat
 
 import unittest
 import time
+import io
+import json
+import base64
+from concurrent.futures import ThreadPoolExecutor
 from memory_manager import MemoryManager, MemoryType, PageState
 from memory_visualizer import MemoryVisualizer
 from integrated_process_manager import IntegratedProcessManager
@@ -15,9 +19,14 @@ from schedulers import RoundRobinScheduler
 class TestMemoryManager(unittest.TestCase):
     """Test cases for MemoryManager"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the manager once; each test starts from reset()"""
+        cls.memory_manager = MemoryManager(total_memory=16*1024*1024, page_size=4096)  # 16MB for testing
+    
     def setUp(self):
         """Set up test environment"""
-        self.memory_manager = MemoryManager(total_memory=16*1024*1024, page_size=4096)  # 16MB for testing
+        self.memory_manager.reset()
     
     def test_memory_initialization(self):
         """Test memory manager initialization"""
@@ -181,6 +190,47 @@ class TestMemoryManager(unittest.TestCase):
         frag_after = self.memory_manager.calculate_fragmentation()
         self.assertLessEqual(frag_after, frag_before)
     
+    def test_slab_reuse(self):
+        """Equal-size allocations reuse a released run from its size class"""
+        first = self.memory_manager.allocate_memory(700, 2 * 4096, MemoryType.USER)
+        self.assertIsNotNone(first)
+        run = self.memory_manager.process_runs[700][0]
+        
+        self.memory_manager.cleanup_process_memory(700)
+        self.assertEqual(self.memory_manager.free_pages.slabs[2], [run])
+        self.assertEqual(len(self.memory_manager.free_pages), 4096)
+        
+        self.memory_manager.allocate_memory(701, 2 * 4096, MemoryType.USER)
+        self.assertEqual(self.memory_manager.process_runs[701][0], run)
+        self.assertEqual(self.memory_manager.free_pages.slabs[2], [])
+    
+    def test_reset(self):
+        """Reset frees every frame and forgets processes and metrics"""
+        self.memory_manager.allocate_memory(800, 64 * 1024, MemoryType.USER)
+        self.memory_manager.access_memory(800, 0x1000)
+        
+        self.memory_manager.reset()
+        self.assertEqual(len(self.memory_manager.free_pages), 4096)
+        self.assertEqual(self.memory_manager.page_tables, {})
+        self.assertEqual(self.memory_manager.memory_accesses, 0)
+        self.assertEqual(self.memory_manager.calculate_fragmentation(), 0.0)
+    
+    def test_defragmentation_compacts_pages(self):
+        """Compaction packs movable pages low and keeps their mappings valid"""
+        addresses = {pid: self.memory_manager.allocate_memory(pid, 4096, MemoryType.USER)
+                     for pid in range(900, 910)}
+        for pid in range(900, 910, 2):
+            self.memory_manager.cleanup_process_memory(pid)
+            del addresses[pid]
+        self.assertGreater(self.memory_manager.calculate_fragmentation(), 0.0)
+        
+        self.assertGreater(self.memory_manager.defragment_memory(), 0)
+        self.assertEqual(self.memory_manager.calculate_fragmentation(), 0.0)
+        for pid, address in addresses.items():
+            physical_addr, success = self.memory_manager.page_tables[pid].translate_address(address)
+            self.assertTrue(success)
+            self.assertLess(physical_addr, len(addresses) * 4096)
+    
     def test_memory_cleanup(self):
         """Test process memory cleanup"""
         process_id = 500
@@ -198,13 +248,28 @@ class TestMemoryManager(unittest.TestCase):
         # Verify cleanup
         self.assertNotIn(process_id, self.memory_manager.page_tables)
 
+    def test_zero_byte_allocation_cleanup(self):
+        """A zero-byte allocation records no run and cleans up without error"""
+        virtual_addr = self.memory_manager.allocate_memory(510, 0, MemoryType.USER)
+        self.assertIsNotNone(virtual_addr)
+        self.assertNotIn(510, self.memory_manager.process_runs)
+        
+        self.memory_manager.cleanup_process_memory(510)
+        self.assertNotIn(510, self.memory_manager.page_tables)
+        self.assertEqual(len(self.memory_manager.free_pages), 4096)
+
 class TestMemoryVisualizer(unittest.TestCase):
     """Test cases for MemoryVisualizer"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Share one manager and visualizer across the visualizer tests"""
+        cls.memory_manager = MemoryManager(total_memory=8*1024*1024, page_size=4096)
+        cls.visualizer = MemoryVisualizer(cls.memory_manager)
+    
     def setUp(self):
         """Set up test environment"""
-        self.memory_manager = MemoryManager(total_memory=8*1024*1024, page_size=4096)
-        self.visualizer = MemoryVisualizer(self.memory_manager)
+        self.memory_manager.reset()
     
     def test_visualizer_initialization(self):
         """Test visualizer initialization"""
@@ -224,26 +289,40 @@ class TestMemoryVisualizer(unittest.TestCase):
         self.assertIn('memory_usage_percent', stats)
         self.assertIn('page_faults', stats)
         
-        # Test export (just verify it doesn't crash)
+        # Test export into memory; the output must be parseable JSON
         try:
-            self.visualizer.export_memory_state("test_memory_export.json")
-            import os
-            self.assertTrue(os.path.exists("test_memory_export.json"))
-            os.remove("test_memory_export.json")  # Cleanup
+            buf = io.StringIO()
+            self.visualizer.export_memory_state(buf)
+            exported = json.loads(buf.getvalue())
+            self.assertIn('statistics', exported)
+            pages = exported['physical_pages']
+            page_state = base64.b64decode(pages['page_state_b64'])
+            self.assertEqual(len(page_state), self.memory_manager.total_pages)
+            self.assertEqual(bytes(self.memory_manager.page_state), page_state)
         except Exception as e:
             self.fail(f"Memory export failed: {e}")
 
 class TestIntegratedProcessManager(unittest.TestCase):
     """Test cases for IntegratedProcessManager"""
     
-    def setUp(self):
-        """Set up test environment"""
-        self.manager = IntegratedProcessManager(
+    @classmethod
+    def setUpClass(cls):
+        """Build the manager once; each test starts from clear_processes()"""
+        cls.manager = IntegratedProcessManager(
             scheduler=RoundRobinScheduler(time_quantum=100),
             total_memory=32*1024*1024,  # 32MB for testing
             page_size=4096
         )
     
+    @classmethod
+    def tearDownClass(cls):
+        """Release the shared manager"""
+        cls.manager.shutdown()
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.manager.clear_processes()
+    
     def test_integrated_manager_initialization(self):
         """Test integrated manager initialization"""
         self.assertIsNotNone(self.manager.memory_manager)
@@ -253,7 +332,6 @@ class TestIntegratedProcessManager(unittest.TestCase):
     def test_process_creation_with_memory(self):
         """Test process creation with memory allocation"""
         def dummy_ai_task():
-            time.sleep(0.1)
             return "AI task complete"
         
         pid = self.manager.create_process(
@@ -272,6 +350,19 @@ class TestIntegratedProcessManager(unittest.TestCase):
         self.assertEqual(process_info['process_type'], ProcessType.AI_INFERENCE.value)
         self.assertIsNotNone(process_info['virtual_base_address'])
     
+    def test_process_extra_attributes(self):
+        """Extra create_process keyword arguments are stored on the PCB"""
+        pid = self.manager.create_process(
+            name="Tagged-Process",
+            process_type=ProcessType.USER,
+            target_function=lambda: None,
+            memory_required=4096,
+            custom_tag="a"
+        )
+        
+        self.assertIsNotNone(pid)
+        self.assertEqual(self.manager.processes[pid].custom_tag, "a")
+    
     def test_memory_type_mapping(self):
         """Test automatic memory type mapping for process types"""
         def dummy_task():
@@ -294,7 +385,6 @@ class TestIntegratedProcessManager(unittest.TestCase):
     def test_additional_memory_allocation(self):
         """Test additional memory allocation for existing processes"""
         def dummy_task():
-            time.sleep(0.2)
             return "complete"
         
         pid = self.manager.create_process(
@@ -334,7 +424,6 @@ class TestIntegratedProcessManager(unittest.TestCase):
     def test_process_termination_and_cleanup(self):
         """Test process termination with memory cleanup"""
         def dummy_task():
-            time.sleep(0.1)
             return "complete"
         
         pid = self.manager.create_process(
@@ -349,8 +438,8 @@ class TestIntegratedProcessManager(unittest.TestCase):
         success = self.manager.terminate_process(pid, force=True)
         self.assertTrue(success)
         
-        # Allow time for cleanup
-        time.sleep(0.1)
+        # Wait for cleanup to be reported instead of sleeping
+        self.assertTrue(self.manager.wait_for_termination(pid, timeout=2))
         
         # Verify cleanup - process and memory should be gone
         self.assertIsNone(self.manager.get_process_info(pid))
@@ -371,14 +460,17 @@ class TestIntegratedProcessManager(unittest.TestCase):
 class TestMemoryDemonstration(unittest.TestCase):
     """Test cases for memory demonstration functionality"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the demo once for the whole class"""
+        from step2_demo import MemoryDemo
+        cls.demo = MemoryDemo(memory_size=16*1024*1024)
+    
     def test_memory_demo_initialization(self):
         """Test memory demo can be initialized"""
-        from memory_demo import MemoryDemo
-        
-        demo = MemoryDemo(memory_size=16*1024*1024)
-        self.assertIsNotNone(demo.memory_manager)
-        self.assertIsNotNone(demo.visualizer)
-        self.assertEqual(demo.memory_manager.total_memory, 16*1024*1024)
+        self.assertIsNotNone(self.demo.memory_manager)
+        self.assertIsNotNone(self.demo.visualizer)
+        self.assertEqual(self.demo.memory_manager.total_memory, 16*1024*1024)
 
 def run_performance_test():
     """Run performance test for memory operations"""
@@ -386,37 +478,34 @@ def run_performance_test():
     
     memory_manager = MemoryManager(total_memory=128*1024*1024, page_size=4096)
     
-    # Test allocation performance
-    start_time = time.time()
-    allocations = []
-    
-    for i in range(100):
-        virtual_addr = memory_manager.allocate_memory(
-            i, 64*1024, MemoryType.USER  # 64KB each
+    # Independent PIDs are driven concurrently, as processes would be
+    with ThreadPoolExecutor() as executor:
+        # Test allocation performance
+        start_time = time.time()
+        results = executor.map(
+            lambda pid: (pid, memory_manager.allocate_memory(pid, 64*1024, MemoryType.USER)),  # 64KB each
+            range(100)
         )
-        if virtual_addr is not None:
-            allocations.append((i, virtual_addr))
-    
-    allocation_time = time.time() - start_time
-    
-    # Test access performance
-    start_time = time.time()
-    access_count = 0
-    
-    for pid, addr in allocations[:50]:  # Test first 50
-        success, _ = memory_manager.access_memory(pid, addr)
-        if success:
-            access_count += 1
-    
-    access_time = time.time() - start_time
-    
-    # Test cleanup performance
-    start_time = time.time()
-    
-    for pid, _ in allocations:
-        memory_manager.cleanup_process_memory(pid)
-    
-    cleanup_time = time.time() - start_time
+        allocations = [(pid, addr) for pid, addr in results if addr is not None]
+        
+        allocation_time = time.time() - start_time
+        
+        # Test access performance
+        start_time = time.time()
+        access_count = sum(
+            success for success, _ in executor.map(
+                lambda allocation: memory_manager.access_memory(*allocation),
+                allocations[:50]  # Test first 50
+            )
+        )
+        
+        access_time = time.time() - start_time
+        
+        # Test cleanup performance
+        start_time = time.time()
+        list(executor.map(memory_manager.cleanup_process_memory, [pid for pid, _ in allocations]))
+        
+        cleanup_time = time.time() - start_time
     
     # Report results
     print(f"✅ Performance Test Results:")
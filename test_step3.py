@@ -3,28 +3,56 @@ Decentralized AI Node Operating System - Step 3: Test Suite
 Comprehensive tests for threading API, synchronization primitives, and concurrency problems.
 """
 
+import io
+import atexit
 import unittest
-import threading
+import itertools
+import operator
 import time
-import random
 import sys
+import os
+import json
+import tempfile
 from typing import List
+from unittest.mock import patch
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
-from thread_api import ThreadAPI, ThreadType, ThreadPriority, ThreadState
+from thread_api import ThreadAPI, AIThread, ThreadType, ThreadPriority, ThreadState
 from concurrency_problems import ProducerConsumerAI, DiningPhilosophersAI, ReadersWritersAI
-from synchronization_visualizer import SynchronizationVisualizer, SyncEvent
+from synchronization_visualizer import SynchronizationVisualizer, SyncEvent, SyncEventType, EVENT_RING_SIZE
+
+# Set BCOS_FULL_TESTS=1 to run stress tests at full size
+FULL_TESTS = os.environ.get("BCOS_FULL_TESTS") == "1"
+
+# Worker threads reused by every test that needs real concurrency
+_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="step3-test")
+atexit.register(_POOL.shutdown)
+
+_real_sleep = time.sleep
+
+def _yield_instead_of_sleep(seconds):
+    """Stand-in for time.sleep in tests that only simulate work: yields without waiting"""
+    _real_sleep(0)
+
+def _noop():
+    """Thread body for API threads whose bookkeeping is tested but which never run"""
+    return None
 
 class TestThreadAPI(unittest.TestCase):
     """Test cases for the Thread API"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Share one API across the class; each test starts from reset()"""
+        cls.thread_api = ThreadAPI()
+        
     def setUp(self):
         """Set up test fixtures"""
-        self.thread_api = ThreadAPI()
+        self.thread_api.reset()
         
     def test_thread_creation(self):
         """Test basic thread creation"""
         def dummy_task():
-            time.sleep(0.1)
             return "completed"
             
         thread_id = self.thread_api.create_thread(
@@ -45,11 +73,11 @@ class TestThreadAPI(unittest.TestCase):
         
     def test_thread_execution(self):
         """Test thread execution and completion"""
-        result_holder = {"value": None}
+        result_holder = [None]
         
         def test_task(value):
-            result_holder["value"] = value * 2
-            return result_holder["value"]
+            result_holder[0] = value * 2
+            return result_holder[0]
             
         thread_id = self.thread_api.create_thread(
             function=test_task,
@@ -66,18 +94,16 @@ class TestThreadAPI(unittest.TestCase):
         
         thread = self.thread_api.get_thread_info(thread_id)
         self.assertEqual(thread.state, ThreadState.TERMINATED)
-        self.assertEqual(result_holder["value"], 84)
+        self.assertEqual(result_holder[0], 84)
         
     def test_multiple_threads(self):
         """Test multiple concurrent threads"""
-        shared_counter = {"value": 0}
-        lock = threading.Lock()
+        # next() on itertools.count is atomic in CPython, so no lock is needed
+        counter = itertools.count()
         
         def increment_task(iterations):
             for _ in range(iterations):
-                with lock:
-                    shared_counter["value"] += 1
-                time.sleep(0.001)  # Small delay
+                next(counter)
                 
         # Create multiple threads
         threads = []
@@ -103,39 +129,76 @@ class TestThreadAPI(unittest.TestCase):
             
         # Verify result
         expected_value = num_threads * iterations_per_thread
-        self.assertEqual(shared_counter["value"], expected_value)
+        self.assertEqual(next(counter), expected_value)
+        
+    def test_state_index_follows_transitions(self):
+        """State transitions move thread ids between the per-state sets"""
+        thread_id = self.thread_api.create_thread(function=_noop, name="Indexed")
+        by_state = self.thread_api.thread_ids_by_state
+        self.assertEqual(by_state[ThreadState.CREATED], {thread_id})
+        
+        self.thread_api.terminate_thread(thread_id)
+        self.assertEqual(by_state[ThreadState.CREATED], set())
+        self.assertEqual(by_state[ThreadState.TERMINATED], {thread_id})
+        self.assertEqual(self.thread_api.get_system_stats()["threads_by_state"]["TERMINATED"], 1)
+        
+    def test_create_threads_bulk(self):
+        """Test batch thread creation registers every thread like create_thread"""
+        thread_ids = self.thread_api.create_threads_bulk([
+            {"function": _noop, "name": "Bulk-0", "thread_type": ThreadType.AI_WORKER},
+            {"function": _noop, "priority": ThreadPriority.HIGH},
+        ])
+        
+        self.assertEqual(len(thread_ids), 2)
+        self.assertEqual(self.thread_api.total_threads_created, 2)
+        first, second = (self.thread_api.get_thread_info(thread_id) for thread_id in thread_ids)
+        self.assertEqual(first.name, "Bulk-0")
+        self.assertEqual(first.thread_type, ThreadType.AI_WORKER)
+        self.assertEqual(second.name, "Thread-1")
+        self.assertEqual(second.priority, ThreadPriority.HIGH)
         
     def test_thread_types_and_priorities(self):
         """Test different thread types and priorities"""
-        def dummy_task():
-            time.sleep(0.1)
-            
-        # Test all thread types
+        # Enum values are stored as given, so each one is checked on a bare thread record
         for thread_type in ThreadType:
-            thread_id = self.thread_api.create_thread(
-                function=dummy_task,
-                name=f"Type-{thread_type.name}",
-                thread_type=thread_type
-            )
-            thread = self.thread_api.get_thread_info(thread_id)
-            self.assertEqual(thread.thread_type, thread_type)
+            with self.subTest(thread_type=thread_type):
+                thread = AIThread(name=f"Type-{thread_type.name}", thread_type=thread_type)
+                self.assertEqual(thread.thread_type, thread_type)
+                self.assertEqual(thread.state, ThreadState.CREATED)
             
-        # Test all priorities
         for priority in ThreadPriority:
-            thread_id = self.thread_api.create_thread(
-                function=dummy_task,
-                name=f"Priority-{priority.name}",
-                priority=priority
-            )
-            thread = self.thread_api.get_thread_info(thread_id)
-            self.assertEqual(thread.priority, priority)
+            with self.subTest(priority=priority):
+                thread = AIThread(name=f"Priority-{priority.name}", priority=priority)
+                self.assertEqual(thread.priority, priority)
+                
+        # One registration confirms create_thread passes both through
+        thread_id = self.thread_api.create_thread(
+            function=_noop,
+            name="TypedThread",
+            thread_type=ThreadType.AI_WORKER,
+            priority=ThreadPriority.HIGH
+        )
+        thread = self.thread_api.get_thread_info(thread_id)
+        self.assertEqual(thread.thread_type, ThreadType.AI_WORKER)
+        self.assertEqual(thread.priority, ThreadPriority.HIGH)
 
 class TestSynchronizationPrimitives(unittest.TestCase):
     """Test cases for synchronization primitives"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Share one API across the class; each test starts from reset()"""
+        cls.thread_api = ThreadAPI()
+        
     def setUp(self):
         """Set up test fixtures"""
-        self.thread_api = ThreadAPI()
+        self.thread_api.reset()
+        
+    def _bulk_create_dummy_threads(self, count: int, prefix: str) -> List[str]:
+        """Register count never-started no-op threads named prefix-0, prefix-1, ..."""
+        return self.thread_api.create_threads_bulk(
+            [{"function": _noop, "name": f"{prefix}-{i}"} for i in range(count)]
+        )
         
     def test_lock_creation_and_basic_usage(self):
         """Test lock creation and basic acquire/release"""
@@ -153,7 +216,7 @@ class TestSynchronizationPrimitives(unittest.TestCase):
         
         # Create a dummy thread for testing
         dummy_thread_id = self.thread_api.create_thread(
-            function=lambda: time.sleep(0.1),
+            function=_noop,
             name="DummyThread"
         )
         
@@ -170,44 +233,39 @@ class TestSynchronizationPrimitives(unittest.TestCase):
         thread = self.thread_api.get_thread_info(dummy_thread_id)
         self.assertNotIn(lock_id, thread.locks_held)
         
+    @patch('time.sleep', _yield_instead_of_sleep)
     def test_lock_contention(self):
         """Test lock contention between threads"""
         lock_id = "contention_lock"
         self.thread_api.create_lock(lock_id)
         
-        execution_order = []
-        lock = threading.Lock()
+        # At most 3 start/end pairs; next() on a shared count hands out slots atomically
+        execution_order = [None] * 6
+        slots = itertools.count()
         
         def lock_worker(worker_id):
             # Create thread in API
             api_thread_id = self.thread_api.create_thread(
-                function=lambda: None,
+                function=_noop,
                 name=f"LockWorker-{worker_id}"
             )
             
             # Simulate lock acquisition
             if self.thread_api.acquire_lock(lock_id, api_thread_id, blocking=False):
                 try:
-                    with lock:
-                        execution_order.append(f"start-{worker_id}")
-                    time.sleep(0.1)
-                    with lock:
-                        execution_order.append(f"end-{worker_id}")
+                    execution_order[next(slots)] = f"start-{worker_id}"
+                    time.sleep(0.005)
+                    execution_order[next(slots)] = f"end-{worker_id}"
                 finally:
                     self.thread_api.release_lock(lock_id, api_thread_id)
                     
-        # Start multiple threads trying to acquire the same lock
-        threads = []
-        for i in range(3):
-            thread = threading.Thread(target=lock_worker, args=(i,))
-            threads.append(thread)
-            thread.start()
-            
-        for thread in threads:
-            thread.join(timeout=5.0)
+        # Run multiple workers trying to acquire the same lock
+        list(_POOL.map(lock_worker, range(3), timeout=5.0))
             
         # Verify that execution was serialized
-        self.assertTrue(len(execution_order) <= 6)  # At most 3 start/end pairs
+        recorded = [entry for entry in execution_order if entry is not None]
+        for start, end in zip(recorded[::2], recorded[1::2]):
+            self.assertEqual(end, start.replace("start", "end"))
         
     def test_condition_variables(self):
         """Test condition variable functionality"""
@@ -242,13 +300,7 @@ class TestSynchronizationPrimitives(unittest.TestCase):
         self.assertFalse(success)
         
         # Create dummy threads for testing
-        thread_ids = []
-        for i in range(3):
-            thread_id = self.thread_api.create_thread(
-                function=lambda: time.sleep(0.1),
-                name=f"SemThread-{i}"
-            )
-            thread_ids.append(thread_id)
+        thread_ids = self._bulk_create_dummy_threads(3, "SemThread")
             
         # Acquire semaphore multiple times
         acquired_count = 0
@@ -270,14 +322,10 @@ class TestConcurrencyProblems(unittest.TestCase):
             num_consumers=1
         )
         
-        # Run for a short duration
-        start_time = time.time()
-        pc.start_simulation(duration=3.0)
-        duration = time.time() - start_time
-        
-        # Verify simulation ran for approximately the right duration
-        self.assertGreater(duration, 2.5)
-        self.assertLess(duration, 5.0)
+        # A short run is enough to see traffic; retry once with a longer run if it was too short
+        pc.start_simulation(duration=0.3)
+        if pc.total_consumed == 0:
+            pc.start_simulation(duration=1.0)
         
         # Verify some production and consumption occurred
         self.assertGreater(pc.total_produced, 0)
@@ -287,13 +335,9 @@ class TestConcurrencyProblems(unittest.TestCase):
         """Test basic Dining Philosophers functionality"""
         dp = DiningPhilosophersAI(num_philosophers=3)
         
-        start_time = time.time()
-        dp.start_simulation(duration=3.0)
-        duration = time.time() - start_time
-        
-        # Verify simulation ran
-        self.assertGreater(duration, 2.5)
-        self.assertLess(duration, 5.0)
+        dp.start_simulation(duration=0.3)
+        if sum(dp.eating_count) == 0:
+            dp.start_simulation(duration=1.0)
         
         # Verify some eating occurred
         total_eating = sum(dp.eating_count)
@@ -306,13 +350,9 @@ class TestConcurrencyProblems(unittest.TestCase):
             num_writers=1
         )
         
-        start_time = time.time()
-        rw.start_simulation(duration=3.0)
-        duration = time.time() - start_time
-        
-        # Verify simulation ran
-        self.assertGreater(duration, 2.5)
-        self.assertLess(duration, 5.0)
+        rw.start_simulation(duration=0.3)
+        if sum(rw.write_operations.values()) == 0:
+            rw.start_simulation(duration=1.0)
         
         # Verify some operations occurred
         total_reads = sum(rw.read_operations.values())
@@ -325,10 +365,16 @@ class TestConcurrencyProblems(unittest.TestCase):
 class TestSynchronizationVisualizer(unittest.TestCase):
     """Test cases for the synchronization visualizer"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Share one API and visualizer across the class; each test starts from reset()"""
+        cls.thread_api = ThreadAPI()
+        cls.visualizer = SynchronizationVisualizer(cls.thread_api)
+        
     def setUp(self):
         """Set up test fixtures"""
-        self.thread_api = ThreadAPI()
-        self.visualizer = SynchronizationVisualizer(self.thread_api)
+        self.thread_api.reset()
+        self.visualizer.reset()
         
     def test_visualizer_creation(self):
         """Test visualizer initialization"""
@@ -353,13 +399,129 @@ class TestSynchronizationVisualizer(unittest.TestCase):
         recorded_event = self.visualizer.sync_events[0]
         self.assertEqual(recorded_event.thread_id, "test_thread")
         self.assertEqual(recorded_event.event_type, "lock_acquire")
+        self.assertIs(recorded_event.event_type, SyncEventType.LOCK_ACQUIRE)
         self.assertEqual(recorded_event.resource_id, "test_lock")
         
+    def test_sync_event_ring_overflow(self):
+        """Test ring draining and dropped-event accounting"""
+        total = EVENT_RING_SIZE + 10
+        for i in range(total):
+            self.visualizer.add_sync_event(SyncEvent(
+                timestamp=time.time(),
+                thread_id=f"thread_{i}",
+                event_type="lock_release",
+                resource_id="ring_lock"
+            ))
+            
+        drained = self.visualizer.drain_sync_events()
+        self.assertEqual(drained, EVENT_RING_SIZE)
+        self.assertEqual(self.visualizer.dropped_events, 10)
+        self.assertEqual(self.visualizer.sync_events[-1].thread_id, f"thread_{total - 1}")
+        self.assertEqual(self.visualizer.drain_sync_events(), 0)
+        
+    def test_flush_keeps_producer_order(self):
+        """Events published by a concurrent flush keep each producer's order"""
+        per_producer = 150
+        # Switch threads as often as possible so a flush lands mid-publish
+        self.addCleanup(sys.setswitchinterval, sys.getswitchinterval())
+        sys.setswitchinterval(1e-6)
+        
+        def produce(producer):
+            for i in range(per_producer):
+                self.visualizer.add_sync_event(SyncEvent(time.time(), f"producer_{producer}", "notify", f"{i:04d}"))
+                
+        futures = [_POOL.submit(produce, p) for p in range(4)]
+        while not all(future.done() for future in futures):
+            self.visualizer.flush()
+        for future in futures:
+            future.result(timeout=10.0)
+            
+        seen = {}
+        for event in self.visualizer.sync_events:
+            seen.setdefault(event.thread_id, []).append(event.resource_id)
+        for producer, order in seen.items():
+            self.assertEqual(order, sorted(order), producer)
+        self.assertEqual(sum(map(len, seen.values())), 4 * per_producer)
+        
+    def test_deadlock_cycle_detection(self):
+        """Test wait-for cycles are reported once and acyclic waits are not"""
+        def sync(thread_id, event_type, lock_id, success=True):
+            self.visualizer.add_sync_event(SyncEvent(time.time(), thread_id, event_type, lock_id, success))
+            self.visualizer.drain_sync_events()
+            
+        # t1 and t2 each failed to get the lock the other holds; t3 waits on t1
+        sync("t1", "lock_acquire", "lock_b", success=False)
+        sync("t2", "lock_acquire", "lock_a", success=False)
+        sync("t3", "lock_acquire", "lock_a", success=False)
+        holder_of = {"lock_a": "t1", "lock_b": "t2"}
+        
+        self.visualizer._detect_potential_deadlocks(holder_of, {})
+        self.assertEqual(len(self.visualizer.potential_deadlocks), 1)
+        cycle, threads = self.visualizer.potential_deadlocks[0]
+        self.assertEqual(set(threads), {"t1", "t2"})
+        self.assertEqual(set(cycle), {"lock_a", "lock_b"})
+        
+        # Unchanged graph reuses the cached result
+        generation = self.visualizer._graph_gen
+        self.visualizer._detect_potential_deadlocks(holder_of, {})
+        self.assertEqual(len(self.visualizer.potential_deadlocks), 1)
+        
+        sync("t1", "lock_release", "lock_b")
+        self.assertGreater(self.visualizer._graph_gen, generation)
+        self.visualizer._detect_potential_deadlocks(holder_of, {})
+        self.assertEqual(self.visualizer.potential_deadlocks, [])
+        
+    def test_lock_state_version_tracks_lock_changes(self):
+        """Test acquiring and releasing locks move the version the deadlock cache keys on"""
+        self.thread_api.create_lock("versioned_lock")
+        thread_id = self.thread_api.create_thread(function=_noop, name="Versioned")
+        
+        before = self.thread_api.lock_state_version
+        self.assertTrue(self.thread_api.acquire_lock("versioned_lock", thread_id))
+        acquired = self.thread_api.lock_state_version
+        self.assertNotEqual(acquired, before)
+        self.assertTrue(self.thread_api.release_lock("versioned_lock", thread_id))
+        self.assertNotEqual(self.thread_api.lock_state_version, acquired)
+        
+    def test_export_monitoring_data(self):
+        """Test the streamed export is valid JSON with every event"""
+        for i in range(3):
+            self.visualizer.add_sync_event(SyncEvent(time.time(), f"thread_{i}", "notify", "cv_export"))
+        self.visualizer.throughput_history.append(1.5)
+        
+        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+            filename = f.name
+        try:
+            with patch('builtins.print'):
+                self.visualizer.export_monitoring_data(filename)
+            with open(filename) as f:
+                data = json.load(f)
+        finally:
+            os.remove(filename)
+            
+        self.assertEqual([e["thread_id"] for e in data["sync_events"]], ["thread_0", "thread_1", "thread_2"])
+        self.assertEqual(data["performance_metrics"]["throughput_history"], [1.5])
+        self.assertIn("system_stats", data)
+        self.assertEqual(data["potential_deadlocks"], [])
+        
+    def test_cv_waiters_by_condition(self):
+        """Test condition waiters are attributed to the condition they wait on"""
+        self.thread_api.create_condition_variable("cv_a")
+        self.thread_api.create_condition_variable("cv_b")
+        thread_id = self.thread_api.create_thread(function=_noop, name="CVWaiter")
+        thread = self.thread_api.get_thread_info(thread_id)
+        thread.state = ThreadState.WAITING
+        thread.waiting_for_condition = "cv_a"
+        
+        waiters_of = self.visualizer._index_cv_waiters(self.thread_api.list_threads())
+        self.assertEqual(waiters_of.get("cv_a"), [thread_id])
+        self.assertNotIn("cv_b", waiters_of)
+        
     def test_thread_snapshot(self):
         """Test thread snapshot functionality"""
         # Create a test thread
         thread_id = self.thread_api.create_thread(
-            function=lambda: time.sleep(0.1),
+            function=_noop,
             name="SnapshotTestThread",
             thread_type=ThreadType.AI_WORKER
         )
@@ -377,28 +539,69 @@ class TestSynchronizationVisualizer(unittest.TestCase):
         self.assertEqual(snapshot.name, "SnapshotTestThread")
         self.assertEqual(snapshot.thread_type, ThreadType.AI_WORKER)
 
+    def test_evict_terminated_thread_snapshots(self):
+        """Terminated threads keep their history only for snapshot_ttl"""
+        thread_id = self.thread_api.create_thread(function=_noop, name="ShortLived")
+        self.visualizer.take_thread_snapshot()
+        self.thread_api.terminate_thread(thread_id)
+        self.visualizer.take_thread_snapshot()
+        self.visualizer.take_thread_snapshot()
+        
+        # The terminal state is recorded once, then the history stops growing
+        history = self.visualizer.thread_snapshots[thread_id]
+        self.assertEqual(len(history), 2)
+        self.assertEqual(history[-1].state, ThreadState.TERMINATED)
+        
+        self.visualizer.lock_dependency_graph[thread_id] = set()
+        threads = self.thread_api.list_threads()
+        self.visualizer._evict_dead_threads(threads)
+        self.assertIn(thread_id, self.visualizer.thread_snapshots)
+        
+        self.addCleanup(setattr, self.visualizer, "snapshot_ttl", self.visualizer.snapshot_ttl)
+        self.visualizer.snapshot_ttl = -1.0
+        self.visualizer._evict_dead_threads(threads)
+        self.assertNotIn(thread_id, self.visualizer.thread_snapshots)
+        self.assertNotIn(thread_id, self.visualizer.lock_dependency_graph)
+        
+    def test_evicted_thread_stays_evicted(self):
+        """A later snapshot does not bring back an evicted thread's history"""
+        thread_id = self.thread_api.create_thread(function=_noop, name="Evicted")
+        self.thread_api.terminate_thread(thread_id)
+        self.visualizer.take_thread_snapshot()
+        
+        self.addCleanup(setattr, self.visualizer, "snapshot_ttl", self.visualizer.snapshot_ttl)
+        self.visualizer.snapshot_ttl = -1.0
+        self.visualizer._evict_dead_threads(self.thread_api.list_threads())
+        self.visualizer.take_thread_snapshot()
+        self.assertNotIn(thread_id, self.visualizer.thread_snapshots)
+
 class TestSystemIntegration(unittest.TestCase):
     """Integration tests for the complete system"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Share one API across the class; each test starts from reset()"""
+        cls.thread_api = ThreadAPI()
+        
     def setUp(self):
         """Set up test fixtures"""
-        self.thread_api = ThreadAPI()
+        self.thread_api.reset()
         
     def test_concurrent_access_patterns(self):
         """Test realistic concurrent access patterns"""
         # Simulate AI training scenario with multiple components
-        shared_model = {"parameters": 0, "version": 0}
+        shared_model = [0, 0]  # [parameters, version]
         model_lock_id = "model_lock"
         update_cv_id = "model_update_cv"
         
         self.thread_api.create_lock(model_lock_id)
         self.thread_api.create_condition_variable(update_cv_id, model_lock_id)
         
-        results = {"trainers": 0, "validators": 0, "updates": 0}
+        results = [0, 0, 0]  # [trainers, validators, updates]
         
         def ai_trainer(trainer_id):
             api_thread_id = self.thread_api.create_thread(
-                function=lambda: None,
+                function=_noop,
                 name=f"Trainer-{trainer_id}",
                 thread_type=ThreadType.AI_WORKER
             )
@@ -406,21 +609,21 @@ class TestSystemIntegration(unittest.TestCase):
             for _ in range(5):
                 if self.thread_api.acquire_lock(model_lock_id, api_thread_id):
                     try:
-                        # Simulate training
-                        time.sleep(random.uniform(0.01, 0.05))
-                        shared_model["parameters"] += 1
-                        results["trainers"] += 1
+                        # Simulate training; a zero sleep still yields to the other workers
+                        time.sleep(0)
+                        shared_model[0] += 1
+                        results[0] += 1
                         
                         # Notify validators
                         self.thread_api.notify_condition(update_cv_id)
                     finally:
                         self.thread_api.release_lock(model_lock_id, api_thread_id)
                         
-                time.sleep(random.uniform(0.01, 0.03))
+                time.sleep(0)
                 
         def model_validator(validator_id):
             api_thread_id = self.thread_api.create_thread(
-                function=lambda: None,
+                function=_noop,
                 name=f"Validator-{validator_id}",
                 thread_type=ThreadType.DATA_PROCESSOR
             )
@@ -432,49 +635,34 @@ class TestSystemIntegration(unittest.TestCase):
                         self.thread_api.wait_condition(update_cv_id, api_thread_id, timeout=1.0)
                         
                         # Simulate validation
-                        time.sleep(random.uniform(0.01, 0.03))
-                        results["validators"] += 1
+                        time.sleep(0)
+                        results[1] += 1
                     finally:
                         self.thread_api.release_lock(model_lock_id, api_thread_id)
                         
-        # Start concurrent threads
-        threads = []
+        # Run trainers and validators concurrently on the shared pool
+        futures = [_POOL.submit(ai_trainer, i) for i in range(3)]
+        futures += [_POOL.submit(model_validator, i) for i in range(2)]
         
-        # Trainer threads
-        for i in range(3):
-            thread = threading.Thread(target=ai_trainer, args=(i,))
-            threads.append(thread)
-            thread.start()
-            
-        # Validator threads
-        for i in range(2):
-            thread = threading.Thread(target=model_validator, args=(i,))
-            threads.append(thread)
-            thread.start()
-            
         # Wait for completion
-        for thread in threads:
-            thread.join(timeout=10.0)
+        for future in futures:
+            future.result(timeout=10.0)
             
         # Verify results
-        self.assertGreater(results["trainers"], 0)
-        self.assertGreater(results["validators"], 0)
-        self.assertEqual(shared_model["parameters"], results["trainers"])
+        self.assertGreater(results[0], 0)
+        self.assertGreater(results[1], 0)
+        self.assertEqual(shared_model[0], results[0])
         
     def test_system_performance_under_load(self):
         """Test system performance under high thread load"""
-        def cpu_intensive_task(task_id, iterations):
-            # Simulate CPU-intensive AI computation
-            total = 0
-            for i in range(iterations):
-                total += i ** 2
-                if i % 100 == 0:
-                    time.sleep(0.001)  # Yield occasionally
-            return total
+        def cpu_intensive_task(task_id, numbers):
+            # Simulate CPU-intensive AI computation; the interpreter switches threads on its own
+            return sum(map(operator.mul, numbers, numbers))
             
-        # Create many threads
-        num_threads = 20
-        iterations = 1000
+        # Create many threads; the full-size stress run is opt-in
+        num_threads = 20 if FULL_TESTS else 4
+        iterations = 1000 if FULL_TESTS else 100
+        numbers = range(iterations)  # shared by every task; ranges can be iterated repeatedly
         threads = []
         
         start_time = time.time()
@@ -482,7 +670,7 @@ class TestSystemIntegration(unittest.TestCase):
         for i in range(num_threads):
             thread_id = self.thread_api.create_thread(
                 function=cpu_intensive_task,
-                args=(i, iterations),
+                args=(i, numbers),
                 name=f"LoadTest-{i}",
                 thread_type=ThreadType.AI_WORKER if i % 2 == 0 else ThreadType.DATA_PROCESSOR
             )
@@ -499,53 +687,73 @@ class TestSystemIntegration(unittest.TestCase):
         stats = self.thread_api.get_system_stats()
         self.assertEqual(stats['total_threads_created'], num_threads)
         self.assertEqual(stats['total_threads_completed'], num_threads)
-        self.assertLess(duration, 30.0)  # Should complete within reasonable time
+        self.assertLess(duration, 30.0 if FULL_TESTS else 5.0)  # Should complete within reasonable time
+
+# TestCase classes run by run_all_tests, each in its own worker process
+TEST_CASES = (
+    TestThreadAPI,
+    TestSynchronizationPrimitives,
+    TestConcurrencyProblems,
+    TestSynchronizationVisualizer,
+    TestSystemIntegration,
+)
 
-def run_all_tests():
+# One loader serves every class loaded in this process
+_LOADER = unittest.TestLoader()
+
+def _run_test_case(case_name: str, verbosity: int = 1):
+    """Run one TestCase class; returns (report, tests run, failures, errors) in picklable form"""
+    stream = io.StringIO()
+    suite = _LOADER.loadTestsFromTestCase(globals()[case_name])
+    result = unittest.TextTestRunner(stream=stream, verbosity=verbosity).run(suite)
+    return (stream.getvalue(), result.testsRun,
+            [(str(test), trace) for test, trace in result.failures],
+            [(str(test), trace) for test, trace in result.errors])
+
+def run_all_tests(verbosity: int = 1):
     """Run all test suites"""
-    print("🧪 " + "STEP 3 TEST SUITE".center(60, "═"))
-    print()
-    
-    # Create test suite
-    test_suite = unittest.TestSuite()
-    
-    # Add test cases
-    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestThreadAPI))
-    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSynchronizationPrimitives))
-    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestConcurrencyProblems))
-    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSynchronizationVisualizer))
-    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSystemIntegration))
+    # Everything goes into one buffer and is written once; console writes are slow
+    out = io.StringIO()
+    out.write("🧪 " + "STEP 3 TEST SUITE".center(60, "═") + "\n\n")
     
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(test_suite)
+    # Test classes are independent, so they run concurrently; reports print in class order
+    tests_run, failures, errors = 0, [], []
+    case_names = [case.__name__ for case in TEST_CASES]
+    with ProcessPoolExecutor(max_workers=len(TEST_CASES)) as executor:
+        for report, case_run, case_failures, case_errors in executor.map(
+                _run_test_case, case_names, [verbosity] * len(case_names)):
+            out.write(report)
+            tests_run += case_run
+            failures.extend(case_failures)
+            errors.extend(case_errors)
     
-    # Print summary
-    print("\n" + "═" * 60)
-    print("📊 TEST RESULTS SUMMARY:")
-    print(f"✅ Tests Run: {result.testsRun}")
-    print(f"❌ Failures: {len(result.failures)}")
-    print(f"⚠️ Errors: {len(result.errors)}")
+    # Summary
+    out.write("\n" + "═" * 60 + "\n")
+    out.write("📊 TEST RESULTS SUMMARY:\n")
+    out.write(f"✅ Tests Run: {tests_run}\n")
+    out.write(f"❌ Failures: {len(failures)}\n")
+    out.write(f"⚠️ Errors: {len(errors)}\n")
     
-    if result.failures:
-        print("\n❌ FAILURES:")
-        for test, failure in result.failures:
-            print(f"  {test}: {failure}")
+    if failures:
+        out.write("\n❌ FAILURES:\n")
+        for test, failure in failures:
+            out.write(f"  {test}: {failure}\n")
             
-    if result.errors:
-        print("\n⚠️ ERRORS:")
-        for test, error in result.errors:
-            print(f"  {test}: {error}")
+    if errors:
+        out.write("\n⚠️ ERRORS:\n")
+        for test, error in errors:
+            out.write(f"  {test}: {error}\n")
             
-    success_rate = (result.testsRun - len(result.failures) - len(result.errors)) / result.testsRun * 100
-    print(f"\n🎯 Success Rate: {success_rate:.1f}%")
+    success_rate = (tests_run - len(failures) - len(errors)) / tests_run * 100
+    out.write(f"\n🎯 Success Rate: {success_rate:.1f}%\n")
+    sys.stdout.write(out.getvalue())
     
-    return result.wasSuccessful()
+    return not failures and not errors
 
 if __name__ == "__main__":
-    success = run_all_tests()
+    success = run_all_tests(verbosity=2 if "-v" in sys.argv[1:] else 1)
     if success:
         print("🎉 All tests passed!")
     else:
         print("❌ Some tests failed!")
-        sys.exit(1) 
\ No newline at end of file
+        sys.exit(1)
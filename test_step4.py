@@ -13,7 +13,7 @@ from unittest.mock import patch, MagicMock
 
 from file_system import VirtualFileSystem, FileType, AccessLevel, FileMetadata, DirectoryEntry
 from file_encryption import FileEncryption, EncryptionLevel, SecurityEvent
-from file_system_visualizer import FileSystemVisualizer, FileSystemEvent, VisualizationMode
+from file_system_visualizer import FileSystemVisualizer, FileSystemEvent, VisualizationMode, EventTraceRing
 
 class TestVirtualFileSystem(unittest.TestCase):
     """Test the core virtual file system functionality"""
@@ -160,6 +160,11 @@ class TestVirtualFileSystem(unittest.TestCase):
         self.assertFalse(file_entry.is_directory)
         self.assertTrue(dir_entry.is_directory)
         
+        # Recursive walk returns every directory listing in the tree
+        listing = self.fs.walk("/test_dir_ops")
+        self.assertEqual(set(listing), {"/test_dir_ops", "/test_dir_ops/subdir"})
+        self.assertEqual([e.name for e in listing["/test_dir_ops/subdir"]], ["file2.txt"])
+        
     def test_file_types(self):
         """Test different file types and their metadata"""
         test_files = [
@@ -508,6 +513,70 @@ class TestFileSystemVisualizer(unittest.TestCase):
         self.assertEqual(self.visualizer.user_activity["test_user"]["operations"], 1)
         self.assertEqual(self.visualizer.user_activity["test_user"]["data_transferred"], 100)
         
+    def test_event_ring_draining(self):
+        """Test raw events are queued and drained into tracked events"""
+        self.visualizer.record_event(time.time(), "write", "/ring_file.txt", "ring_user", 42)
+        
+        # Recorded events are only queued until drained
+        self.assertEqual(len(self.visualizer.event_ring), 1)
+        self.assertEqual(len(self.visualizer.fs_events), 0)
+        
+        self.visualizer.drain_events()
+        
+        self.assertEqual(len(self.visualizer.event_ring), 0)
+        self.assertEqual(self.visualizer.operation_counts["write"], 1)
+        self.assertEqual(self.visualizer.fs_events[-1].file_path, "/ring_file.txt")
+        self.assertEqual(self.visualizer.user_activity["ring_user"]["data_transferred"], 42)
+        
+        # Batched records land in the ring with a single update
+        batch = [(time.time(), "read", f"/batch_{i}.txt", "ring_user", 10) for i in range(3)]
+        self.visualizer.record_events(batch)
+        self.visualizer.drain_events()
+        
+        self.assertEqual(self.visualizer.operation_counts["read"], 3)
+        self.assertEqual(self.visualizer.user_activity["ring_user"]["operations"], 4)
+        
+    def test_event_trace_ring(self):
+        """Test memory-mapped event trace overwrites oldest records"""
+        with tempfile.NamedTemporaryFile(suffix='.ring', delete=False) as f:
+            ring_file = f.name
+            
+        try:
+            self.visualizer.enable_event_trace(ring_file, capacity=4)
+            for i in range(6):
+                self.visualizer.record_event(float(i), "create", f"/trace_{i}.txt", "trace_user", i)
+            self.visualizer.disable_event_trace()
+            
+            # Only the newest four records survive, oldest first
+            records = EventTraceRing.read(ring_file)
+            self.assertEqual([r[2] for r in records], [f"/trace_{i}.txt" for i in range(2, 6)])
+            self.assertEqual(records[0], (2.0, "create", "/trace_2.txt", "trace_user", 2, True))
+            
+        finally:
+            if os.path.exists(ring_file):
+                os.unlink(ring_file)
+                
+    def test_event_trace_ring_non_ascii_and_large_sizes(self):
+        """Test truncated non-ASCII paths and 64-bit sizes round-trip through the trace"""
+        with tempfile.NamedTemporaryFile(suffix='.ring', delete=False) as f:
+            ring_file = f.name
+            
+        # "/a" plus 20 three-byte characters is 62 bytes, so the 21st straddles the 64-byte field
+        long_path = "/a" + "模" * 30
+        try:
+            ring = EventTraceRing(ring_file, capacity=4)
+            ring.write(1.0, "write", long_path, "ユーザー", 5 * 1024**3)
+            ring.write(2.0, "delete", "/café.txt", "trace_user", -1)
+            ring.close()
+            
+            records = EventTraceRing.read(ring_file)
+            self.assertEqual(records[0], (1.0, "write", "/a" + "模" * 20, "ユーザー", 5 * 1024**3, True))
+            self.assertEqual(records[1], (2.0, "delete", "/café.txt", "trace_user", -1, True))
+            
+        finally:
+            if os.path.exists(ring_file):
+                os.unlink(ring_file)
+                
     def test_visualization_modes(self):
         """Test different visualization modes"""
         # Test mode switching
@@ -7,6 +7,7 @@ import unittest
 import time
 import threading
 import json
+import gzip
 import random
 import tempfile
 import os
@@ -15,7 +16,7 @@ from typing import Dict, Any
 
 # Import the components to test
 from ai_scheduler import AIScheduler, LearningMode, ProcessType, PowerManager, PerformancePredictor
-from web_gui import WebGUIServer, create_integrated_gui
+from web_gui import WebGUIServer, TTLCache, create_integrated_gui
 from file_system import VirtualFileSystem, FileType, AccessLevel
 from file_encryption import FileEncryption, EncryptionLevel
 
@@ -65,6 +66,19 @@ class TestAIScheduler(unittest.TestCase):
         priorities = [p["priority"] for p in self.scheduler.ready_queue]
         self.assertEqual(priorities, sorted(priorities, reverse=True))
         
+    def test_add_processes_bulk(self):
+        """Test batch addition matches one-by-one priority ordering"""
+        self.scheduler.add_processes(self.test_processes)
+        
+        self.assertEqual(len(self.scheduler.ready_queue), len(self.test_processes))
+        self.assertEqual(self.scheduler.total_scheduled, len(self.test_processes))
+        
+        one_by_one = AIScheduler(num_cores=4)
+        for process_data in self.test_processes:
+            one_by_one.add_process(*process_data)
+        self.assertEqual([p["id"] for p in self.scheduler.ready_queue],
+                         [p["id"] for p in one_by_one.ready_queue])
+        
     def test_intelligent_scheduling(self):
         """Test AI-based scheduling decisions"""
         # Add processes
@@ -389,6 +403,74 @@ class TestWebGUIServer(unittest.TestCase):
         self.assertEqual(gui.encryption, self.encryption)
         self.assertEqual(gui.ai_scheduler, self.ai_scheduler)
 
+    def test_metrics_ttl_cache(self):
+        """Test metric snapshots are reused within the TTL and refreshed after"""
+        cache = TTLCache()
+        calls = []
+        compute = lambda: calls.append(1) or len(calls)
+        
+        self.assertEqual(cache.get_or_compute("ai", 60.0, compute), 1)
+        self.assertEqual(cache.get_or_compute("ai", 60.0, compute), 1)
+        self.assertEqual(len(calls), 1)
+        
+        # An expired entry is recomputed
+        self.assertEqual(cache.get_or_compute("fs", 0.0, compute), 2)
+        self.assertEqual(cache.get_or_compute("fs", 0.0, compute), 3)
+        
+    def test_metrics_ttl_cache_keys_compute_independently(self):
+        """Test a slow recompute of one key does not block other keys"""
+        cache = TTLCache()
+        started, release = threading.Event(), threading.Event()
+        
+        def slow():
+            started.set()
+            release.wait(5)
+            return "slow"
+            
+        worker = threading.Thread(target=cache.get_or_compute, args=("system", 60.0, slow))
+        worker.start()
+        try:
+            self.assertTrue(started.wait(5))
+            fast = threading.Thread(target=cache.get_or_compute, args=("files", 60.0, lambda: "fast"))
+            fast.start()
+            fast.join(2)
+            self.assertFalse(fast.is_alive())  # Finished while "system" is still computing
+        finally:
+            release.set()
+            worker.join(5)
+        self.assertEqual(cache.get_or_compute("files", 60.0, lambda: "again"), "fast")
+        self.assertEqual(cache.get_or_compute("system", 60.0, lambda: "again"), "slow")
+        
+    @patch('web_gui.webbrowser.open')
+    def test_metrics_endpoint_serves_concurrently(self, mock_open):
+        """Test the threaded server answers the combined metrics endpoint"""
+        from urllib.request import Request, urlopen
+        
+        self.gui_server.port = 0  # Let the OS pick a free port
+        self.gui_server.start_server()
+        try:
+            deadline = time.time() + 5
+            while self.gui_server.server is None and time.time() < deadline:
+                time.sleep(0.01)
+            self.assertIsNotNone(self.gui_server.server)
+            
+            url = f"http://localhost:{self.gui_server.port}/api/metrics"
+            with urlopen(url, timeout=5) as response:
+                data = json.loads(response.read().decode())
+                
+            for section in ["system", "files", "scheduler", "security"]:
+                self.assertIn(section, data)
+                
+            request = Request(url, headers={"Accept-Encoding": "gzip"})
+            with urlopen(request, timeout=5) as response:
+                self.assertEqual(response.headers.get("Content-Encoding"), "gzip")
+                compressed_data = json.loads(gzip.decompress(response.read()).decode())
+            self.assertEqual(set(compressed_data), set(data))
+        finally:
+            self.gui_server.stop_server()
+            
+        self.assertFalse(self.gui_server.running)
+
 class TestIntegration(unittest.TestCase):
     """Test integration between AI scheduler and web GUI"""
     
@@ -4,6 +4,7 @@ A basic thread API implementation for the AI Node OS with synchronization suppor
 """
 
 import threading
+import itertools
 import time
 import uuid
 from enum import Enum
@@ -77,6 +78,7 @@ class AIThread:
     # Thread synchronization
     locks_held: List[str] = field(default_factory=list)
     waiting_for_lock: Optional[str] = None
+    waiting_for_condition: Optional[str] = None
     
     # Internal threading object
     _thread: Optional[threading.Thread] = None
@@ -91,6 +93,12 @@ class ThreadAPI:
     
     def __init__(self):
         self.threads: Dict[str, AIThread] = {}
+        # Thread ids by state, moved by _set_state on every transition
+        self.thread_ids_by_state: Dict[ThreadState, set] = {state: set() for state in ThreadState}
+        self._state_lock = threading.Lock()
+        # Changes whenever a thread's held or awaited locks change; readers compare values
+        self._lock_versions = itertools.count(1)
+        self.lock_state_version = 0
         self.running_threads: Dict[str, AIThread] = {}
         self.thread_groups: Dict[str, List[str]] = {}
         
@@ -111,6 +119,22 @@ class ThreadAPI:
         self.total_cpu_time = 0.0
         self.start_time = time.time()
         
+    def reset(self):
+        """Forget all threads and primitives and zero the metrics, reusing the registries"""
+        with self.scheduler_lock:
+            for registry in (self.threads, self.running_threads, self.thread_groups,
+                             self.locks, self.condition_variables, self.semaphores, self.barriers):
+                registry.clear()
+            with self._state_lock:
+                for ids in self.thread_ids_by_state.values():
+                    ids.clear()
+            self.lock_state_version = next(self._lock_versions)
+            self.thread_counter = 0
+            self.total_threads_created = 0
+            self.total_threads_completed = 0
+            self.total_cpu_time = 0.0
+            self.start_time = time.time()
+        
     def create_thread(self, 
                      function: Callable, 
                      args: tuple = (), 
@@ -120,28 +144,51 @@ class ThreadAPI:
                      priority: ThreadPriority = ThreadPriority.NORMAL,
                      parent_id: Optional[str] = None) -> str:
         """Create a new thread"""
-        if kwargs is None:
-            kwargs = {}
-            
         if len(self.threads) >= self.max_threads:
             raise RuntimeError("Maximum thread limit reached")
             
-        thread = AIThread(
-            name=name or f"Thread-{self.thread_counter}",
-            thread_type=thread_type,
-            priority=priority,
-            parent_thread_id=parent_id,
-            function=function,
-            args=args,
-            kwargs=kwargs
-        )
+        thread = self._build_thread(self.thread_counter, function, args, kwargs, name,
+                                    thread_type, priority, parent_id)
         
         self.threads[thread.thread_id] = thread
+        with self._state_lock:
+            self.thread_ids_by_state[thread.state].add(thread.thread_id)
         self.thread_counter += 1
         self.total_threads_created += 1
         
         return thread.thread_id
     
+    def create_threads_bulk(self, specs: List[Dict[str, Any]]) -> List[str]:
+        """Create a batch of threads from create_thread keyword specs in one registry update"""
+        with self.scheduler_lock:
+            if len(self.threads) + len(specs) > self.max_threads:
+                raise RuntimeError("Maximum thread limit reached")
+                
+            batch = [self._build_thread(self.thread_counter + i, **spec) for i, spec in enumerate(specs)]
+            self.threads.update((thread.thread_id, thread) for thread in batch)
+            with self._state_lock:
+                self.thread_ids_by_state[ThreadState.CREATED].update(thread.thread_id for thread in batch)
+            self.thread_counter += len(batch)
+            self.total_threads_created += len(batch)
+            
+        return [thread.thread_id for thread in batch]
+    
+    def _build_thread(self, number: int, function: Callable, args: tuple = (),
+                      kwargs: dict = None, name: str = "",
+                      thread_type: ThreadType = ThreadType.USER_THREAD,
+                      priority: ThreadPriority = ThreadPriority.NORMAL,
+                      parent_id: Optional[str] = None) -> AIThread:
+        """Build an unregistered thread; number names it when no name is given"""
+        return AIThread(
+            name=name or f"Thread-{number}",
+            thread_type=thread_type,
+            priority=priority,
+            parent_thread_id=parent_id,
+            function=function,
+            args=args,
+            kwargs=kwargs if kwargs is not None else {}
+        )
+    
     def start_thread(self, thread_id: str) -> bool:
         """Start a thread"""
         if thread_id not in self.threads:
@@ -153,7 +200,7 @@ class ThreadAPI:
             
         def thread_wrapper():
             thread.started_at = time.time()
-            thread.state = ThreadState.RUNNING
+            self._set_state(thread, ThreadState.RUNNING)
             self.running_threads[thread_id] = thread
             
             try:
@@ -174,7 +221,7 @@ class ThreadAPI:
                 thread._exception = e
             finally:
                 thread.finished_at = time.time()
-                thread.state = ThreadState.TERMINATED
+                self._set_state(thread, ThreadState.TERMINATED)
                 if thread_id in self.running_threads:
                     del self.running_threads[thread_id]
                 self.total_threads_completed += 1
@@ -182,7 +229,7 @@ class ThreadAPI:
         
         thread._thread = threading.Thread(target=thread_wrapper, name=thread.name)
         thread._thread.daemon = True
-        thread.state = ThreadState.READY
+        self._set_state(thread, ThreadState.READY)
         thread._thread.start()
         
         return True
@@ -207,7 +254,7 @@ class ThreadAPI:
             
         thread = self.threads[thread_id]
         if thread.state == ThreadState.RUNNING:
-            thread.state = ThreadState.SUSPENDED
+            self._set_state(thread, ThreadState.SUSPENDED)
             return True
         return False
     
@@ -218,7 +265,7 @@ class ThreadAPI:
             
         thread = self.threads[thread_id]
         if thread.state == ThreadState.SUSPENDED:
-            thread.state = ThreadState.RUNNING
+            self._set_state(thread, ThreadState.RUNNING)
             return True
         return False
     
@@ -228,11 +275,20 @@ class ThreadAPI:
             return False
             
         thread = self.threads[thread_id]
-        thread.state = ThreadState.TERMINATED
+        self._set_state(thread, ThreadState.TERMINATED)
         if thread_id in self.running_threads:
             del self.running_threads[thread_id]
         return True
     
+    def _set_state(self, thread: AIThread, state: ThreadState):
+        """Move a thread to a new state, keeping thread_ids_by_state in step"""
+        with self._state_lock:
+            self.thread_ids_by_state[thread.state].discard(thread.thread_id)
+            thread.state = state
+            # Threads still finishing after reset() are no longer listed and stay out
+            if thread.thread_id in self.threads:
+                self.thread_ids_by_state[state].add(thread.thread_id)
+            
     def get_thread_info(self, thread_id: str) -> Optional[AIThread]:
         """Get thread information"""
         return self.threads.get(thread_id)
@@ -273,7 +329,8 @@ class ThreadAPI:
                 thread.waiting_for_lock = None
             else:
                 thread.waiting_for_lock = lock_id
-                thread.state = ThreadState.BLOCKED
+                self._set_state(thread, ThreadState.BLOCKED)
+            self.lock_state_version = next(self._lock_versions)
             return acquired
         except:
             return False
@@ -290,8 +347,9 @@ class ThreadAPI:
         try:
             self.locks[lock_id].release()
             thread.locks_held.remove(lock_id)
+            self.lock_state_version = next(self._lock_versions)
             if thread.state == ThreadState.BLOCKED:
-                thread.state = ThreadState.READY
+                self._set_state(thread, ThreadState.READY)
             return True
         except:
             return False
@@ -316,16 +374,19 @@ class ThreadAPI:
         if not thread:
             return False
             
-        thread.state = ThreadState.WAITING
+        self._set_state(thread, ThreadState.WAITING)
+        thread.waiting_for_condition = cv_id
         try:
             cv = self.condition_variables[cv_id]
             # Note: The condition variable should already be acquired by the calling thread
             result = cv.wait(timeout)
-            thread.state = ThreadState.READY if result else ThreadState.RUNNING
+            self._set_state(thread, ThreadState.READY if result else ThreadState.RUNNING)
             return result
         except Exception:
-            thread.state = ThreadState.RUNNING
+            self._set_state(thread, ThreadState.RUNNING)
             return False
+        finally:
+            thread.waiting_for_condition = None
     
     def notify_condition(self, cv_id: str, notify_all: bool = False) -> bool:
         """Notify threads waiting on a condition variable"""
@@ -362,7 +423,7 @@ class ThreadAPI:
         try:
             acquired = self.semaphores[sem_id].acquire(blocking, timeout)
             if not acquired:
-                thread.state = ThreadState.BLOCKED
+                self._set_state(thread, ThreadState.BLOCKED)
             return acquired
         except:
             return False
@@ -400,10 +461,7 @@ class ThreadAPI:
     
     def _get_threads_by_state(self) -> dict:
         """Get thread count by state"""
-        state_counts = {}
-        for state in ThreadState:
-            state_counts[state.value] = len([t for t in self.threads.values() if t.state == state])
-        return state_counts
+        return {state.value: len(ids) for state, ids in self.thread_ids_by_state.items()}
     
     def _get_threads_by_type(self) -> dict:
         """Get thread count by type"""
@@ -3,13 +3,13 @@ Decentralized AI Node Operating System - Step 5: Web-Based GUI Dashboard
 Modern web interface for real-time system monitoring and management.
 """
 
+import gzip
 import http.server
-import socketserver
 import json
 import threading
 import time
 import webbrowser
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable
 from urllib.parse import urlparse, parse_qs
 
 # Import existing components
@@ -23,6 +23,45 @@ except ImportError:
     FileEncryption = None
     AIScheduler = None
 
+# JSON payloads smaller than this are not worth compressing
+GZIP_MIN_SIZE = 500
+
+class TTLCache:
+    """
+    Thread-safe time-based memoizer
+    Collapses repeated metric requests within the TTL into a single computation
+    """
+    
+    def __init__(self):
+        self._entries: Dict[str, tuple] = {}
+        # One lock per key, so a slow recompute only holds up requests for that key
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        
+    def get_or_compute(self, key: str, ttl: float, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for key, recomputing it once expired"""
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+            
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            # Another request may have refreshed the entry while this one waited
+            entry = self._entries.get(key)
+            now = time.monotonic()
+            if entry and entry[0] > now:
+                return entry[1]
+                
+            value = compute()
+            self._entries[key] = (now + ttl, value)
+            return value
+            
+    def clear(self):
+        """Drop all cached values"""
+        with self._lock:
+            self._entries.clear()
+
 class WebGUIServer:
     """
     Web-based GUI Server for the Decentralized AI Node OS
@@ -50,6 +89,10 @@ class WebGUIServer:
         
         self.start_time = time.time()
         
+        # Metric snapshots shared by all dashboard clients
+        self.metrics_cache = TTLCache()
+        self.metrics_ttl = 1.0
+        
     def start_server(self):
         """Start the web GUI server"""
         if self.running:
@@ -78,16 +121,19 @@ class WebGUIServer:
         self.running = False
         if self.server:
             self.server.shutdown()
+            self.server = None
             
     def _run_server(self, handler):
-        """Run the HTTP server"""
+        """Run the HTTP server (one daemon thread per request)"""
         try:
-            with socketserver.TCPServer(("", self.port), handler) as httpd:
+            with http.server.ThreadingHTTPServer(("", self.port), handler) as httpd:
+                # Publish the bound port before the server: callers poll server, then read port
+                self.port = httpd.server_address[1]
                 self.server = httpd
                 print(f"✅ Server listening on port {self.port}")
-                while self.running:
-                    httpd.handle_request()
+                httpd.serve_forever(poll_interval=0.5)
         except Exception as e:
+            self.running = False
             print(f"❌ Server error: {e}")
             
     def _create_request_handler(self):
@@ -108,6 +154,8 @@ class WebGUIServer:
                     self._serve_scheduler_data()
                 elif parsed_path.path == '/api/security':
                     self._serve_security_data()
+                elif parsed_path.path == '/api/metrics':
+                    self._serve_all_metrics()
                 elif parsed_path.path.startswith('/static/'):
                     self._serve_static_file()
                 else:
@@ -216,22 +264,27 @@ class WebGUIServer:
                 
             def _serve_system_data(self):
                 """Serve system metrics as JSON"""
-                data = gui_server._get_system_metrics()
+                data = gui_server._get_cached_metrics("system", gui_server._get_system_metrics)
                 self._send_json_response(data)
                 
             def _serve_file_data(self):
                 """Serve file system data as JSON"""
-                data = gui_server._get_file_system_data()
+                data = gui_server._get_cached_metrics("files", gui_server._get_file_system_data)
                 self._send_json_response(data)
                 
             def _serve_scheduler_data(self):
                 """Serve AI scheduler data as JSON"""
-                data = gui_server._get_scheduler_data()
+                data = gui_server._get_cached_metrics("scheduler", gui_server._get_scheduler_data)
                 self._send_json_response(data)
                 
             def _serve_security_data(self):
                 """Serve security data as JSON"""
-                data = gui_server._get_security_data()
+                data = gui_server._get_cached_metrics("security", gui_server._get_security_data)
+                self._send_json_response(data)
+                
+            def _serve_all_metrics(self):
+                """Serve every dashboard section in a single JSON payload"""
+                data = gui_server._get_cached_metrics("all", gui_server._get_all_metrics)
                 self._send_json_response(data)
                 
             def _serve_static_file(self):
@@ -259,12 +312,22 @@ class WebGUIServer:
                 self.wfile.write(content.encode())
                 
             def _send_json_response(self, data, status_code=200):
-                """Send JSON response"""
+                """Send JSON response, gzip-compressed when the client accepts it"""
+                body = json.dumps(data).encode()
+                compress = (len(body) >= GZIP_MIN_SIZE and
+                            'gzip' in self.headers.get('Accept-Encoding', ''))
+                if compress:
+                    body = gzip.compress(body, compresslevel=1)
+                    
                 self.send_response(status_code)
                 self.send_header('Content-type', 'application/json')
                 self.send_header('Access-Control-Allow-Origin', '*')
+                self.send_header('Vary', 'Accept-Encoding')
+                if compress:
+                    self.send_header('Content-Encoding', 'gzip')
+                self.send_header('Content-Length', str(len(body)))
                 self.end_headers()
-                self.wfile.write(json.dumps(data).encode())
+                self.wfile.write(body)
                 
             def log_message(self, format, *args):
                 """Suppress default logging"""
@@ -4938,6 +5001,19 @@ document.addEventListener('visibilitychange', () => {
     }
 });'''
 
+    def _get_cached_metrics(self, key: str, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Get metrics through the shared TTL cache"""
+        return self.metrics_cache.get_or_compute(key, self.metrics_ttl, compute)
+        
+    def _get_all_metrics(self) -> Dict[str, Any]:
+        """Get all dashboard sections in one call"""
+        return {
+            "system": self._get_system_metrics(),
+            "files": self._get_file_system_data(),
+            "scheduler": self._get_scheduler_data(),
+            "security": self._get_security_data()
+        }
+        
     def _get_system_metrics(self) -> Dict[str, Any]:
         """Get current system metrics"""
         uptime = time.time() - self.start_time